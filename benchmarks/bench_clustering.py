@@ -0,0 +1,165 @@
+"""
+동일 상품 묶기 벤치마크 (services.clustering)
+판매처마다 제목이 조금씩 다른 가짜 검색 결과로 항목 수별 실행 시간을 측정해
+MinHash/LSH 방식이 거의 선형으로 늘어나는지 확인 (항목당 시간이 일정하면 선형)
+
+- lsh (numpy / pure python): cluster_items
+- pairwise: 모든 쌍의 Jaccard 비교 (O(n²), --pairwise-max 이하 크기만)
+- 묶기 정확도: 실제 상품 수 대비 묶인 상품 수
+
+Usage:
+    python benchmarks/bench_clustering.py
+    python benchmarks/bench_clustering.py --sizes 100 1000 5000 10000 --repeat 5
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import timeit
+from typing import Any, Dict, List
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import save_results, compare_results
+from services import clustering
+from services.clustering import ProductGroup, cluster_items
+from services.models import ShoppingItem
+
+
+BRANDS = ["삼성전자", "LG전자", "애플", "샤오미", "소니", "필립스", "다이슨", "로지텍", "레노버", "ASUS"]
+NOUNS = ["노트북", "무선 이어폰", "공기청정기", "모니터", "키보드", "청소기", "태블릿", "스마트워치", "헤드폰", "선풍기"]
+SPECS = ["128GB", "256GB", "512GB", "1TB", "15인치", "27인치", "2세대", "3세대"]
+PROMOS = ["[무료배송]", "[공식판매처]", "정품", "당일발송", "특가", "새상품", "국내정품", "(쿠폰)"]
+
+
+def make_items(count: int, listings_per_product: int = 5, seed: int = 42):
+    """
+    상품 하나당 평균 listings_per_product개 판매 목록 (단어 순서 / 홍보 문구가 다른 제목)
+
+    Returns:
+        (아이템 목록, 아이템별 실제 상품 번호)
+    """
+    rng = random.Random(seed)
+    products = []
+    for index in range(max(count // listings_per_product, 1)):
+        words = [rng.choice(BRANDS), rng.choice(NOUNS), f"M{index:05d}", rng.choice(SPECS)]
+        products.append((words, rng.randint(10000, 2000000)))
+
+    items, labels = [], []
+    for index in range(count):
+        label = rng.randrange(len(products))
+        words, price = products[label]
+        title = list(words)
+        if rng.random() < 0.5:
+            title.insert(rng.randrange(len(title) + 1), rng.choice(PROMOS))
+        if rng.random() < 0.3:
+            title.append(rng.choice(PROMOS))
+        items.append(ShoppingItem(
+            title=" ".join(title),
+            link=f"https://smartstore.naver.com/{index}",
+            lprice=int(price * rng.uniform(0.9, 1.2)),
+            mall_name=f"몰{rng.randrange(200)}",
+            product_id=str(1000000 + index),
+            product_type=2
+        ))
+        labels.append(label)
+    return items, labels
+
+
+def pairwise_clusters(items: List[ShoppingItem], threshold: float) -> int:
+    """비교용: 모든 쌍의 shingle Jaccard 비교 후 묶인 그룹 수"""
+    shingles = [clustering._shingles(clustering.title_tokens(item.title)) for item in items]
+    parent = list(range(len(items)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(len(items)):
+        for j in range(i + 1, len(items)):
+            if clustering._jaccard(shingles[i], shingles[j]) >= threshold:
+                parent[find(j)] = find(i)
+    return len({find(i) for i in range(len(items))})
+
+
+def accuracy(labels: List[int], grouped: List[ShoppingItem]) -> Dict[str, int]:
+    """실제 상품 수와 묶인 상품 수 (같을수록 정확, 모델명 토큰이 달라 서로 다른 상품끼리는 묶이지 않음)"""
+    return {
+        "products": len(set(labels)),
+        "groups": len(grouped),
+        "grouped_listings": sum(entry.offers for entry in grouped if isinstance(entry, ProductGroup)),
+    }
+
+
+def bench(func, repeat: int):
+    timings = timeit.repeat(func, number=1, repeat=repeat)
+    return min(timings) * 1000, statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000, 2000, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.6)
+    parser.add_argument("--pairwise-max", type=int, default=2000, help="전체 쌍 비교를 실행할 최대 항목 수")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    numpy_module = clustering.np
+    print(f"numpy: {'사용' if numpy_module is not None else '미설치'}")
+    print(f"{'items':>8} | {'method':<20} | {'min ms':>9} | {'median ms':>9} | {'us/item':>8} | {'groups':>7}")
+    print("-" * 76)
+
+    results: Dict[str, Any] = {}
+    for size in args.sizes:
+        items, labels = make_items(size)
+        methods = []
+        if numpy_module is not None:
+            methods.append(("lsh_numpy", numpy_module))
+        methods.append(("lsh_python", None))
+
+        for label, module in methods:
+            clustering.np = module
+            best, median = bench(lambda: cluster_items(items, threshold=args.threshold), args.repeat)
+            grouped = cluster_items(items, threshold=args.threshold)
+            clustering.np = numpy_module
+            results[f"{label}_{size}"] = {
+                "items": size,
+                "min_ms": round(best, 3),
+                "median_ms": round(median, 3),
+                "us_per_item": round(best * 1000 / size, 2),
+                **accuracy(labels, grouped),
+            }
+            print(
+                f"{size:>8} | {label:<20} | {best:>9.2f} | {median:>9.2f} | "
+                f"{best * 1000 / size:>8.2f} | {len(grouped):>7}"
+            )
+
+        if size <= args.pairwise_max:
+            best, median = bench(lambda: pairwise_clusters(items, args.threshold), 1)
+            groups = pairwise_clusters(items, args.threshold)
+            results[f"pairwise_{size}"] = {
+                "items": size,
+                "min_ms": round(best, 3),
+                "median_ms": round(median, 3),
+                "us_per_item": round(best * 1000 / size, 2),
+                "groups": groups,
+            }
+            print(f"{size:>8} | {'pairwise (O(n²))':<20} | {best:>9.2f} | {median:>9.2f} | {best * 1000 / size:>8.2f} | {groups:>7}")
+        print(f"{'':>8}   실제 상품 수: {len(set(labels))}")
+
+    path = save_results("bench_clustering", results, args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        compare_results(results, args.compare, ["min_ms", "median_ms", "us_per_item"])
+
+
+if __name__ == "__main__":
+    main()
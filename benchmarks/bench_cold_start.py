@@ -0,0 +1,169 @@
+"""
+콜드 스타트 벤치마크 (LAZY_BOOT on/off)
+서버 프로세스를 새로 띄워 다음을 측정 (회귀 추적용, --compare로 이전 결과와 비교)
+
+- 프로세스 시작 → 포트 열림 (첫 TCP 연결 성공)
+- 프로세스 시작 → /ready 200
+- 포트가 열리자마자 보낸 첫 툴 호출이 끝난 시각 (스케일 투 제로 후 첫 요청 시나리오)
+- 서버 부팅 보고서의 단계별 시간 (BOOT_PROFILE_PATH), --profile-imports면 느린 import 모듈 목록
+
+Usage:
+    python benchmarks/bench_cold_start.py
+    python benchmarks/bench_cold_start.py --runs 5 --profile-imports
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import save_results, compare_results
+from load_test import free_port, wait_for_port, start_mock, start_server
+
+
+MODES = {
+    "eager": {"LAZY_BOOT": "false"},
+    "lazy": {"LAZY_BOOT": "true"},
+}
+
+
+async def wait_ready(port: int, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"http://127.0.0.1:{port}/ready", timeout=1.0)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.005)
+    raise RuntimeError("ready 대기 시간 초과")
+
+
+async def first_call(port: int) -> None:
+    async with sse_client(f"http://127.0.0.1:{port}/sse", timeout=30) as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            result = await session.call_tool("search_naver_shopping", {"keyword": "콜드 스타트"})
+            if result.isError:
+                raise RuntimeError("툴 호출 실패")
+
+
+async def boot_once(env: Dict[str, str], mock_port: int) -> Dict[str, Any]:
+    port = free_port()
+    workdir = tempfile.mkdtemp(prefix="shopcatch-boot-")
+    report_path = os.path.join(workdir, "boot.json")
+    env = {
+        **env,
+        "BOOT_PROFILE_PATH": report_path,
+        "CACHE_SNAPSHOT_PATH": "",
+        "NAVER_WARMUP_CONNECTIONS": "1",
+    }
+
+    started = time.perf_counter()
+    server = start_server(port, mock_port, env, workdir)
+    try:
+        await wait_for_port(port, timeout=60)
+        listening_ms = (time.perf_counter() - started) * 1000
+
+        async def timed(coroutine) -> float:
+            await coroutine
+            return (time.perf_counter() - started) * 1000
+
+        ready_ms, first_call_ms = await asyncio.gather(timed(wait_ready(port)), timed(first_call(port)))
+
+        report: Dict[str, Any] = {}
+        for _ in range(100):
+            if os.path.exists(report_path):
+                with open(report_path, encoding="utf-8") as source:
+                    report = json.load(source)
+                break
+            await asyncio.sleep(0.05)
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    return {
+        "listening_ms": listening_ms,
+        "ready_ms": ready_ms,
+        "first_call_ms": first_call_ms,
+        "report": report,
+    }
+
+
+def _median(samples: List[Dict[str, Any]], key: str) -> float:
+    return round(statistics.median(sample[key] for sample in samples), 1)
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    mock_port = free_port()
+    mock = start_mock(mock_port, {"latency-ms": 50})
+    results: Dict[str, Any] = {}
+    try:
+        await wait_for_port(mock_port)
+        for name in args.modes:
+            samples = [await boot_once(MODES[name], mock_port) for _ in range(args.runs)]
+            phases = {}
+            for phase in samples[-1]["report"].get("phases_ms", {}):
+                values = [sample["report"]["phases_ms"][phase] for sample in samples if phase in sample["report"].get("phases_ms", {})]
+                phases[phase] = round(statistics.median(values), 1)
+            results[name] = {
+                "runs": args.runs,
+                "listening_ms": _median(samples, "listening_ms"),
+                "ready_ms": _median(samples, "ready_ms"),
+                "first_call_ms": _median(samples, "first_call_ms"),
+                "phases_ms": phases,
+            }
+            row = results[name]
+            print(
+                f"▶ {name:<6} | 포트 열림 {row['listening_ms']:>7.1f}ms | ready {row['ready_ms']:>7.1f}ms | "
+                f"첫 호출 완료 {row['first_call_ms']:>7.1f}ms"
+            )
+            print(f"         단계 (프로세스 시작 기준): {phases}")
+
+        if args.profile_imports:
+            sample = await boot_once({**MODES[args.modes[-1]], "BOOT_PROFILE": "true"}, mock_port)
+            slowest = sample["report"].get("slowest_imports", [])
+            results["slowest_imports"] = slowest
+            print("\n느린 import (누적 ms / 자기 시간 ms):")
+            for entry in slowest:
+                print(f"  {entry['module']:<45} {entry['cumulative_ms']:>8.1f} {entry['self_ms']:>8.1f}")
+    finally:
+        mock.terminate()
+        mock.wait(timeout=10)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--runs", type=int, default=3, help="모드별 부팅 횟수 (중앙값 사용)")
+    parser.add_argument("--profile-imports", action="store_true", help="BOOT_PROFILE로 한 번 더 부팅해 모듈별 import 시간 출력")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+    path = save_results("bench_cold_start", results, args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        compare_results(results, args.compare, ["listening_ms", "ready_ms", "first_call_ms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+포매터 마이크로 벤치마크
+format_shopping_results(출력 형식별), clean_html, 응답 디코딩 처리 시간
+
+Usage:
+    python benchmarks/bench_formatter.py
+    python benchmarks/bench_formatter.py --items 5 100 --compare benchmarks/results/formatter-20240101-000000.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common import save_results, compare_results
+from services.models import decode_search_response
+from services.formatter import OUTPUT_MODES, clean_html, format_shopping_results
+
+
+def make_payload(count: int) -> bytes:
+    """실제 API와 같은 필드 구성의 응답 본문"""
+    items = [
+        {
+            "title": f"<b>무선</b> <b>이어폰</b> 노이즈캔슬링 블루투스 5.3 모델 {i}",
+            "link": f"https://search.shopping.naver.com/catalog/{40000000 + i}",
+            "image": f"https://shopping-phinf.pstatic.net/main_{i}/{i}.jpg",
+            "lprice": str(20000 + i * 137),
+            "hprice": "",
+            "mallName": f"판매처{i % 20}",
+            "productId": str(40000000 + i),
+            "productType": "1" if i % 3 == 0 else "2",
+            "brand": "브랜드" if i % 2 else "",
+            "maker": "제조사",
+            "category1": "디지털/가전",
+            "category2": "음향가전",
+            "category3": "이어폰",
+            "category4": "블루투스이어폰",
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"total": count, "start": 1, "display": count, "items": items}, ensure_ascii=False).encode()
+
+
+def measure(func, repeat: int, number: int) -> dict:
+    timings = [t / number * 1e6 for t in timeit.repeat(func, number=number, repeat=repeat)]
+    return {"best_us": round(min(timings), 3), "median_us": round(statistics.median(timings), 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[5, 100])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    results = {}
+    title = "<b>삼성전자</b> 갤럭시 버즈3 프로 <b>무선</b> 이어폰 SM-R630"
+    results["clean_html"] = measure(lambda: clean_html(title), args.repeat, args.number * 50)
+
+    for count in args.items:
+        payload = make_payload(count)
+        items = decode_search_response(payload)
+        results[f"decode/{count}"] = measure(lambda: decode_search_response(payload), args.repeat, args.number)
+        for mode in OUTPUT_MODES:
+            results[f"format_{mode}/{count}"] = measure(
+                lambda: format_shopping_results(items, "무선 이어폰", mode=mode), args.repeat, args.number
+            )
+        results[f"format_rich_budget/{count}"] = measure(
+            lambda: format_shopping_results(items, "무선 이어폰", max_chars=1500), args.repeat, args.number
+        )
+
+    print(f"{'case':<28} | {'best µs':>10} | {'median µs':>10}")
+    print("-" * 54)
+    for case, timing in results.items():
+        print(f"{case:<28} | {timing['best_us']:>10.2f} | {timing['median_us']:>10.2f}")
+
+    path = save_results("formatter", results, args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        compare_results(results, args.compare, ["best_us", "median_us"])
+
+
+if __name__ == "__main__":
+    main()
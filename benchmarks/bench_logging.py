@@ -0,0 +1,126 @@
+"""
+로깅 이벤트 루프 지연 벤치마크
+느린 출력 스트림(파이프 backpressure 모사)에서 동기 StreamHandler와
+큐 기반 비동기 핸들러(LOG_ASYNC)의 이벤트 루프 정지 시간 비교
+
+Usage:
+    python benchmarks/bench_logging.py
+    python benchmarks/bench_logging.py --write-delay-ms 0.5 --duration 5
+    python benchmarks/bench_logging.py --compare benchmarks/results/logging-20240101-000000.json
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common import percentile, save_results, compare_results
+from utils.logger import DroppingQueueHandler, create_handler
+
+
+class SlowStream:
+    """write 1회마다 지정 시간만큼 블로킹하는 출력 스트림"""
+
+    def __init__(self, delay_sec: float):
+        self.delay_sec = delay_sec
+        self.writes = 0
+
+    def write(self, data: str) -> int:
+        time.sleep(self.delay_sec)
+        self.writes += 1
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+async def monitor_loop(stop_at: float, interval: float, lags: List[float]) -> None:
+    """interval 간격으로 깨어나며 예정 시각 대비 지연 기록"""
+    while time.monotonic() < stop_at:
+        expected = time.monotonic() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(time.monotonic() - expected, 0.0) * 1000)
+
+
+async def worker(logger: logging.Logger, stop_at: float, counter: List[int]) -> None:
+    """툴 호출 1회당 로그 3건 (시작/업스트림/완료)과 비슷한 패턴"""
+    while time.monotonic() < stop_at:
+        logger.info("툴 실행: search_naver_shopping(keyword=%s, sort=%s)", "무선 이어폰", "sim")
+        logger.info("네이버 쇼핑 검색 시작: %s (정렬: %s, 시작: %s)", "무선 이어폰", "sim", 1)
+        logger.info(
+            "Tool executed: %s", "search_naver_shopping",
+            extra={"tool": "search_naver_shopping", "params": {"keyword": "무선 이어폰"}, "duration_ms": 12.3}
+        )
+        counter[0] += 3
+        await asyncio.sleep(0.001)
+
+
+async def run_mode(mode: str, args) -> Dict[str, Any]:
+    stream = SlowStream(args.write_delay_ms / 1000)
+    handler = create_handler(
+        stream=stream, log_format="json", async_mode=(mode == "async"), queue_size=args.queue_size
+    )
+    logger = logging.getLogger(f"bench.logging.{mode}")
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    lags: List[float] = []
+    counter = [0]
+    stop_at = time.monotonic() + args.duration
+    await asyncio.gather(
+        monitor_loop(stop_at, args.interval_ms / 1000, lags),
+        *(worker(logger, stop_at, counter) for _ in range(args.workers))
+    )
+
+    result = {"records": counter[0], "written": stream.writes}
+    if isinstance(handler, DroppingQueueHandler):
+        result.update(dropped=handler.dropped, sampled_out=handler.sampled_out)
+        handler.listener.stop()
+
+    lags.sort()
+    result.update({
+        "loop_lag_p50_ms": round(percentile(lags, 50), 3),
+        "loop_lag_p99_ms": round(percentile(lags, 99), 3),
+        "loop_lag_max_ms": round(lags[-1], 3) if lags else 0.0,
+        "loop_stall_total_ms": round(sum(lags), 1),
+    })
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=3.0, help="모드별 측정 시간 (초)")
+    parser.add_argument("--workers", type=int, default=50, help="동시 로깅 코루틴 수")
+    parser.add_argument("--write-delay-ms", type=float, default=0.2, help="출력 1회당 블로킹 시간")
+    parser.add_argument("--interval-ms", type=float, default=5.0, help="루프 지연 측정 간격")
+    parser.add_argument("--queue-size", type=int, default=10000)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for mode in ("sync", "async"):
+        results[mode] = asyncio.run(run_mode(mode, args))
+        r = results[mode]
+        print(
+            f"{mode:<6} | records {r['records']:>8} | written {r['written']:>8} | "
+            f"dropped {r.get('dropped', 0) + r.get('sampled_out', 0):>7} | lag p50 {r['loop_lag_p50_ms']:.2f}ms "
+            f"p99 {r['loop_lag_p99_ms']:.2f}ms max {r['loop_lag_max_ms']:.2f}ms | "
+            f"stall {r['loop_stall_total_ms']:.0f}ms"
+        )
+
+    path = save_results("logging", results, args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        compare_results(results, args.compare, ["loop_lag_p99_ms", "loop_lag_max_ms", "loop_stall_total_ms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+가격 통계 마이크로 벤치마크
+열 지향 분석(services.price_stats) vs 기존 방식(아이템 dict 순회)
+
+Usage:
+    python benchmarks/bench_price_stats.py
+    python benchmarks/bench_price_stats.py --sizes 100 1000 10000 --repeat 20
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import timeit
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import price_stats
+from services.models import ShoppingItem
+from services.price_stats import analyze_prices
+
+
+def make_items(count: int, seed: int = 42):
+    """본품 80% + 저가 액세서리 20% 구성의 가짜 검색 결과"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        accessory = rng.random() < 0.2
+        items.append({
+            "title": f"<b>상품</b> {i}",
+            "link": f"https://search.shopping.naver.com/catalog/{i}",
+            "lprice": str(rng.randint(5000, 30000) if accessory else rng.randint(900000, 1400000)),
+            "hprice": "",
+            "mallName": f"몰{i % 50}",
+            "productId": str(i),
+            "category1": "디지털/가전",
+            "category2": "휴대폰",
+            "category3": "휴대폰 케이스" if accessory else "스마트폰",
+        })
+    return items
+
+
+def dict_loop_stats(items, top_k=20, iqr_k=1.5, bins=8):
+    """
+    기존 방식: formatter처럼 아이템 dict를 하나씩 순회하며 같은 분석 수행
+    (카테고리 필터 + IQR 이상치 제거 + 백분위수 + 히스토그램)
+    """
+    def category(item):
+        return ">".join(item.get(f"category{level}", "") for level in (1, 2, 3))
+
+    head = [category(item) for item in items[:top_k]]
+    dominant = max(set(head), key=head.count)
+
+    candidates = []
+    for item in items:
+        try:
+            price = int(item.get("lprice", "0"))
+        except (ValueError, TypeError):
+            continue
+        if price > 0 and category(item) == dominant:
+            candidates.append((price, item))
+
+    sorted_prices = sorted(price for price, _ in candidates)
+    q1, _, q3 = statistics.quantiles(sorted_prices, n=4, method="inclusive")
+    low, high = q1 - iqr_k * (q3 - q1), q3 + iqr_k * (q3 - q1)
+    kept = [(price, item) for price, item in candidates if low <= price <= high]
+
+    prices = sorted(price for price, _ in kept)
+    width = (prices[-1] - prices[0]) / bins or 1
+    histogram = [0] * bins
+    for price in prices:
+        histogram[min(int((price - prices[0]) / width), bins - 1)] += 1
+
+    return {
+        "min": prices[0],
+        "max": prices[-1],
+        "percentiles": statistics.quantiles(prices, n=10, method="inclusive"),
+        "histogram": histogram,
+        "cheapest_item": min(kept, key=lambda entry: entry[0])[1],
+    }
+
+
+def bench(label, func, repeat):
+    timings = timeit.repeat(func, number=1, repeat=repeat)
+    return label, min(timings) * 1000, statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    numpy_module = price_stats.np
+    print(f"numpy: {'사용' if numpy_module is not None else '미설치'}")
+    print(f"{'items':>8} | {'method':<28} | {'min ms':>9} | {'median ms':>9}")
+    print("-" * 64)
+
+    for size in args.sizes:
+        items = make_items(size)
+        records = [ShoppingItem.from_api(item) for item in items]
+        rows = [bench("dict loop (기존)", lambda: dict_loop_stats(items), args.repeat)]
+
+        price_stats.np = None
+        rows.append(bench("columnar (pure python)", lambda: analyze_prices(records), args.repeat))
+        price_stats.np = numpy_module
+
+        if numpy_module is not None:
+            rows.append(bench("columnar (numpy)", lambda: analyze_prices(records), args.repeat))
+
+        for label, best, median in rows:
+            print(f"{size:>8} | {label:<28} | {best:>9.3f} | {median:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+응답 캐시 스냅샷 벤치마크 (services.cache_snapshot)
+N개 엔트리 스냅샷으로 서버를 띄워 다음을 스냅샷 없는 경우와 비교
+
+- 스냅샷 저장 / 읽기+복원 시간, 파일 크기 (프로세스 내 측정)
+- 부팅 → /ready 200까지 걸린 시간
+- 첫 툴 호출 지연 (스냅샷에 있는 키워드, 모의 네이버 API 지연 포함 여부로 캐시 적중 확인)
+
+Usage:
+    python benchmarks/bench_snapshot.py
+    python benchmarks/bench_snapshot.py --entries 10000 --items 10 --runs 3
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import save_results, compare_results
+from load_test import free_port, wait_for_port, start_mock, start_server
+from config import settings
+from services.cache import SearchCache
+from services.cache_snapshot import CacheSnapshot
+from services.models import ShoppingItem
+from services.naver_api import _estimate_size
+
+
+def make_entries(count: int, items_per_entry: int, seed: int = 42):
+    """키워드별 검색 결과 (서버 기본 display / sort 기준 캐시 키)"""
+    rng = random.Random(seed)
+    entries = []
+    for index in range(count):
+        keyword = f"스냅샷 상품 {index}"
+        items = [
+            ShoppingItem(
+                title=f"{keyword} 모의상품 {rank} " + "가" * 20,
+                link=f"https://search.shopping.naver.com/catalog/{index * 100 + rank}",
+                lprice=rng.randint(10000, 2000000),
+                mall_name=f"몰{rank}",
+                product_id=str(index * 100 + rank),
+                product_type=1,
+                category1="디지털/가전"
+            )
+            for rank in range(items_per_entry)
+        ]
+        key = SearchCache.make_key(keyword, "sim", min(settings.NAVER_MAX_RESULTS, 100))
+        entries.append((key, items, settings.CACHE_TTL, settings.CACHE_TTL + settings.CACHE_STALE_TTL))
+    return entries
+
+
+def bench_in_process(path: str, entries, runs: int) -> Dict[str, Any]:
+    snapshot = CacheSnapshot(path)
+    save_ms, load_ms, restore_ms = [], [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        snapshot.save(entries)
+        save_ms.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        loaded = CacheSnapshot(path).load()
+        load_ms.append((time.perf_counter() - started) * 1000)
+
+        cache = SearchCache(max_entries=len(entries), max_bytes=1 << 40, ttl=settings.CACHE_TTL)
+        started = time.perf_counter()
+        for key, items, fresh_for, stale_for in reversed(loaded):
+            cache.set(key, items, _estimate_size(items), ttl=fresh_for, stale_ttl=stale_for - fresh_for)
+        restore_ms.append((time.perf_counter() - started) * 1000)
+    return {
+        "entries": len(entries),
+        "file_kb": round(os.path.getsize(path) / 1024, 1),
+        "save_ms": round(statistics.median(save_ms), 2),
+        "load_ms": round(statistics.median(load_ms), 2),
+        "restore_ms": round(statistics.median(restore_ms), 2),
+    }
+
+
+async def wait_ready(port: int, started: float, timeout: float = 60.0) -> float:
+    """/ready가 200을 반환할 때까지 대기 후 부팅 시작부터 걸린 시간 (ms)"""
+    async with httpx.AsyncClient() as client:
+        while time.perf_counter() - started < timeout:
+            try:
+                response = await client.get(f"http://127.0.0.1:{port}/ready", timeout=1.0)
+                if response.status_code == 200:
+                    return (time.perf_counter() - started) * 1000
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.01)
+    raise RuntimeError("ready 대기 시간 초과")
+
+
+async def first_call_ms(port: int, keyword: str) -> float:
+    async with sse_client(f"http://127.0.0.1:{port}/sse") as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            started = time.perf_counter()
+            await session.call_tool("search_naver_shopping", {"keyword": keyword, "group_similar": False})
+            return (time.perf_counter() - started) * 1000
+
+
+async def boot_once(snapshot_path: Optional[str], entries: int, mock_port: int) -> Dict[str, float]:
+    server_port = free_port()
+    workdir = tempfile.mkdtemp(prefix="shopcatch-snapshot-")
+    env = {
+        "CACHE_SNAPSHOT_PATH": snapshot_path or "",
+        "CACHE_MAX_ENTRIES": str(max(entries, settings.CACHE_MAX_ENTRIES)),
+        "CACHE_MAX_BYTES": str(1 << 34),
+        "CACHE_SNAPSHOT_INTERVAL": "0",
+        "NAVER_WARMUP_CONNECTIONS": "0",
+    }
+    started = time.perf_counter()
+    server = start_server(server_port, mock_port, env, workdir)
+    try:
+        ready_ms = await wait_ready(server_port, started)
+        call_ms = await first_call_ms(server_port, "스냅샷 상품 0")
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+    return {"ready_ms": ready_ms, "first_call_ms": call_ms}
+
+
+async def bench_boot(path: str, entries: int, runs: int) -> Dict[str, Any]:
+    mock_port = free_port()
+    mock = start_mock(mock_port, {"latency-ms": 50})
+    results: Dict[str, Any] = {}
+    try:
+        await wait_for_port(mock_port)
+        for label, snapshot_path in (("cold", None), ("snapshot", path)):
+            samples = [await boot_once(snapshot_path, entries, mock_port) for _ in range(runs)]
+            results[label] = {
+                "ready_ms": round(statistics.median(sample["ready_ms"] for sample in samples), 1),
+                "first_call_ms": round(statistics.median(sample["first_call_ms"] for sample in samples), 1),
+            }
+    finally:
+        mock.terminate()
+        mock.wait(timeout=10)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=10000, help="스냅샷 엔트리 수")
+    parser.add_argument("--items", type=int, default=settings.NAVER_MAX_RESULTS, help="엔트리당 상품 수")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--skip-boot", action="store_true", help="서버 부팅 측정 생략 (프로세스 내 측정만)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="shopcatch-snapshot-"), "cache_snapshot.db")
+    entries = make_entries(args.entries, args.items)
+
+    results: Dict[str, Any] = {"in_process": bench_in_process(path, entries, args.runs)}
+    row = results["in_process"]
+    print(
+        f"▶ 스냅샷 {row['entries']}개 ({row['file_kb']}KB) | 저장 {row['save_ms']}ms | "
+        f"읽기 {row['load_ms']}ms | 캐시 복원 {row['restore_ms']}ms"
+    )
+
+    if not args.skip_boot:
+        results.update(asyncio.run(bench_boot(path, args.entries, args.runs)))
+        for label in ("cold", "snapshot"):
+            print(f"▶ {label:<8} | 부팅 → ready {results[label]['ready_ms']}ms | 첫 호출 {results[label]['first_call_ms']}ms")
+
+    output = save_results("bench_snapshot", results, args.output)
+    print(f"\n💾 결과 저장: {output}")
+
+    if args.compare:
+        compare_results(results, args.compare, ["save_ms", "load_ms", "restore_ms", "ready_ms", "first_call_ms"])
+
+
+if __name__ == "__main__":
+    main()
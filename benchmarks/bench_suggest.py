@@ -0,0 +1,173 @@
+"""
+검색어 추천 색인 벤치마크 (services.suggest)
+한글 / 영문 단어와 2단어 구로 만든 가짜 단어 N개(기본 100만 개)를 색인해 다음을 측정
+
+- 색인 구성 시간, 상주 메모리 증가량 (RSS)
+- 자동 완성 지연 (길이 1~6자 접두어, 1~2자 짧은 접두어는 첫 조회 / 캐시 적중 구분)
+- 오타 교정 지연과 정확도 (한글 모음 하나 / 영문 글자 하나를 바꾼 검색어로 원래 단어를 찾는 비율)
+- 새 단어 merge_batch개 반영 시간 (최근 추가분 배열만 정렬) / 본 배열 합치기 시간 (반영 스레드가 잡는 최대 시간)
+
+Usage:
+    python benchmarks/bench_suggest.py
+    python benchmarks/bench_suggest.py --terms 200000 --queries 5000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import save_results, compare_results, latency_summary, process_rss_mb
+from services.suggest import SuggestIndex
+
+
+SYLLABLES = (
+    "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호"
+    "구누두루무부수우주추쿠투푸후그느드르므브스으즈츠크트프흐기니디리미비시이지치키티피히"
+    "갤럭시폰북탭워치버즈프로맥스울트라노트패드청소기냉장고세탁건조에어컨선풍밥솥커피머신"
+)
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def make_terms(count: int, seed: int = 42) -> Dict[str, float]:
+    """한글 단어 60% / 영문 단어 20% / 2단어 구 20%, 가중치는 긴 꼬리 분포"""
+    rng = random.Random(seed)
+
+    def word() -> str:
+        if rng.random() < 0.75:
+            return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        return "".join(rng.choice(LETTERS) for _ in range(rng.randint(3, 9)))
+
+    terms: Dict[str, float] = {}
+    while len(terms) < count:
+        term = f"{word()} {word()}" if rng.random() < 0.2 else word()
+        terms[term] = round(rng.paretovariate(1.2), 2)
+    return terms
+
+
+def make_typo(term: str, rng: random.Random) -> str:
+    """한글은 음절 하나의 모음을 이웃 모음으로, 영문은 글자 하나를 다른 글자로"""
+    positions = [index for index, char in enumerate(term) if char != " "]
+    index = rng.choice(positions)
+    char = term[index]
+    code = ord(char) - 0xAC00
+    if 0 <= code < 11172:
+        vowel = code % 588 // 28
+        vowel = vowel + 1 if vowel < 20 else vowel - 1
+        replaced = chr(0xAC00 + code // 588 * 588 + vowel * 28 + code % 28)
+    else:
+        replaced = rng.choice([letter for letter in LETTERS if letter != char])
+    return term[:index] + replaced + term[index + 1:]
+
+
+def timed_ms(function, *args) -> float:
+    started = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - started) * 1000
+
+
+def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    rng = random.Random(7)
+    terms = make_terms(args.terms)
+    rss_before = process_rss_mb(os.getpid())
+
+    index = SuggestIndex(
+        max_terms=args.terms * 2, merge_batch=args.merge_batch, merge_interval=60, queue_size=1
+    )
+    started = time.perf_counter()
+    index.add_terms(terms)
+    index.flush()
+    build_sec = time.perf_counter() - started
+    rss_after = process_rss_mb(os.getpid())
+
+    words = list(terms)
+    sample = [rng.choice(words) for _ in range(args.queries)]
+
+    # 자동 완성 (짧은 접두어는 첫 조회에 범위 전체를 보고 이후 캐시 사용)
+    short_cold, short_warm, prefix = [], [], []
+    for term in sample:
+        length = rng.randint(1, min(6, len(term)))
+        elapsed = timed_ms(index.complete, term[:length], 10)
+        if length <= 2:
+            short_cold.append(elapsed)
+            short_warm.append(timed_ms(index.complete, term[:length], 10))
+        else:
+            prefix.append(elapsed)
+
+    # 오타 교정 (교정 대상: 길이 제한에 걸리지 않는 단어)
+    correctable = [term for term in sample if len(term.replace(" ", "")) >= 3][:args.queries]
+    correction, hits = [], 0
+    for term in correctable:
+        typo = make_typo(term, rng)
+        started = time.perf_counter()
+        suggestions = index.did_you_mean(typo)
+        correction.append((time.perf_counter() - started) * 1000)
+        hits += term in suggestions or typo in terms
+
+    # 새 단어 반영: 대부분은 최근 추가분 배열만 정렬, 최근 추가분이 커지면 본 배열과 합침 (최대 지연)
+    def add_batch(batch_terms: Dict[str, float]) -> None:
+        index.add_terms(batch_terms)
+        index.flush()
+
+    indexed = len(index)
+    merges, fuse_ms = [], None
+    for batch in range(1, 1000):
+        merges.append(timed_ms(add_batch, make_terms(args.merge_batch, seed=1000 + batch)))
+        if index.stats()["recent_terms"] == 0:
+            fuse_ms = merges.pop()
+            break
+
+    return {
+        "build": {
+            "terms": indexed,
+            "build_sec": round(build_sec, 2),
+            "rss_mb": round(rss_after - rss_before, 1) if rss_before and rss_after else None,
+        },
+        "complete_prefix": latency_summary(prefix),
+        "complete_short_cold": latency_summary(short_cold),
+        "complete_short_warm": latency_summary(short_warm),
+        "did_you_mean": {**latency_summary(correction), "accuracy": round(hits / max(len(correctable), 1), 3)},
+        "merge": {
+            "batch_ms": round(sum(merges) / len(merges), 2) if merges else None,
+            "fuse_ms": round(fuse_ms, 2) if fuse_ms is not None else None,
+            "batches_until_fuse": len(merges) + 1,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--terms", type=int, default=1_000_000, help="색인할 단어 수")
+    parser.add_argument("--queries", type=int, default=2000, help="측정할 조회 수")
+    parser.add_argument("--merge-batch", type=int, default=2000, help="새 단어 반영 단위 (SUGGEST_MERGE_BATCH)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    results = bench(args)
+    build = results["build"]
+    print(f"▶ 단어 {build['terms']:,}개 | 색인 구성 {build['build_sec']}s | 메모리 +{build['rss_mb']}MB")
+    for name in ("complete_prefix", "complete_short_cold", "complete_short_warm", "did_you_mean"):
+        row = results[name]
+        print(f"▶ {name:<20} | p50 {row['p50_ms']:.3f}ms | p99 {row['p99_ms']:.3f}ms | max {row['max_ms']:.3f}ms")
+    print(f"▶ 오타 교정 정확도 {results['did_you_mean']['accuracy']:.1%}")
+    merge = results["merge"]
+    print(
+        f"▶ 새 단어 {args.merge_batch}개 반영 평균 {merge['batch_ms']}ms | "
+        f"본 배열 합치기 {merge['fuse_ms']}ms ({merge['batches_until_fuse']}번째 반영)"
+    )
+
+    path = save_results("bench_suggest", results, args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        compare_results(results, args.compare, ["build_sec", "rss_mb", "p50_ms", "p99_ms", "accuracy", "batch_ms", "fuse_ms"])
+
+
+if __name__ == "__main__":
+    main()
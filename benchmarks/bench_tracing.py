@@ -0,0 +1,268 @@
+"""
+요청 추적 / 샘플링 프로파일러 오버헤드 벤치마크
+같은 모의 네이버 API로 서버를 모드별로 띄워 호출당 서버 CPU 시간, 처리량, 지연을 비교
+(모드 순서를 바꿔 가며 반복, 중앙값 사용)
+
+- off: TRACING_ENABLED=false
+- tracing: 툴 호출 단계별 구간 기록 (기본값)
+- profiling: tracing + 측정 구간 동안 /admin/profile 샘플링 프로파일러 실행
+- 응답 캐시를 끄고 모의 API 지연을 짧게 두어 툴 처리 비용이 드러나도록 측정 (추적 비용이 가장 크게 보이는 조건)
+- 오버헤드는 호출당 서버 CPU 시간(/proc 기준) 증가율로 판단
+  (부하 클라이언트 / 모의 API와 코어를 나눠 쓰는 환경에서는 처리량보다 잡음이 훨씬 작음)
+- 프로세스 안에서 호출 1회분 추적 비용(trace 시작 + span N개 + 종료)도 따로 측정해
+  호출당 서버 CPU 시간 대비 비율(estimated_overhead_pct)로 환산
+
+Usage:
+    python benchmarks/bench_tracing.py
+    python benchmarks/bench_tracing.py --runs 5 --clients 20 --duration 10
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import save_results, compare_results, latency_summary
+from load_test import free_port, wait_for_port, start_mock, start_server, run_client
+
+
+ADMIN_TOKEN = "bench-admin"
+
+MODES = {
+    "off": {"TRACING_ENABLED": "false"},
+    "tracing": {"TRACING_ENABLED": "true"},
+    "profiling": {"TRACING_ENABLED": "true"},
+}
+
+# 툴 호출 1회에 기록되는 span 수 (search_naver_shopping 캐시 미스 기준)
+SPANS_PER_CALL = 10
+
+
+def process_cpu_seconds(pid: int) -> Optional[float]:
+    """프로세스 누적 CPU 시간 (user + system, Linux /proc 기준, 측정 불가 시 None)"""
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            fields = stat.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+async def cpu_during(pid: int, start_at: float, stop_at: float) -> Optional[float]:
+    """측정 구간 동안 사용한 CPU 시간 (초)"""
+    await asyncio.sleep(max(start_at - time.monotonic(), 0))
+    started = process_cpu_seconds(pid)
+    await asyncio.sleep(max(stop_at - time.monotonic(), 0))
+    ended = process_cpu_seconds(pid)
+    return ended - started if started is not None and ended is not None else None
+
+
+def bench_in_process(iterations: int) -> Dict[str, Any]:
+    """호출 1회분 추적 비용 (μs)"""
+    from utils.tracing import Tracer, span
+
+    tracer = Tracer(slowest=20, recent=100)
+    names = [f"phase_{index}" for index in range(SPANS_PER_CALL)]
+
+    def run(traced: bool) -> float:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            trace = token = None
+            if traced:
+                trace, token = tracer.begin("bench", {"keyword": "벤치마크"})
+            for name in names:
+                with span(name):
+                    pass
+            if traced:
+                tracer.end(trace, token, True)
+        return (time.perf_counter() - started) / iterations * 1e6
+
+    untraced_us = min(run(False) for _ in range(3))
+    traced_us = min(run(True) for _ in range(3))
+    return {
+        "spans_per_call": SPANS_PER_CALL,
+        "untraced_us": round(untraced_us, 2),
+        "traced_us": round(traced_us, 2),
+        "cost_per_call_us": round(traced_us - untraced_us, 2),
+    }
+
+
+async def profile_during(port: int, start_at: float, seconds: float) -> int:
+    """측정 구간 동안 샘플링 프로파일러 실행 → 샘플 수"""
+    await asyncio.sleep(max(start_at - time.monotonic(), 0))
+    async with httpx.AsyncClient(timeout=seconds + 30) as client:
+        response = await client.get(
+            f"http://127.0.0.1:{port}/admin/profile",
+            params={"seconds": seconds},
+            headers={"Authorization": f"Bearer {ADMIN_TOKEN}"}
+        )
+        response.raise_for_status()
+        return int(response.headers["x-profile-samples"])
+
+
+async def run_mode(name: str, mock_port: int, args: argparse.Namespace) -> Dict[str, Any]:
+    server_port = free_port()
+    workdir = tempfile.mkdtemp(prefix="shopcatch-tracing-")
+    env = {
+        **MODES[name],
+        "ADMIN_TOKEN": ADMIN_TOKEN,
+        "CACHE_ENABLED": "false",
+        "CACHE_SNAPSHOT_PATH": "",
+        "SUGGEST_ENABLED": "false",
+        "PRICE_WATCH_ENABLED": "false",
+    }
+    server = start_server(server_port, mock_port, env, workdir)
+    try:
+        await wait_for_port(server_port, timeout=60)
+        keywords = [f"추적 벤치마크 {index}" for index in range(500)]
+        latencies: List[float] = []
+        errors: Dict[str, int] = {}
+
+        now = time.monotonic()
+        measure_from, stop_at = now + args.warmup, now + args.warmup + args.duration
+        url = f"http://127.0.0.1:{server_port}/sse"
+        cpu = asyncio.ensure_future(cpu_during(server.pid, measure_from, stop_at))
+        jobs = [run_client(url, keywords, stop_at, measure_from, latencies, errors) for _ in range(args.clients)]
+        if name == "profiling":
+            jobs.append(profile_during(server_port, measure_from, args.duration))
+        outcomes = await asyncio.gather(*jobs, return_exceptions=True)
+        cpu_seconds = await cpu
+
+        slowest = None
+        if name != "off":
+            async with httpx.AsyncClient() as client:
+                response = await client.get(
+                    f"http://127.0.0.1:{server_port}/admin/traces",
+                    params={"limit": 0},
+                    headers={"Authorization": f"Bearer {ADMIN_TOKEN}"}
+                )
+                traces = response.json().get("slowest", [])
+                slowest = traces[0] if traces else None
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            errors[f"session_{type(outcome).__name__}"] = errors.get(f"session_{type(outcome).__name__}", 0) + 1
+    summary = latency_summary(latencies)
+    return {
+        "cpu_us_per_call": cpu_seconds / summary["count"] * 1e6 if cpu_seconds and summary["count"] else None,
+        "throughput_rps": summary["count"] / args.duration,
+        "p50_ms": summary["p50_ms"],
+        "p99_ms": summary["p99_ms"],
+        "errors": errors,
+        "profile_samples": outcomes[-1] if name == "profiling" and isinstance(outcomes[-1], int) else None,
+        "slowest": slowest,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    mock_port = free_port()
+    mock = start_mock(mock_port, {"latency-ms": args.upstream_ms})
+    runs: Dict[str, List[Dict[str, Any]]] = {name: [] for name in args.modes}
+    try:
+        await wait_for_port(mock_port)
+        for round_index in range(args.runs):
+            # 모드 순서를 돌려 가며 실행 (시간에 따른 성능 변화가 한 모드에 몰리지 않도록)
+            shift = round_index % len(args.modes)
+            for name in args.modes[shift:] + args.modes[:shift]:
+                runs[name].append(await run_mode(name, mock_port, args))
+    finally:
+        mock.terminate()
+        mock.wait(timeout=10)
+
+    results: Dict[str, Any] = {}
+    for name, samples in runs.items():
+        cpu = [sample["cpu_us_per_call"] for sample in samples if sample["cpu_us_per_call"] is not None]
+        results[name] = {
+            "runs": len(samples),
+            "cpu_us_per_call": round(statistics.median(cpu), 1) if cpu else None,
+            "throughput_rps": round(statistics.median(sample["throughput_rps"] for sample in samples), 2),
+            "p50_ms": round(statistics.median(sample["p50_ms"] for sample in samples), 3),
+            "p99_ms": round(statistics.median(sample["p99_ms"] for sample in samples), 3),
+            "errors": sum(sum(sample["errors"].values()) for sample in samples),
+        }
+        if name == "profiling":
+            results[name]["profile_samples"] = samples[-1]["profile_samples"]
+        if samples[-1]["slowest"]:
+            results[name]["slowest_phases_ms"] = {
+                phase: value["ms"] for phase, value in samples[-1]["slowest"]["phases"].items()
+            }
+
+    baseline = results.get("off")
+    for name, row in results.items():
+        if not baseline or name == "off":
+            continue
+        if baseline["cpu_us_per_call"] and row["cpu_us_per_call"]:
+            row["overhead_pct"] = round((row["cpu_us_per_call"] / baseline["cpu_us_per_call"] - 1) * 100, 2)
+        if baseline["throughput_rps"]:
+            row["throughput_delta_pct"] = round((row["throughput_rps"] / baseline["throughput_rps"] - 1) * 100, 2)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--runs", type=int, default=3, help="모드별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--clients", type=int, default=20, help="동시 MCP 세션 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="측정 전 워밍업 시간 (초)")
+    parser.add_argument("--upstream-ms", type=int, default=5, help="모의 API 응답 지연 (ms)")
+    parser.add_argument("--iterations", type=int, default=50000, help="프로세스 안 추적 비용 측정 반복 수")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    micro = bench_in_process(args.iterations)
+    print(
+        f"▶ 호출 1회 추적 비용 (span {micro['spans_per_call']}개): {micro['cost_per_call_us']}μs "
+        f"({micro['untraced_us']}μs → {micro['traced_us']}μs)"
+    )
+
+    results = asyncio.run(main_async(args))
+    for name, row in results.items():
+        overhead = ""
+        if "overhead_pct" in row:
+            overhead = f" | CPU {row['overhead_pct']:+.2f}%"
+        if "throughput_delta_pct" in row:
+            overhead += f" | 처리량 {row['throughput_delta_pct']:+.2f}%"
+        print(
+            f"▶ {name:<10} | 호출당 CPU {row['cpu_us_per_call']}μs | {row['throughput_rps']:>8.1f} req/s | "
+            f"p50 {row['p50_ms']:.2f}ms | p99 {row['p99_ms']:.2f}ms | errors {row['errors']}{overhead}"
+        )
+        if "slowest_phases_ms" in row:
+            print(f"             가장 느린 호출 단계 (ms): {row['slowest_phases_ms']}")
+
+    # 모드 간 차이가 측정 잡음보다 작을 때 참고: 추적 비용 / 추적 없는 호출당 서버 CPU 시간
+    baseline_cpu = results.get("off", {}).get("cpu_us_per_call")
+    if baseline_cpu:
+        micro["estimated_overhead_pct"] = round(micro["cost_per_call_us"] / baseline_cpu * 100, 3)
+        print(f"▶ 추정 추적 오버헤드: 호출당 CPU의 {micro['estimated_overhead_pct']}%")
+    results["in_process"] = micro
+
+    path = save_results("bench_tracing", results, args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        compare_results(
+            results, args.compare,
+            ["cpu_us_per_call", "throughput_rps", "p50_ms", "p99_ms", "overhead_pct", "cost_per_call_us", "estimated_overhead_pct"]
+        )
+
+
+if __name__ == "__main__":
+    main()
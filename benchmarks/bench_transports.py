@@ -0,0 +1,196 @@
+"""
+전송 방식 비교 벤치마크 (SSE vs 무상태 Streamable HTTP)
+같은 모의 네이버 API로 서버를 전송 방식별로 띄워 다음을 측정
+
+- 유휴 클라이언트 N개 연결 시 서버 측 TCP 연결 수 / 클라이언트당 메모리 증가량
+- 그중 일부 클라이언트가 툴을 반복 호출할 때 처리량, p50/p95/p99 지연
+
+Usage:
+    python benchmarks/bench_transports.py
+    python benchmarks/bench_transports.py --idle-clients 500 --clients 20 --duration 10
+"""
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import AsyncExitStack
+from typing import Any, Dict, List, Optional
+
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import latency_summary, process_rss_mb, save_results, compare_results
+from load_test import free_port, wait_for_port, start_mock, start_server
+
+
+TRANSPORTS = {
+    "sse": {"env": {"MCP_TRANSPORT": "sse"}, "path": "/sse"},
+    "streamable_http_stateless": {
+        "env": {"MCP_TRANSPORT": "streamable-http", "MCP_STATELESS_HTTP": "true", "MCP_JSON_RESPONSE": "true"},
+        "path": "/mcp"
+    },
+}
+
+
+def established_connections(port: int) -> Optional[int]:
+    """로컬 포트 기준 ESTABLISHED TCP 연결 수 (Linux /proc 기준, 측정 불가 시 None)"""
+    count = 0
+    found = False
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as rows:
+                next(rows)
+                for row in rows:
+                    fields = row.split()
+                    # 상태 01 = ESTABLISHED
+                    if fields[3] == "01" and int(fields[1].rsplit(":", 1)[1], 16) == port:
+                        count += 1
+            found = True
+        except OSError:
+            continue
+    return count if found else None
+
+
+async def open_session(stack: AsyncExitStack, transport: str, url: str) -> ClientSession:
+    if transport == "sse":
+        read_stream, write_stream = await stack.enter_async_context(sse_client(url))
+    else:
+        read_stream, write_stream, _ = await stack.enter_async_context(streamablehttp_client(url))
+    session = await stack.enter_async_context(ClientSession(read_stream, write_stream))
+    await session.initialize()
+    return session
+
+
+async def call_loop(
+    session: ClientSession,
+    keywords: List[str],
+    stop_at: float,
+    measure_from: float,
+    latencies: List[float],
+    errors: Dict[str, int]
+) -> None:
+    rng = random.Random()
+    while time.monotonic() < stop_at:
+        started = time.monotonic()
+        try:
+            result = await session.call_tool("search_naver_shopping", {"keyword": rng.choice(keywords)})
+            failed = result.isError
+        except Exception as e:
+            failed = True
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+        if started >= measure_from:
+            latencies.append((time.monotonic() - started) * 1000)
+            if failed:
+                errors["tool_error"] = errors.get("tool_error", 0) + 1
+
+
+async def run_transport(name: str, idle_clients: int, clients: int, duration: float, warmup: float) -> Dict[str, Any]:
+    spec = TRANSPORTS[name]
+    mock_port, server_port = free_port(), free_port()
+    workdir = tempfile.mkdtemp(prefix="shopcatch-transport-")
+    mock = start_mock(mock_port, {"latency-ms": 50})
+    server = start_server(server_port, mock_port, spec["env"], workdir)
+    url = f"http://127.0.0.1:{server_port}{spec['path']}"
+
+    try:
+        await wait_for_port(mock_port)
+        await wait_for_port(server_port)
+        await asyncio.sleep(1.0)
+        base_rss = process_rss_mb(server.pid)
+        base_connections = established_connections(server_port)
+
+        async with AsyncExitStack() as stack:
+            sessions = []
+            for _ in range(idle_clients):
+                sessions.append(await open_session(stack, name if name == "sse" else "streamable", url))
+            await asyncio.sleep(1.0)
+            idle_rss = process_rss_mb(server.pid)
+            idle_connections = established_connections(server_port)
+
+            keywords = [f"전송 비교 상품 {i}" for i in range(200)]
+            latencies: List[float] = []
+            errors: Dict[str, int] = {}
+            now = time.monotonic()
+            measure_from, stop_at = now + warmup, now + warmup + duration
+            await asyncio.gather(*(
+                call_loop(session, keywords, stop_at, measure_from, latencies, errors)
+                for session in sessions[:clients]
+            ))
+            loaded_rss = process_rss_mb(server.pid)
+    finally:
+        for process in (server, mock):
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    summary = latency_summary(latencies)
+    per_client_kb = None
+    if base_rss is not None and idle_rss is not None and idle_clients:
+        per_client_kb = round((idle_rss - base_rss) * 1024 / idle_clients, 1)
+    return {
+        "idle_clients": idle_clients,
+        "clients": clients,
+        "duration_sec": duration,
+        "server_connections_idle": (
+            idle_connections - base_connections
+            if idle_connections is not None and base_connections is not None else None
+        ),
+        "server_rss_base_mb": base_rss,
+        "server_rss_idle_mb": idle_rss,
+        "server_rss_loaded_mb": loaded_rss,
+        "memory_per_client_kb": per_client_kb,
+        "throughput_rps": round(summary["count"] / duration, 2),
+        **summary,
+        "errors": errors,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    results = {}
+    for name in args.transports:
+        print(f"▶ {name} (idle={args.idle_clients}, clients={args.clients}, duration={args.duration}s)")
+        result = await run_transport(name, args.idle_clients, args.clients, args.duration, args.warmup)
+        results[name] = result
+        print(
+            f"  연결 {result['server_connections_idle']}개 | 클라이언트당 {result['memory_per_client_kb']}KB | "
+            f"{result['throughput_rps']:>8.1f} req/s | p50 {result['p50_ms']:.1f}ms | "
+            f"p95 {result['p95_ms']:.1f}ms | errors {result['errors']}"
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transports", nargs="+", default=list(TRANSPORTS), choices=list(TRANSPORTS))
+    parser.add_argument("--idle-clients", type=int, default=200, help="연결만 유지하는 MCP 클라이언트 수")
+    parser.add_argument("--clients", type=int, default=20, help="그중 툴을 반복 호출하는 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="측정 전 워밍업 시간 (초)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+    args.clients = min(args.clients, args.idle_clients)
+
+    results = asyncio.run(main_async(args))
+    path = save_results("bench_transports", results, args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        compare_results(
+            results, args.compare,
+            ["server_connections_idle", "memory_per_client_kb", "throughput_rps", "p50_ms", "p95_ms"]
+        )
+
+
+if __name__ == "__main__":
+    main()
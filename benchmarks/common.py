@@ -0,0 +1,100 @@
+"""
+벤치마크 공용 유틸리티
+백분위수 계산, 메모리 측정, 결과 JSON 저장/비교
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def latency_summary(latencies_ms: List[float]) -> Dict[str, float]:
+    values = sorted(latencies_ms)
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3) if values else 0.0,
+        "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+    }
+
+
+def process_rss_mb(pid: int) -> Optional[float]:
+    """프로세스 상주 메모리 (Linux /proc 기준, 측정 불가 시 None)"""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 2)
+    except OSError:
+        return None
+    return None
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def save_results(name: str, results: Dict[str, Any], path: Optional[str] = None) -> str:
+    """결과를 JSON으로 저장 (기본 경로: benchmarks/results/<name>-<시각>.json)"""
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(RESULTS_DIR, f"{name}-{stamp}.json")
+
+    document = {
+        "benchmark": name,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as output:
+        json.dump(document, output, ensure_ascii=False, indent=2)
+    return path
+
+
+def compare_results(current: Dict[str, Any], baseline_path: str, metrics: List[str]) -> None:
+    """이전 결과 파일과 시나리오별 지표 비교 출력 (양수 = 증가)"""
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+
+    print(f"\n📊 비교 기준: {baseline_path}")
+    for scenario, values in current.items():
+        previous = baseline.get(scenario)
+        if not previous:
+            continue
+        changes = []
+        for metric in metrics:
+            before, after = previous.get(metric), values.get(metric)
+            if not before or after is None:
+                continue
+            changes.append(f"{metric} {before:.2f} → {after:.2f} ({(after - before) / before:+.1%})")
+        if changes:
+            print(f"  {scenario}: " + ", ".join(changes))
@@ -0,0 +1,222 @@
+"""
+엔드투엔드 부하 테스트
+모의 네이버 API + main.py 서버를 띄우고 SSE로 MCP 툴을 동시 호출해
+처리량, p50/p95/p99 지연, 서버 메모리를 시나리오별로 측정
+
+Usage:
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --scenarios baseline slow_upstream --clients 50 --duration 20
+    python benchmarks/load_test.py --compare benchmarks/results/load_test-20240101-000000.json
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common import PROJECT_ROOT, BENCH_DIR, latency_summary, process_rss_mb, save_results, compare_results
+
+
+# 시나리오: 모의 API 설정 + 서버 환경변수 + 키워드 풀 크기 (작을수록 캐시 적중 증가)
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "baseline": {"mock": {"latency-ms": 50}, "keywords": 500},
+    "hot_keywords": {"mock": {"latency-ms": 50}, "keywords": 10},
+    "slow_upstream": {"mock": {"latency-ms": 300, "jitter-ms": 250}, "keywords": 500},
+    "upstream_errors": {"mock": {"latency-ms": 50, "error-rate": 0.05}, "keywords": 500},
+    "rate_limited": {"mock": {"latency-ms": 50, "rate-limit-rate": 0.1}, "keywords": 500},
+    "large_payload": {
+        "mock": {"latency-ms": 50, "title-len": 200},
+        "server_env": {"NAVER_MAX_RESULTS": "100"},
+        "keywords": 500
+    },
+    # large_payload와 같은 부하를 워커 4개로 처리 (포맷팅 / JSON 처리 확장성 비교)
+    "multi_worker": {
+        "mock": {"latency-ms": 50, "title-len": 200},
+        "server_env": {"NAVER_MAX_RESULTS": "100", "SERVER_WORKERS": "4"},
+        "keywords": 500
+    },
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"포트 {port} 대기 시간 초과")
+
+
+def start_mock(port: int, options: Dict[str, Any]) -> subprocess.Popen:
+    command = [sys.executable, os.path.join(BENCH_DIR, "mock_naver.py"), "--port", str(port)]
+    for name, value in options.items():
+        command += [f"--{name}", str(value)]
+    return subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def start_server(port: int, mock_port: int, extra_env: Dict[str, str], workdir: str) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.update({
+        "PORT": str(port),
+        "HOST": "127.0.0.1",
+        "NAVER_CLIENT_ID": "bench-client",
+        "NAVER_CLIENT_SECRET": "bench-secret",
+        "NAVER_API_BASE_URL": f"http://127.0.0.1:{mock_port}/v1/search/shop.json",
+        # 클라이언트 측 제한은 모의 서버 성능 측정을 방해하지 않도록 해제
+        "NAVER_RATE_LIMIT_PER_SEC": "100000",
+        "NAVER_RATE_LIMIT_BURST": "100000",
+        "NAVER_DAILY_QUOTA": "0",
+        "NAVER_KEY_BENCH_SECONDS": "0",
+        "PRICE_HISTORY_PATH": os.path.join(workdir, "price_history.db"),
+        "LOG_LEVEL": "WARNING",
+    })
+    env.update(extra_env)
+    return subprocess.Popen(
+        [sys.executable, os.path.join(PROJECT_ROOT, "main.py")],
+        cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+async def run_client(
+    url: str,
+    keywords: List[str],
+    stop_at: float,
+    measure_from: float,
+    latencies: List[float],
+    errors: Dict[str, int]
+) -> None:
+    """MCP 세션 1개: 종료 시각까지 search_naver_shopping 반복 호출"""
+    rng = random.Random()
+    async with sse_client(url) as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            while time.monotonic() < stop_at:
+                started = time.monotonic()
+                try:
+                    result = await session.call_tool(
+                        "search_naver_shopping", {"keyword": rng.choice(keywords)}
+                    )
+                    failed = result.isError
+                except Exception as e:
+                    failed = True
+                    errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                if started >= measure_from:
+                    latencies.append((time.monotonic() - started) * 1000)
+                    if failed:
+                        errors["tool_error"] = errors.get("tool_error", 0) + 1
+
+
+async def sample_memory(pid: int, stop_at: float, samples: List[float]) -> None:
+    while time.monotonic() < stop_at:
+        rss = process_rss_mb(pid)
+        if rss is not None:
+            samples.append(rss)
+        await asyncio.sleep(0.5)
+
+
+async def run_scenario(name: str, config: Dict[str, Any], clients: int, duration: float, warmup: float) -> Dict[str, Any]:
+    mock_port, server_port = free_port(), free_port()
+    workdir = tempfile.mkdtemp(prefix="shopcatch-bench-")
+    mock = start_mock(mock_port, config.get("mock", {}))
+    server = start_server(server_port, mock_port, config.get("server_env", {}), workdir)
+
+    try:
+        await wait_for_port(mock_port)
+        await wait_for_port(server_port)
+        idle_rss = process_rss_mb(server.pid)
+
+        keywords = [f"벤치마크 상품 {i}" for i in range(config.get("keywords", 100))]
+        latencies: List[float] = []
+        errors: Dict[str, int] = {}
+        memory: List[float] = []
+
+        now = time.monotonic()
+        measure_from, stop_at = now + warmup, now + warmup + duration
+        url = f"http://127.0.0.1:{server_port}/sse"
+
+        outcomes = await asyncio.gather(
+            sample_memory(server.pid, stop_at, memory),
+            *(run_client(url, keywords, stop_at, measure_from, latencies, errors) for _ in range(clients)),
+            return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                errors[f"session_{type(outcome).__name__}"] = errors.get(f"session_{type(outcome).__name__}", 0) + 1
+
+        async with httpx.AsyncClient() as client:
+            upstream = (await client.get(f"http://127.0.0.1:{mock_port}/_stats")).json()
+    finally:
+        for process in (server, mock):
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    summary = latency_summary(latencies)
+    return {
+        "clients": clients,
+        "duration_sec": duration,
+        "throughput_rps": round(summary["count"] / duration, 2),
+        **summary,
+        "errors": errors,
+        "upstream_requests": upstream["requests"],
+        "server_rss_idle_mb": idle_rss,
+        "server_rss_peak_mb": max(memory) if memory else None,
+    }
+
+
+async def main_async(args) -> Dict[str, Any]:
+    results = {}
+    for name in args.scenarios:
+        print(f"▶ {name} (clients={args.clients}, duration={args.duration}s)")
+        result = await run_scenario(name, SCENARIOS[name], args.clients, args.duration, args.warmup)
+        results[name] = result
+        print(
+            f"  {result['throughput_rps']:>8.1f} req/s | p50 {result['p50_ms']:.1f}ms | "
+            f"p95 {result['p95_ms']:.1f}ms | p99 {result['p99_ms']:.1f}ms | "
+            f"RSS {result['server_rss_peak_mb']}MB | errors {result['errors']}"
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--clients", type=int, default=20, help="동시 MCP 세션 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="측정 전 워밍업 시간 (초)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+    path = save_results("load_test", results, args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        compare_results(results, args.compare, ["throughput_rps", "p50_ms", "p95_ms", "p99_ms", "server_rss_peak_mb"])
+
+
+if __name__ == "__main__":
+    main()
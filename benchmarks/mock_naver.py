@@ -0,0 +1,114 @@
+"""
+네이버 쇼핑 검색 API 모의 서버 (벤치마크 전용)
+실제 쿼터를 쓰지 않고 지연/오류/429/응답 크기를 조절해 부하 테스트
+
+Usage:
+    python benchmarks/mock_naver.py --port 18080 --latency-ms 80 --jitter-ms 40 \
+        --error-rate 0.01 --rate-limit-rate 0.02 --title-len 60
+"""
+import argparse
+import asyncio
+import json
+import random
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+
+def create_app(
+    latency_ms: float = 50.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    rate_limit_rate: float = 0.0,
+    title_len: int = 40,
+    total_results: int = 1000,
+    seed: int = 7
+) -> Starlette:
+    """설정값에 따라 동작하는 모의 검색 API 앱 생성"""
+    rng = random.Random(seed)
+    stats = {"requests": 0, "errors": 0, "rate_limited": 0}
+
+    def make_item(keyword: str, rank: int) -> dict:
+        padding = "가" * max(title_len - len(keyword) - 12, 0)
+        product_id = str(80000000 + hash((keyword, rank)) % 10000000)
+        return {
+            "title": f"<b>{keyword}</b> 모의상품 {rank} {padding}",
+            "link": f"https://search.shopping.naver.com/catalog/{product_id}",
+            "image": f"https://shopping-phinf.pstatic.net/main_{product_id}/{product_id}.jpg",
+            "lprice": str(10000 + (rank * 7919 + len(keyword) * 31) % 990000),
+            "hprice": "",
+            "mallName": f"모의몰{rank % 30}",
+            "productId": product_id,
+            "productType": "1" if rank % 3 == 0 else "2",
+            "brand": "모의브랜드" if rank % 2 else "",
+            "maker": "모의제조사",
+            "category1": "디지털/가전",
+            "category2": "음향가전",
+            "category3": "이어폰",
+            "category4": "",
+        }
+
+    async def search(request: Request) -> Response:
+        stats["requests"] += 1
+        delay = max(latency_ms + rng.uniform(-jitter_ms, jitter_ms), 0) / 1000
+        await asyncio.sleep(delay)
+
+        roll = rng.random()
+        if roll < rate_limit_rate:
+            stats["rate_limited"] += 1
+            return JSONResponse(
+                {"errorMessage": "Rate limit exceeded. (속도 제한을 초과했습니다.)", "errorCode": "012"},
+                status_code=429
+            )
+        if roll < rate_limit_rate + error_rate:
+            stats["errors"] += 1
+            return JSONResponse({"errorMessage": "System error", "errorCode": "SE99"}, status_code=500)
+
+        keyword = request.query_params.get("query", "")
+        display = int(request.query_params.get("display", 10))
+        start = int(request.query_params.get("start", 1))
+        end = min(start + display, total_results + 1)
+        body = {
+            "lastBuildDate": "Mon, 01 Jan 2024 00:00:00 +0900",
+            "total": total_results,
+            "start": start,
+            "display": max(end - start, 0),
+            "items": [make_item(keyword, rank) for rank in range(start, end)],
+        }
+        return Response(json.dumps(body, ensure_ascii=False), media_type="application/json")
+
+    async def mock_stats(request: Request) -> Response:
+        return JSONResponse(stats)
+
+    return Starlette(routes=[
+        Route("/v1/search/shop.json", search),
+        Route("/_stats", mock_stats),
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--title-len", type=int, default=40)
+    args = parser.parse_args()
+
+    app = create_app(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        title_len=args.title_len
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,23 +16,149 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     ENVIRONMENT: str = "production"  # development, staging, production
     
+    # 다중 워커 (프로세스별 이벤트 루프, 응답 캐시 / 일일 쿼터는 SQLite WAL로 공유)
+    SERVER_WORKERS: int = 1  # 워커 프로세스 수 (1이면 단일 프로세스)
+    SHARED_STATE_PATH: str = "data/shared_state.db"  # 공유 저장소 (워커 간 요청 전달 소켓도 같은 디렉터리)
+    SHARED_CACHE_MAX_ENTRIES: int = 20000  # 공유 응답 캐시 최대 엔트리 수
+    QUOTA_LEASE_SIZE: int = 20  # 워커가 공유 쿼터 장부에서 한 번에 예약하는 호출 수
+    
     # MCP 설정
     MCP_SERVER_NAME: str = "ShopCatch"
-    MCP_TRANSPORT: str = "sse"
+    MCP_TRANSPORT: str = "sse"  # sse (세션별 장기 연결) 또는 streamable-http
+    MCP_STATELESS_HTTP: bool = True  # streamable-http 무상태 모드 (요청마다 독립 처리, 어느 인스턴스든 응답 가능)
+    MCP_JSON_RESPONSE: bool = True  # streamable-http 응답을 SSE 스트림 대신 단일 JSON으로 반환
     
     # 네이버 API
-    NAVER_CLIENT_ID: str
-    NAVER_CLIENT_SECRET: str
+    NAVER_CLIENT_ID: str = ""
+    NAVER_CLIENT_SECRET: str = ""
+    NAVER_CREDENTIALS: str = ""  # 추가 키: "id:secret[:weight],id:secret[:weight]"
+    NAVER_API_BASE_URL: str = "https://openapi.naver.com/v1/search/shop.json"  # 벤치마크 시 모의 서버로 교체
     NAVER_API_TIMEOUT: float = 10.0
     NAVER_MAX_RESULTS: int = 5
+    NAVER_SCAN_CONCURRENCY: int = 4  # 대량 검색 시 동시 페이지 요청 수
+    NAVER_SCAN_MAX_RESULTS: int = 1000  # 대량 검색 최대 결과 수 (API 한도 1000)
+    
+    # 응답 출력
+    OUTPUT_MAX_CHARS: int = 0  # 툴 응답 기본 최대 글자 수 (0이면 제한 없음)
+    
+    # 가격 통계 분석
+    PRICE_STATS_SAMPLE_SIZE: int = 300  # 기본 표본 수 (최대 NAVER_SCAN_MAX_RESULTS)
+    PRICE_STATS_IQR_K: float = 1.5  # 이상치 판정 IQR 배수
+
+    # 동일 상품 묶기 (판매처별 중복 목록을 상품 1개로 표시)
+    CLUSTER_SIMILARITY: float = 0.6  # 같은 상품으로 볼 제목 유사도 (토큰 shingle Jaccard)
+    CLUSTER_NUM_PERM: int = 64  # MinHash 해시 함수 수
+    CLUSTER_BANDS: int = 16  # LSH 밴드 수 (NUM_PERM의 약수, 클수록 후보를 넓게 찾음)
+    
+    # 가격 이력 저장 (SQLite, 백그라운드 일괄 기록)
+    PRICE_HISTORY_ENABLED: bool = True
+    PRICE_HISTORY_PATH: str = "data/price_history.db"
+    PRICE_HISTORY_BATCH_SIZE: int = 500  # 한 번에 기록할 최대 관측 수
+    PRICE_HISTORY_FLUSH_INTERVAL: float = 2.0  # 최대 기록 지연 (초)
+    PRICE_HISTORY_QUEUE_SIZE: int = 10000  # 대기 큐 크기 (초과 시 기록 생략)
+
+    # 검색어 추천 (이전 검색어 / 상품명 기반 메모리 색인, 업스트림 호출 없음)
+    SUGGEST_ENABLED: bool = True
+    SUGGEST_MAX_TERMS: int = 200000  # 최대 단어 수 (초과 시 가중치 낮은 단어부터 제외, 100만 개 약 300MB)
+    SUGGEST_MERGE_BATCH: int = 2000  # 새 단어를 색인에 합치는 단위
+    SUGGEST_MERGE_INTERVAL: float = 5.0  # 오타 교정에 새 단어가 반영되기까지 최대 지연 (초)
+    SUGGEST_QUEUE_SIZE: int = 1000  # 반영 대기 큐 크기 (검색 결과 단위, 초과 시 생략)
+    SUGGEST_SEED_LIMIT: int = 50000  # 시작 시 가격 이력에서 불러올 최대 검색어 / 상품명 수 (0이면 생략)
+
+    # 가격 알림 (목표가 감시, 같은 키워드는 조회 1회로 묶음)
+    PRICE_WATCH_ENABLED: bool = True
+    PRICE_WATCH_PATH: str = "data/price_watch.db"
+    PRICE_WATCH_QUOTA_SHARE: float = 0.1  # 감시 조회에 쓸 일일 쿼터 비율 (전체 키 합계 기준)
+    PRICE_WATCH_MIN_INTERVAL: float = 300.0  # 조회 간격 하한 (초, 가격 변동이 큰 상품)
+    PRICE_WATCH_MAX_INTERVAL: float = 21600.0  # 조회 간격 상한 (초, 가격이 안정적인 상품)
+    PRICE_WATCH_VOLATILITY: float = 0.01  # 직전 조회 대비 이 비율 이상 바뀌면 조회 간격 단축
+    PRICE_WATCH_MAX_WATCHES: int = 1000  # 최대 활성 감시 수
+    PRICE_WATCH_CONCURRENCY: int = 2  # 동시 조회 수
+    PRICE_WATCH_SAMPLE_SIZE: int = 100  # 조회당 상품 수 (현실적인 최저가 계산용, 최대 100)
+    
+    # 다중 키워드 비교
+    BATCH_MAX_KEYWORDS: int = 20  # 한 번에 비교 가능한 최대 키워드 수
+    BATCH_CONCURRENCY: int = 5  # 동시 검색 수
+    BATCH_KEYWORD_TIMEOUT: float = 8.0  # 키워드별 제한 시간 (초)
     
     # 성능 튜닝
     HTTPX_MAX_CONNECTIONS: int = 100
     HTTPX_MAX_KEEPALIVE: int = 20
+    HTTPX_KEEPALIVE_EXPIRY: float = 60.0  # 유휴 연결 유지 시간 (초)
+    
+    # 툴 호출 수락 제어 (동시 실행 상한 + 대기열, 초과 시 즉시 거절)
+    ADMISSION_MAX_CONCURRENT: int = 64  # 동시 실행 툴 호출 수 (0이면 비활성화)
+    ADMISSION_MAX_QUEUE: int = 256  # 대기열 최대 길이 (초과 시 즉시 거절)
+    ADMISSION_QUEUE_TIMEOUT: float = 5.0  # 최대 대기 시간 (초, 툴 호출 마감 시간이 더 짧으면 그 시간)
+    ADMISSION_FAIR_QUEUING: bool = True  # 클라이언트(세션)별 라운드 로빈 대기
+    ADMISSION_MAX_QUEUE_PER_CLIENT: int = 32  # 클라이언트 1개가 대기열에 올릴 수 있는 최대 호출 수 (0이면 제한 없음)
+    
+    # 요청 마감 시간 / hedged 요청 (업스트림 꼬리 지연 완화)
+    TOOL_DEADLINE: float = 15.0  # 툴 호출 전체 마감 시간 (초, 0이면 제한 없음)
+    SCAN_TOOL_DEADLINE: float = 30.0  # 다중 페이지 탐색 툴 마감 시간 (초)
+    NAVER_HEDGE_ENABLED: bool = False  # 응답이 늦으면 같은 요청을 한 번 더 보내고 먼저 온 응답 사용
+    NAVER_HEDGE_QUANTILE: float = 0.95  # 최근 응답 지연의 이 분위수를 넘기면 hedge 요청 발송
+    NAVER_HEDGE_INITIAL_DELAY: float = 1.0  # 지연 표본이 쌓이기 전 hedge 대기 시간 (초)
+    NAVER_HEDGE_MIN_DELAY: float = 0.05  # hedge 대기 시간 하한 (초)
+    NAVER_HEDGE_MAX_RATIO: float = 0.05  # 전체 요청 대비 hedge 요청 비율 상한
+    
+    # 서킷 브레이커 (네이버 API 장애 시 빠른 실패 + 마지막 정상 결과 제공)
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_WINDOW_SECONDS: int = 30  # 오류율 집계 구간 (초)
+    CIRCUIT_MIN_REQUESTS: int = 20  # 판단에 필요한 최소 요청 수
+    CIRCUIT_FAILURE_RATE: float = 0.5  # 이 비율 이상 실패하면 차단
+    CIRCUIT_SLOW_CALL_SECONDS: float = 3.0  # 이 시간 이상 걸린 응답은 느린 응답으로 집계
+    CIRCUIT_SLOW_CALL_RATE: float = 0.8  # 느린 응답이 이 비율 이상이면 차단
+    CIRCUIT_OPEN_SECONDS: float = 30.0  # 차단 유지 시간 (이후 시험 요청으로 복구 확인)
+    CIRCUIT_HALF_OPEN_PROBES: int = 3  # 복구 확인용 시험 요청 수
+    CIRCUIT_FALLBACK_TTL: float = 86400.0  # 장애 시 대신 제공할 마지막 정상 결과 보관 시간 (초)
+    CIRCUIT_FALLBACK_MAX_ENTRIES: int = 5000
+    
+    # 콜드 스타트 (소켓을 먼저 열고 MCP 서버 / 툴 모듈 로드는 백그라운드에서 진행)
+    LAZY_BOOT: bool = True  # 준비 전에 들어온 요청은 로드 완료까지 대기 (/ready는 즉시 503, /health는 200)
+    BOOT_PROFILE: bool = False  # 모듈별 import 시간 측정 (설정 로드 전에 환경변수로 확인, import마다 약간의 오버헤드)
+    BOOT_PROFILE_PATH: str = ""  # 부팅 보고서 JSON 저장 경로 (빈 값이면 로그만)
+
+    # 서버 라이프사이클 (시작 시 연결 예열 / 종료 시 진행 중 요청 정리)
+    NAVER_WARMUP_CONNECTIONS: int = 2  # 시작 시 미리 열어둘 업스트림 연결 수 (0이면 비활성화)
+    NAVER_KEEPWARM_INTERVAL: float = 30.0  # 유휴 상태에서 연결 유지 요청 간격 (초, 0이면 비활성화)
+    SHUTDOWN_DRAIN_TIMEOUT: float = 20.0  # 종료 시 진행 중 툴 호출 완료 대기 시간 (초)
+    SHUTDOWN_CONNECTION_TIMEOUT: float = 5.0  # 이후 남은 연결(SSE 등) 종료 대기 시간 (초)
+    
+    # 응답 캐시 (TTL + LRU + stale-while-revalidate)
+    CACHE_ENABLED: bool = True
+    CACHE_TTL: float = 300.0  # 신선한 응답 유지 시간 (초)
+    CACHE_STALE_TTL: float = 600.0  # TTL 이후 stale 응답 + 백그라운드 갱신 허용 시간 (초)
+    CACHE_MAX_ENTRIES: int = 2000
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 64MB
+    
+    # 응답 캐시 스냅샷 (재시작 / 유휴 후에도 캐시가 채워진 상태로 시작)
+    CACHE_SNAPSHOT_PATH: str = "data/cache_snapshot.db"  # 스냅샷 파일 (빈 값이면 비활성화)
+    CACHE_SNAPSHOT_INTERVAL: float = 60.0  # 저장 주기 (초)
+    CACHE_SNAPSHOT_MAX_ENTRIES: int = 10000  # 저장할 최대 엔트리 수 (최근 사용 순)
+
+    # 네이버 API 호출 제한 (클라이언트 측, 키별 적용)
+    NAVER_RATE_LIMIT_PER_SEC: float = 10.0  # 초당 요청 수
+    NAVER_RATE_LIMIT_BURST: int = 10  # 순간 허용 요청 수
+    NAVER_RATE_LIMIT_MAX_WAIT: float = 2.0  # 최대 대기 시간 (초), 초과 시 즉시 실패
+    NAVER_DAILY_QUOTA: int = 25000  # 일일 호출 한도 (KST 자정 초기화, 0이면 무제한)
+    NAVER_KEY_BENCH_SECONDS: float = 60.0  # 429 응답 키 일시 제외 시간 (초)
+    NAVER_KEY_AUTH_BENCH_SECONDS: float = 600.0  # 401 응답 키 일시 제외 시간 (초)
+    
+    # 요청 추적 / 관리용 엔드포인트 (워커별 상태)
+    TRACING_ENABLED: bool = True  # 툴 호출 단계별 소요 시간 기록 (로그 / 메트릭 / /admin/traces)
+    TRACE_SLOWEST: int = 20  # 상세 구간을 보관할 가장 느린 호출 수
+    TRACE_RECENT: int = 100  # 상세 구간을 보관할 최근 호출 수
+    ADMIN_TOKEN: str = ""  # /admin/* 인증 토큰 (Authorization: Bearer <토큰>, 빈 값이면 엔드포인트 비활성화)
+    PROFILE_MAX_SECONDS: float = 60.0  # 샘플링 프로파일러 최대 실행 시간 (초)
+    PROFILE_SAMPLE_HZ: int = 100  # 기본 초당 샘플 수
     
     # 로깅
     LOG_LEVEL: str = "INFO"  # DEBUG, INFO, WARNING, ERROR
     LOG_FORMAT: str = "json"  # json or text
+    LOG_ASYNC: bool = True  # 백그라운드 스레드에서 출력 (stdout 지연이 이벤트 루프를 막지 않도록)
+    LOG_QUEUE_SIZE: int = 10000  # 출력 대기 로그 최대 개수 (초과 시 버림)
+    LOG_OVERLOAD_SAMPLE_RATE: int = 10  # 큐가 80% 이상 차면 INFO 이하 로그는 N개 중 1개만 기록
     
     class Config:
         env_file = ".env"
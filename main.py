@@ -1,32 +1,83 @@
 import os
 import sys
-import uvicorn
 
 # 경로 설정
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
-from server.mcp_server import mcp
+# 부팅 시간 측정은 다른 모듈보다 먼저 시작
+from utils.boot_profile import boot_profile
+
+import uvicorn
+
+from config import settings
+from server.lifecycle import ShopCatchServer
+from utils.logger import logger
+from utils.metrics import registry
+
+boot_profile.mark("config_loaded")
+registry.add_collector(lambda: {"boot": {
+    key: value for key, value in boot_profile.report().items() if key in ("phases_ms", "durations_ms")
+}})
+
+
+def create_app():
+    """ASGI 앱 생성 (다중 워커 모드에서는 워커 프로세스마다, LAZY_BOOT면 소켓을 연 뒤 스레드에서 호출)"""
+    # FastMCP / 툴 모듈은 무거우므로 앱을 만들 때 import
+    from server.mcp_server import mcp, create_transport_app
+    from server.lifecycle import attach_lifecycle
+
+    # FastMCP(mcp.server.fastmcp)는 .sse_app() / .streamable_http_app() 메서드로
+    # uvicorn이 실행할 수 있는 Starlette/ASGI 객체를 반환합니다.
+    # 시작 시 업스트림 연결 예열, 종료 시 진행 중 툴 호출 정리
+    app = attach_lifecycle(create_transport_app(settings.MCP_TRANSPORT))
+
+    if settings.SERVER_WORKERS > 1 and settings.MCP_TRANSPORT == "streamable-http" and not settings.MCP_STATELESS_HTTP:
+        logger.warning("streamable-http 세션 모드는 다중 워커에서 세션을 연 워커로만 요청이 전달되지 않습니다 (MCP_STATELESS_HTTP 권장)")
+
+    if settings.SERVER_WORKERS > 1 and settings.MCP_TRANSPORT == "sse":
+        from server.workers import SessionAffinityMiddleware
+
+        # 다른 워커의 SSE 세션으로 온 메시지 전달 (streamable-http 무상태 모드는 불필요)
+        app = SessionAffinityMiddleware(app, mcp.settings.message_path)
+        registry.add_collector(lambda: {"workers": app.stats()})
+    return app
+
+
+def create_server_app():
+    """uvicorn에 넘길 앱 (LAZY_BOOT면 앱 생성을 소켓 바인딩 이후로 미루는 래퍼)"""
+    if settings.LAZY_BOOT:
+        from server.boot import LazyApp
+        return LazyApp(create_app)
+    app = create_app()
+    boot_profile.mark("app_built")
+    return app
+
 
 def main():
     # Render 환경 변수에서 포트 번호를 가져옵니다.
     port = int(os.environ.get("PORT", 10000))
+    workers = max(settings.SERVER_WORKERS, 1)
     
     print("=" * 60)
     print(f"🚀 ShopCatch MCP Server - Fixed")
-    print(f"📡 Binding to 0.0.0.0:{port}")
+    print(f"📡 Binding to 0.0.0.0:{port} (transport: {settings.MCP_TRANSPORT}, workers: {workers})")
     print("=" * 60)
 
-    # ✅ 해결 방법: FastMCP는 .app 속성 대신 .get_asgi_app() 메서드를 제공합니다.
-    # 이 메서드가 uvicorn이 실행할 수 있는 Starlette/ASGI 객체를 반환합니다.
-    app = mcp.get_asgi_app()
-
-    uvicorn.run(
-        app,
+    options = dict(
         host="0.0.0.0", 
         port=port, 
-        log_level="info"
+        log_level="info",
+        timeout_graceful_shutdown=settings.SHUTDOWN_CONNECTION_TIMEOUT
     )
 
+    if workers > 1:
+        from server.workers import run_workers
+
+        # 워커 프로세스가 앱을 직접 생성하도록 import 경로로 전달
+        run_workers(uvicorn.Config("main:create_server_app", factory=True, **options), workers)
+    else:
+        ShopCatchServer(uvicorn.Config(create_server_app(), **options)).run()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,187 @@
+"""
+툴 호출 수락 제어 (admission control)
+동시 실행 상한 + 크기 제한 대기열 + 클라이언트별 공정 대기, 넘치는 요청은 즉시 거절
+
+- 실행 중 호출이 max_concurrent 미만이면 바로 실행
+- 아니면 대기열에 넣고, 대기열이 가득 찼거나 클라이언트별 대기 한도를 넘으면 즉시 ServerBusyError
+- 대기는 queue_timeout과 툴 호출 마감 시간 중 짧은 쪽까지만 (초과 시 ServerBusyError)
+- fair=True면 클라이언트(세션)별 대기열을 라운드 로빈으로 처리해
+  한 클라이언트가 대기열을 채워도 다른 클라이언트 차례가 밀리지 않음
+"""
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Hashable, Optional
+
+from config import settings
+from utils.deadline import remaining
+from utils.exceptions import ServerBusyError
+from utils.metrics import ADMISSION_WAIT
+
+try:
+    from mcp.server.lowlevel.server import request_ctx
+except ImportError:
+    request_ctx = None
+
+
+class AdmissionController:
+    """동시 실행 슬롯 + 클라이언트별 FIFO 대기열 (단일 이벤트 루프 전용, 락 없음)"""
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+        fair: bool = True,
+        max_queue_per_client: int = 0
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.fair = fair
+        self.max_queue_per_client = max_queue_per_client
+
+        self.in_flight = 0
+        self.queued = 0
+        # 클라이언트 키 → 대기 중인 Future (키 순서 = 라운드 로빈 순서)
+        self._queues: "OrderedDict[Hashable, Deque[asyncio.Future]]" = OrderedDict()
+
+        self.admitted = 0
+        self.waited = 0
+        self.shed_queue_full = 0
+        self.shed_client_limit = 0
+        self.shed_timeout = 0
+
+    async def acquire(self, client: Hashable) -> None:
+        """
+        실행 슬롯 획득 (성공 시 반드시 release 호출)
+
+        Raises:
+            ServerBusyError: 대기열 초과 / 대기 시간 초과
+        """
+        if self.in_flight < self.max_concurrent and not self.queued:
+            self.in_flight += 1
+            self.admitted += 1
+            return
+
+        key = client if self.fair else None
+        waiters = self._queues.get(key)
+        if self.queued >= self.max_queue:
+            self.shed_queue_full += 1
+            raise ServerBusyError("서버가 혼잡합니다 (대기열 초과). 잠시 후 다시 시도해주세요.", details={"reason": "queue_full", "queued": self.queued})
+        if self.fair and self.max_queue_per_client and waiters and len(waiters) >= self.max_queue_per_client:
+            self.shed_client_limit += 1
+            raise ServerBusyError("요청이 너무 많습니다 (클라이언트별 대기 한도 초과). 이전 요청이 끝난 뒤 다시 시도해주세요.", details={"reason": "client_limit"})
+
+        timeout = remaining(self.queue_timeout)
+        if timeout <= 0:
+            self.shed_timeout += 1
+            raise ServerBusyError("서버가 혼잡합니다 (대기 시간 초과). 잠시 후 다시 시도해주세요.", details={"reason": "timeout"})
+
+        if waiters is None:
+            waiters = self._queues[key] = deque()
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        self.queued += 1
+        started = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(future, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # 슬롯을 넘겨받은 직후 취소 / 시간 초과 → 다음 대기자에게 반환
+                self.release()
+            else:
+                self._discard(key, future)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self.shed_timeout += 1
+            ADMISSION_WAIT.observe(time.perf_counter() - started)
+            raise ServerBusyError(
+                "서버가 혼잡합니다 (대기 시간 초과). 잠시 후 다시 시도해주세요.",
+                details={"reason": "timeout", "waited_sec": round(timeout, 2)}
+            )
+
+        self.waited += 1
+        self.admitted += 1
+        ADMISSION_WAIT.observe(time.perf_counter() - started)
+
+    def _discard(self, key: Hashable, future: asyncio.Future) -> None:
+        waiters = self._queues.get(key)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(future)
+        except ValueError:
+            # release에서 이미 꺼낸 대기자
+            return
+        self.queued -= 1
+        if not waiters:
+            del self._queues[key]
+
+    def release(self) -> None:
+        """슬롯 반환 (대기자가 있으면 다음 클라이언트 차례의 대기자에게 바로 넘김)"""
+        while self._queues:
+            key, waiters = next(iter(self._queues.items()))
+            future = waiters.popleft()
+            self.queued -= 1
+            if waiters:
+                self._queues.move_to_end(key)
+            else:
+                del self._queues[key]
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "clients_waiting": len(self._queues),
+            "admitted": self.admitted,
+            "waited": self.waited,
+            "shed": {
+                "queue_full": self.shed_queue_full,
+                "client_limit": self.shed_client_limit,
+                "timeout": self.shed_timeout
+            }
+        }
+
+
+def client_key() -> Hashable:
+    """
+    공정 대기 기준 클라이언트 키
+
+    SSE / 세션 모드는 MCP 세션, 무상태 streamable-http는 요청마다 세션이 새로 생기므로 접속 주소 기준
+    """
+    context = request_ctx.get(None) if request_ctx is not None else None
+    if context is None:
+        return "local"
+    request = context.request
+    if settings.MCP_TRANSPORT == "streamable-http" and settings.MCP_STATELESS_HTTP:
+        client = getattr(request, "client", None)
+        if client is not None:
+            return client.host
+    return id(context.session)
+
+
+# 싱글톤 인스턴스
+_admission: Optional[AdmissionController] = None
+
+
+def get_admission() -> Optional[AdmissionController]:
+    """수락 제어기 반환 (ADMISSION_MAX_CONCURRENT=0이면 None)"""
+    global _admission
+    if settings.ADMISSION_MAX_CONCURRENT <= 0:
+        return None
+    if _admission is None:
+        _admission = AdmissionController(
+            max_concurrent=settings.ADMISSION_MAX_CONCURRENT,
+            max_queue=settings.ADMISSION_MAX_QUEUE,
+            queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+            fair=settings.ADMISSION_FAIR_QUEUING,
+            max_queue_per_client=settings.ADMISSION_MAX_QUEUE_PER_CLIENT
+        )
+    return _admission
@@ -0,0 +1,123 @@
+"""
+지연 부팅 (LAZY_BOOT)
+무거운 모듈(FastMCP, mcp.types, httpx, numpy 등) import와 앱 생성을 소켓 바인딩과 동시에 진행
+
+- uvicorn lifespan 시작을 즉시 완료시켜 리스닝 소켓을 먼저 열고,
+  실제 앱 생성(import 포함)은 스레드에서, 실제 앱의 lifespan(스냅샷 복원 / 연결 예열)은 그 뒤에 실행
+- 준비 전에 들어온 요청은 준비가 끝날 때까지 대기 후 처리
+  (/ready는 즉시 503, /health는 프로세스가 살아 있으므로 즉시 200)
+- 종료 시 실제 앱의 lifespan 종료까지 전달
+"""
+import asyncio
+import json
+from typing import Any, Callable, Dict, Optional
+
+from utils.boot_profile import boot_profile
+from utils.logger import logger
+
+
+# 준비 전에도 바로 응답하는 상태 확인 경로 → 상태 코드
+_STATUS_PATHS = {"/ready": 503, "/health": 200}
+
+
+class LazyApp:
+    """
+    앱 생성을 lifespan 시작 후 백그라운드로 미루는 ASGI 래퍼
+
+    Args:
+        factory: 실제 ASGI 앱을 만드는 함수 (스레드에서 호출)
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+        self.app: Optional[Any] = None
+        self.error: Optional[BaseException] = None
+        self._state: Dict[str, Any] = {}
+        self._ready: Optional[asyncio.Event] = None
+        self._boot_task: Optional[asyncio.Task] = None
+        self._inner_task: Optional[asyncio.Task] = None
+        self._to_inner: Optional[asyncio.Queue] = None
+        self._from_inner: Optional[asyncio.Queue] = None
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        self._start()
+        if not self._ready.is_set():
+            if scope["type"] == "http" and scope["path"] in _STATUS_PATHS:
+                await _json_response(send, _STATUS_PATHS[scope["path"]], {"status": "starting"})
+                return
+            await self._ready.wait()
+
+        if self.error is not None:
+            if scope["type"] == "http":
+                await _json_response(send, 503, {"status": "boot_failed"})
+            return
+        if self._state:
+            scope["state"] = {**self._state, **scope.get("state", {})}
+        await self.app(scope, receive, send)
+
+    def _start(self) -> None:
+        if self._boot_task is None:
+            self._ready = asyncio.Event()
+            self._boot_task = asyncio.create_task(self._boot())
+
+    async def _lifespan(self, receive, send) -> None:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            self._start()
+            await send({"type": "lifespan.startup.complete"})
+            message = await receive()
+        if message["type"] == "lifespan.shutdown":
+            await self._stop()
+            await send({"type": "lifespan.shutdown.complete"})
+
+    async def _boot(self) -> None:
+        """실제 앱 생성(스레드) → 실제 앱 lifespan 시작"""
+        try:
+            self.app = await asyncio.to_thread(self.factory)
+            boot_profile.mark("app_built")
+
+            self._to_inner, self._from_inner = asyncio.Queue(), asyncio.Queue()
+            scope = {"type": "lifespan", "asgi": {"version": "3.0", "spec_version": "2.0"}, "state": self._state}
+            self._inner_task = asyncio.create_task(self.app(scope, self._to_inner.get, self._from_inner.put))
+            await self._to_inner.put({"type": "lifespan.startup"})
+            message = await self._next_inner_message()
+            if message is not None and message["type"] == "lifespan.startup.failed":
+                raise RuntimeError(message.get("message") or "lifespan startup failed")
+        except Exception as e:
+            self.error = e
+            logger.error("지연 부팅 실패: %s", e, exc_info=True)
+        finally:
+            self._ready.set()
+
+    async def _next_inner_message(self) -> Optional[Dict[str, Any]]:
+        """실제 앱의 lifespan 응답 (lifespan을 지원하지 않아 앱이 먼저 끝나면 None)"""
+        getter = asyncio.ensure_future(self._from_inner.get())
+        done, _ = await asyncio.wait({getter, self._inner_task}, return_when=asyncio.FIRST_COMPLETED)
+        if getter in done:
+            return getter.result()
+        getter.cancel()
+        return None
+
+    async def _stop(self) -> None:
+        if self._boot_task is None:
+            return
+        # 부팅 중 종료 신호를 받으면 부팅을 마친 뒤 정상 종료 절차 진행
+        await self._boot_task
+        if self._inner_task is None or self._inner_task.done():
+            return
+        await self._to_inner.put({"type": "lifespan.shutdown"})
+        await self._next_inner_message()
+
+
+async def _json_response(send, status: int, body: Dict[str, Any]) -> None:
+    content = json.dumps(body).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(content)).encode())]
+    })
+    await send({"type": "http.response.body", "body": content})
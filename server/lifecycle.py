@@ -0,0 +1,318 @@
+"""
+서버 라이프사이클
+시작 시 캐시 스냅샷 복원 + 업스트림 연결 예열 → ready, 종료 시 새 툴 호출 거부 → 진행 중 호출 대기 → 리소스 정리
+
+종료 순서 (SIGTERM):
+    1. ShopCatchServer.shutdown: draining 전환 (새 툴 호출 거부, /ready 503)
+       진행 중 툴 호출을 SHUTDOWN_DRAIN_TIMEOUT 까지 대기
+    2. uvicorn 기본 종료: 리스닝 소켓 닫기, 남은 연결(SSE 등)을
+       SHUTDOWN_CONNECTION_TIMEOUT 까지 대기 후 정리
+    3. lifespan 종료: 연결 유지 / 스냅샷 저장 / 가격 알림 감시 작업 중지, 마지막 캐시 스냅샷 저장,
+       HTTP 연결 풀 / 가격 이력 저장소 / 검색어 추천 색인 정리
+"""
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+
+import uvicorn
+from starlette.applications import Starlette
+
+from config import settings
+from utils.logger import logger
+from utils.exceptions import ServiceUnavailableError
+from utils.boot_profile import boot_profile
+
+try:
+    # SSE 스트림 종료 제어 (mcp 의존성으로 설치됨)
+    from sse_starlette.sse import AppStatus as SSEAppStatus
+except ImportError:
+    SSEAppStatus = None
+
+
+STARTING = "starting"
+READY = "ready"
+DRAINING = "draining"
+STOPPED = "stopped"
+
+# 드레이닝 완료 후 SSE 스트림을 닫기 전 대기 시간 (초)
+RESPONSE_FLUSH_GRACE = 0.1
+
+
+class ServerLifecycle:
+    """서버 상태 + 진행 중 툴 호출 수 추적"""
+
+    def __init__(self):
+        self.state = STARTING
+        self.in_flight = 0
+        self.warm_connections = 0
+        self.started_at = time.monotonic()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._keep_warm_task: Optional[asyncio.Task] = None
+        self._snapshot_task: Optional[asyncio.Task] = None
+        self._price_watch_task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.state == READY
+
+    def begin_call(self) -> None:
+        """
+        툴 호출 시작 등록
+
+        Raises:
+            ServiceUnavailableError: 종료 진행 중
+        """
+        if self.state in (DRAINING, STOPPED):
+            raise ServiceUnavailableError("서버가 종료 중입니다. 잠시 후 다시 시도해주세요.")
+        self.in_flight += 1
+        self._idle.clear()
+
+    def end_call(self) -> None:
+        self.in_flight -= 1
+        if self.in_flight <= 0:
+            self.in_flight = 0
+            self._idle.set()
+
+    async def startup(self) -> None:
+        """가격 이력 기록 시작, 캐시 스냅샷 복원 / 업스트림 연결 예열 (동시 진행) 후 ready 전환, 가격 알림 감시 시작"""
+        from services.naver_api import get_naver_client
+
+        client = get_naver_client()
+        self._start_price_history()
+        await asyncio.gather(self._restore_snapshot(client), self._warm_up(client))
+        self._start_price_watch()
+
+        if self.state == STARTING:
+            self.state = READY
+            logger.info("🚀 %s 준비 완료", settings.MCP_SERVER_NAME)
+            record_boot_phase("ready")
+
+    async def _warm_up(self, client) -> None:
+        try:
+            if settings.NAVER_WARMUP_CONNECTIONS > 0:
+                started = time.perf_counter()
+                self.warm_connections = await client.warm_up(settings.NAVER_WARMUP_CONNECTIONS)
+                logger.info(
+                    "업스트림 연결 예열 완료: %s/%s (%.0fms)",
+                    self.warm_connections, settings.NAVER_WARMUP_CONNECTIONS,
+                    (time.perf_counter() - started) * 1000
+                )
+            if settings.NAVER_KEEPWARM_INTERVAL > 0 and settings.NAVER_WARMUP_CONNECTIONS > 0:
+                self._keep_warm_task = asyncio.create_task(
+                    client.keep_warm(settings.NAVER_KEEPWARM_INTERVAL, settings.NAVER_WARMUP_CONNECTIONS)
+                )
+        except Exception as e:
+            # 예열 실패는 첫 요청에서 다시 연결을 시도하므로 시작을 막지 않음
+            logger.error("업스트림 연결 예열 실패: %s", e)
+
+    async def _restore_snapshot(self, client) -> None:
+        """스냅샷으로 응답 캐시 채우기 + 주기 저장 시작 (다중 워커는 0번 워커만 저장)"""
+        from services.cache_snapshot import get_cache_snapshot
+        from server.workers import current_worker
+
+        snapshot = get_cache_snapshot()
+        if snapshot is None:
+            return
+        try:
+            entries = await asyncio.to_thread(snapshot.load)
+            restored = client.restore_cache(entries)
+            if restored or snapshot.dropped_expired:
+                logger.info(
+                    "캐시 스냅샷 복원: %s개 (만료 제외 %s개, %.0fms)",
+                    restored, snapshot.dropped_expired, snapshot.last_load_ms
+                )
+        except Exception as e:
+            # 스냅샷 없이도 정상 동작 (빈 캐시로 시작)
+            logger.error("캐시 스냅샷 복원 실패: %s", e)
+
+        if settings.CACHE_SNAPSHOT_INTERVAL > 0 and current_worker() == 0:
+            self._snapshot_task = asyncio.create_task(self._save_snapshots(client, snapshot))
+
+    @staticmethod
+    def _start_price_history() -> None:
+        """가격 이력 쓰기 스레드 시작 (첫 검색 요청에서 시작하지 않도록 미리 실행)"""
+        from services.price_history import get_price_history
+
+        history = get_price_history()
+        if history is not None:
+            history.start()
+
+    def _start_price_watch(self) -> None:
+        """가격 알림 감시 시작 (다중 워커는 0번 워커만 조회, 등록 / 알림 확인은 모든 워커에서 가능)"""
+        from services.price_watch import get_price_watcher
+        from server.workers import current_worker
+
+        if current_worker() != 0:
+            return
+        try:
+            watcher = get_price_watcher()
+        except Exception as e:
+            logger.error("가격 알림 감시 시작 실패: %s", e)
+            return
+        if watcher is not None:
+            self._price_watch_task = asyncio.create_task(watcher.run())
+
+    async def _save_snapshots(self, client, snapshot) -> None:
+        while True:
+            await asyncio.sleep(settings.CACHE_SNAPSHOT_INTERVAL)
+            await self._save_snapshot(client, snapshot)
+
+    @staticmethod
+    async def _save_snapshot(client, snapshot) -> None:
+        # 엔트리 목록은 이벤트 루프에서 복사, 직렬화 / 파일 기록은 스레드에서 실행
+        entries = client.export_cache(settings.CACHE_SNAPSHOT_MAX_ENTRIES)
+        if entries:
+            await asyncio.to_thread(snapshot.save, entries)
+
+    async def drain(self, timeout: float) -> bool:
+        """
+        새 툴 호출 거부 후 진행 중 호출 완료 대기
+
+        Returns:
+            제한 시간 내 모든 호출이 끝났는지 여부
+        """
+        if self.state in (STARTING, READY):
+            self.state = DRAINING
+            logger.info("🛑 종료 시작: 새 툴 호출 거부, 진행 중 %s건 대기", self.in_flight)
+
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning("종료 대기 시간 초과: 진행 중 툴 호출 %s건 중단", self.in_flight)
+            return False
+
+    async def shutdown(self) -> None:
+        """진행 중 호출 정리 후 캐시 스냅샷 저장, 연결 풀 / 가격 이력 저장소 / 검색어 추천 색인 종료"""
+        from services.cache_snapshot import get_cache_snapshot
+        from services.naver_api import close_naver_client, get_naver_client
+        from services.price_history import get_price_history
+        from services.suggest import get_suggest_index
+
+        await self.drain(settings.SHUTDOWN_DRAIN_TIMEOUT)
+        self.state = STOPPED
+
+        if self._keep_warm_task is not None:
+            self._keep_warm_task.cancel()
+            self._keep_warm_task = None
+
+        if self._price_watch_task is not None:
+            self._price_watch_task.cancel()
+            self._price_watch_task = None
+
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            self._snapshot_task = None
+            try:
+                await self._save_snapshot(get_naver_client(), get_cache_snapshot())
+            except Exception as e:
+                logger.error("종료 시 캐시 스냅샷 저장 실패: %s", e)
+
+        try:
+            await close_naver_client()
+
+            history = get_price_history()
+            if history is not None:
+                await asyncio.to_thread(history.close)
+
+            suggest = get_suggest_index()
+            if suggest is not None:
+                await asyncio.to_thread(suggest.close)
+        except Exception as e:
+            logger.error("리소스 정리 중 오류: %s", e)
+
+        logger.info("👋 서버 종료 완료")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "status": self.state,
+            "pid": os.getpid(),
+            "in_flight": self.in_flight,
+            "warm_connections": self.warm_connections,
+            "uptime_sec": round(time.monotonic() - self.started_at, 1)
+        }
+
+
+def record_boot_phase(phase: str) -> None:
+    """
+    부팅 단계 기록 (ready / listening)
+
+    두 단계가 모두 끝나면 단계별 소요 시간을 로그로 남기고 BOOT_PROFILE_PATH에 보고서 저장
+    (LAZY_BOOT면 listening → ready, 아니면 ready → listening 순서)
+    """
+    boot_profile.mark(phase)
+    if "ready" not in boot_profile.phases or "listening" not in boot_profile.phases:
+        return
+    report = boot_profile.report()
+    logger.info("부팅 시간 (프로세스 시작 기준 ms): %s", report["phases_ms"], extra={"boot": report["durations_ms"]})
+    if settings.BOOT_PROFILE_PATH:
+        try:
+            boot_profile.write(settings.BOOT_PROFILE_PATH)
+        except OSError as e:
+            logger.warning("부팅 보고서 저장 실패: %s", e)
+
+
+def attach_lifecycle(app: Starlette) -> Starlette:
+    """
+    Starlette 앱의 lifespan에 시작/종료 처리 연결
+
+    기존 lifespan (streamable-http 세션 매니저 등)은 그대로 감싸서 실행합니다.
+    """
+    inner_lifespan = app.router.lifespan_context
+    lifecycle = get_lifecycle()
+
+    @asynccontextmanager
+    async def lifespan(app_):
+        async with inner_lifespan(app_) as state:
+            await lifecycle.startup()
+            try:
+                yield state
+            finally:
+                await lifecycle.shutdown()
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+class ShopCatchServer(uvicorn.Server):
+    """
+    연결을 닫기 전에 진행 중 툴 호출을 먼저 정리하는 uvicorn 서버
+
+    sse-starlette는 종료 신호를 받는 즉시 모든 SSE 스트림을 끊어 진행 중 툴 호출이
+    취소되므로, 자동 종료를 끄고 드레이닝이 끝난 뒤 직접 스트림을 닫습니다.
+    """
+
+    def __init__(self, config: uvicorn.Config):
+        super().__init__(config)
+        if SSEAppStatus is not None and hasattr(SSEAppStatus, "disable_automatic_graceful_drain"):
+            SSEAppStatus.disable_automatic_graceful_drain()
+
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets)
+        if self.started:
+            record_boot_phase("listening")
+
+    async def shutdown(self, sockets=None) -> None:
+        if not self.force_exit:
+            await get_lifecycle().drain(settings.SHUTDOWN_DRAIN_TIMEOUT)
+        if SSEAppStatus is not None:
+            # 마지막 툴 응답이 SSE 스트림으로 전송될 시간 확보
+            # (should_exit 이후 이벤트는 전송되지 않음)
+            await asyncio.sleep(RESPONSE_FLUSH_GRACE)
+            SSEAppStatus.should_exit = True
+        await super().shutdown(sockets)
+
+
+# 싱글톤 인스턴스
+_lifecycle: Optional[ServerLifecycle] = None
+
+
+def get_lifecycle() -> ServerLifecycle:
+    """서버 라이프사이클 인스턴스 반환"""
+    global _lifecycle
+    if _lifecycle is None:
+        _lifecycle = ServerLifecycle()
+    return _lifecycle
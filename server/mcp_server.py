@@ -2,23 +2,89 @@
 ShopCatch MCP 서버 및 툴 정의
 FastMCP를 이용한 Pure MCP 구현
 """
-import time
+import asyncio
+import hmac
+import math
+
 from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
 from config import settings
-from utils.logger import logger, log_tool_execution
-from utils.exceptions import ShopCatchError
-from services.naver_api import search_shopping
-from services.formatter import format_shopping_results, format_error_message
+from utils.logger import logger
+from typing import Any, Dict, List, Optional
+from utils.exceptions import ConfigurationError, ProfilerBusyError, ShopCatchError, ValidationError
+from services.naver_api import search_shopping, scan_shopping, search_many, get_naver_client
+from services.price_stats import analyze_prices
+from services.clustering import cluster_items
+from services.cache_snapshot import get_cache_snapshot
+from services.price_history import get_price_history
+from services.price_watch import get_price_watcher
+from services.suggest import get_suggest_index
+from server.tool_runtime import rejections_as_message, tool_call
+from server.lifecycle import get_lifecycle
+from server.admission import get_admission
+from server.workers import current_worker
+from utils.metrics import registry
+from utils.profiler import profile
+from utils.tracing import get_tracer, span
+from services.formatter import (
+    TEXT_OUTPUT_MODES, format_shopping_results, format_comparison_results, format_price_stats,
+    format_price_trend, format_price_watch_added, format_price_alerts, format_suggestions,
+    format_error_message, format_health_status
+)
 
 
 # MCP 서버 인스턴스 생성
-mcp = FastMCP(settings.MCP_SERVER_NAME)
+# (host를 지정하지 않으면 localhost 전용 Host 헤더 검증이 켜져 외부 요청이 거부됨)
+# stateless_http / json_response는 streamable-http 전송 방식에만 적용
+mcp = FastMCP(
+    settings.MCP_SERVER_NAME,
+    host=settings.HOST,
+    port=settings.PORT,
+    stateless_http=settings.MCP_STATELESS_HTTP,
+    json_response=settings.MCP_JSON_RESPONSE
+)
+
+# 지원 전송 방식
+TRANSPORTS = ("sse", "streamable-http")
+
+
+def _group_listings(items):
+    """판매처별 중복 목록을 상품 단위로 묶기 (설정값 적용)"""
+    with span("group"):
+        return cluster_items(
+            items,
+            threshold=settings.CLUSTER_SIMILARITY,
+            num_perm=settings.CLUSTER_NUM_PERM,
+            bands=settings.CLUSTER_BANDS
+        )
+
+
+def _grouped_note(listings: int, products: int) -> str:
+    """묶기 결과 안내 문구 (묶인 목록이 없으면 빈 문자열)"""
+    if products >= listings:
+        return ""
+    return f"\n💡 판매 목록 {listings}개를 같은 상품끼리 묶어 {products}개로 정리했습니다."
+
+
+def _did_you_mean_note(keyword: str) -> str:
+    """결과가 없을 때 로컬 색인 기반 교정 제안 (업스트림 호출 없음)"""
+    index = get_suggest_index()
+    corrections = index.did_you_mean(keyword) if index else []
+    if not corrections:
+        return ""
+    return "\n💡 혹시 " + ", ".join(f"'{term}'" for term in corrections) + "을(를) 찾으셨나요?"
 
 
 @mcp.tool()
+@rejections_as_message
 async def search_naver_shopping(
     keyword: str,
-    sort: str = "sim"
+    sort: str = "sim",
+    output_format: str = "rich",
+    max_chars: int = 0,
+    group_similar: bool = True
 ) -> str:
     """
     네이버 쇼핑에서 상품을 검색합니다.
@@ -30,6 +96,13 @@ async def search_naver_shopping(
             - "asc": 가격 낮은 순
             - "dsc": 가격 높은 순
             - "date": 최신순
+        output_format: 출력 형식
+            - "rich": 보기 좋은 상세 형식 (기본값)
+            - "compact": 상품당 한 줄 (토큰 절약)
+            - "table": 마크다운 표
+            - "json" / "csv": 기계 처리용
+        max_chars: 응답 최대 글자 수 (0이면 서버 기본값). 초과 시 링크/제목을 줄이고 뒤쪽 상품을 생략합니다
+        group_similar: 여러 판매처에 올라온 같은 상품을 하나로 묶고 가격 범위를 표시 (기본값 True)
     
     Returns:
         검색 결과를 읽기 쉬운 형식으로 반환합니다.
@@ -38,49 +111,56 @@ async def search_naver_shopping(
     Examples:
         - "무선 이어폰 검색해줘" → search_naver_shopping(keyword="무선 이어폰")
         - "노트북을 가격 낮은 순으로 찾아줘" → search_naver_shopping(keyword="노트북", sort="asc")
+        - "키보드 10개 간단히 보여줘" → search_naver_shopping(keyword="키보드", output_format="compact")
     
     Tips:
         - 검색 결과가 없으면 키워드를 바꿔보세요
         - 가격은 실시간으로 변동될 수 있습니다
     """
-    start_time = time.time()
-    success = False
-    
-    try:
-        logger.info(f"툴 실행: search_naver_shopping(keyword={keyword}, sort={sort})")
-        
-        # 네이버 API 호출
-        items = await search_shopping(keyword, sort=sort)
+    params = {"keyword": keyword, "sort": sort, "output_format": output_format, "group_similar": group_similar}
+    async with tool_call("search_naver_shopping", params) as call:
+        try:
+            logger.info("툴 실행: search_naver_shopping(keyword=%s, sort=%s, output_format=%s)", keyword, sort, output_format)
+            
+            # 네이버 API 호출
+            items = await search_shopping(keyword, sort=sort)
+            listings = len(items)
+            if group_similar:
+                items = _group_listings(items)
+            
+            # 결과 포맷팅 (출력 형식 + 글자 수 예산)
+            with span("format"):
+                result = format_shopping_results(
+                    items, keyword, mode=output_format, max_chars=max_chars or settings.OUTPUT_MAX_CHARS
+                )
+            note = _grouped_note(listings, len(items)) if items else _did_you_mean_note(keyword)
+            if note and output_format in TEXT_OUTPUT_MODES:
+                result += "\n" + note
+            
+            call.success = True
+            return result
         
-        # 결과 포맷팅
-        result = format_shopping_results(items, keyword)
+        except ShopCatchError as e:
+            call.error = e
+            # 예상된 에러 (사용자 친화적 메시지)
+            logger.warning("툴 실행 실패: %s", e.message, extra=e.details)
+            return e.to_user_message()
         
-        success = True
-        return result
-    
-    except ShopCatchError as e:
-        # 예상된 에러 (사용자 친화적 메시지)
-        logger.warning(f"툴 실행 실패: {e.message}", extra=e.details)
-        return e.to_user_message()
-    
-    except Exception as e:
-        # 예상치 못한 에러
-        logger.error(f"툴 실행 중 예외 발생: {e}", exc_info=True)
-        return format_error_message("api_error", str(e))
-    
-    finally:
-        # 실행 시간 로깅 (성능 모니터링)
-        duration = time.time() - start_time
-        log_tool_execution(
-            tool_name="search_naver_shopping",
-            params={"keyword": keyword, "sort": sort},
-            success=success,
-            duration=duration
-        )
+        except Exception as e:
+            call.error = e
+            # 예상치 못한 에러
+            logger.error("툴 실행 중 예외 발생: %s", e, exc_info=True)
+            return format_error_message("api_error", str(e))
 
 
 @mcp.tool()
-async def get_lowest_price(keyword: str) -> str:
+@rejections_as_message
+async def get_lowest_price(
+    keyword: str,
+    output_format: str = "rich",
+    max_chars: int = 0,
+    group_similar: bool = True
+) -> str:
     """
     특정 상품의 최저가를 빠르게 찾습니다.
     
@@ -89,6 +169,13 @@ async def get_lowest_price(keyword: str) -> str:
     
     Args:
         keyword: 검색할 상품명 (예: "아이폰 15 Pro", "다이슨 청소기")
+        output_format: 출력 형식
+            - "rich": 보기 좋은 상세 형식 (기본값)
+            - "compact": 상품당 한 줄 (토큰 절약)
+            - "table": 마크다운 표
+            - "json" / "csv": 기계 처리용
+        max_chars: 응답 최대 글자 수 (0이면 서버 기본값). 초과 시 링크/제목을 줄이고 뒤쪽 상품을 생략합니다
+        group_similar: 여러 판매처에 올라온 같은 상품을 하나로 묶고 가격 범위를 표시 (기본값 True)
     
     Returns:
         가격 낮은 순으로 정렬된 상품 목록
@@ -96,65 +183,687 @@ async def get_lowest_price(keyword: str) -> str:
     Examples:
         - "아이폰 15 최저가 알려줘" → get_lowest_price(keyword="아이폰 15")
     """
-    start_time = time.time()
-    success = False
+    params = {"keyword": keyword, "output_format": output_format, "group_similar": group_similar}
+    async with tool_call("get_lowest_price", params) as call:
+        try:
+            logger.info("툴 실행: get_lowest_price(keyword=%s, output_format=%s)", keyword, output_format)
+            
+            # 가격 낮은 순으로 검색
+            items = await search_shopping(keyword, sort="asc")
+            
+            # 결과 포맷팅 (최저가 강조)
+            if not items:
+                return f"'{keyword}'에 대한 검색 결과가 없습니다." + _did_you_mean_note(keyword)
+            
+            listings = len(items)
+            if group_similar:
+                items = _group_listings(items)
+            
+            with span("format"):
+                result = format_shopping_results(
+                    items, keyword, mode=output_format, max_chars=max_chars or settings.OUTPUT_MAX_CHARS
+                )
+            if output_format in TEXT_OUTPUT_MODES:
+                result += "\n\n💡 가격 낮은 순으로 정렬되었습니다." + _grouped_note(listings, len(items))
+            
+            call.success = True
+            return result
+        
+        except ShopCatchError as e:
+            call.error = e
+            logger.warning("툴 실행 실패: %s", e.message, extra=e.details)
+            return e.to_user_message()
+        
+        except Exception as e:
+            call.error = e
+            logger.error("툴 실행 중 예외 발생: %s", e, exc_info=True)
+            return format_error_message("api_error", str(e))
+
+
+@mcp.tool()
+@rejections_as_message
+async def scan_lowest_price(
+    keyword: str,
+    max_results: int = 300,
+    target_price: int = 0,
+    top_n: int = 5,
+    output_format: str = "rich",
+    max_chars: int = 0,
+    group_similar: bool = True
+) -> str:
+    """
+    시장 전체에서 최저가를 찾습니다 (최대 1,000개 상품 탐색).
     
-    try:
-        logger.info(f"툴 실행: get_lowest_price(keyword={keyword})")
+    정확도순 검색 결과를 여러 페이지 동시에 가져와 중복을 제거한 뒤,
+    가격이 낮은 상품부터 보여줍니다. get_lowest_price보다 넓은 범위를 탐색합니다.
+    같은 상품의 판매처별 목록은 하나로 묶어 상위 목록이 한 상품으로 채워지지 않게 합니다.
+    
+    Args:
+        keyword: 검색할 상품명 (예: "아이폰 15 Pro 256GB")
+        max_results: 탐색할 최대 상품 수 (100 단위 권장, 최대 1000)
+        target_price: 목표 가격(원). 이 가격 이하 상품을 찾으면 탐색을 일찍 종료합니다 (0이면 끝까지 탐색)
+        top_n: 보여줄 최저가 상품 수
+        output_format: 출력 형식
+            - "rich": 보기 좋은 상세 형식 (기본값)
+            - "compact": 상품당 한 줄 (토큰 절약)
+            - "table": 마크다운 표
+            - "json" / "csv": 기계 처리용
+        max_chars: 응답 최대 글자 수 (0이면 서버 기본값). 초과 시 링크/제목을 줄이고 뒤쪽 상품을 생략합니다
+        group_similar: 여러 판매처에 올라온 같은 상품을 하나로 묶고 가격 범위를 표시 (기본값 True)
+    
+    Returns:
+        가격 낮은 순으로 정렬된 상위 상품 목록
+    
+    Examples:
+        - "갤럭시 S24 전체 시장 최저가 찾아줘" → scan_lowest_price(keyword="갤럭시 S24")
+        - "에어팟 프로 20만원 이하 있는지 찾아줘" → scan_lowest_price(keyword="에어팟 프로", target_price=200000)
+    """
+    params = {
+        "keyword": keyword,
+        "max_results": max_results,
+        "target_price": target_price,
+        "output_format": output_format,
+        "group_similar": group_similar
+    }
+    async with tool_call("scan_lowest_price", params, deadline=settings.SCAN_TOOL_DEADLINE) as call:
+        try:
+            logger.info("툴 실행: scan_lowest_price(keyword=%s, max_results=%s, target_price=%s)", keyword, max_results, target_price)
+            
+            max_results = max(1, min(max_results, settings.NAVER_SCAN_MAX_RESULTS))
+            
+            def reached_target(items) -> bool:
+                return any(0 < item.lprice <= target_price for item in items)
+            
+            # 페이지 병렬 조회 (목표 가격 도달 시 조기 종료)
+            items = await scan_shopping(
+                keyword,
+                sort="sim",
+                max_results=max_results,
+                stop_when=reached_target if target_price > 0 else None
+            )
+            
+            priced = [item for item in items if item.lprice > 0]
+            if not priced:
+                return f"'{keyword}'에 대한 검색 결과가 없습니다." + _did_you_mean_note(keyword)
+            
+            if group_similar:
+                # 최대 1,000개 묶기는 이벤트 루프 밖에서 실행
+                priced = await asyncio.to_thread(_group_listings, priced)
+            cheapest = sorted(priced, key=lambda item: item.lprice)[:max(1, top_n)]
+            
+            with span("format"):
+                result = format_shopping_results(
+                    cheapest, keyword, mode=output_format, max_chars=max_chars or settings.OUTPUT_MAX_CHARS
+                )
+            if output_format in TEXT_OUTPUT_MODES:
+                result += f"\n\n💡 {len(items)}개 상품을 탐색해 가격 낮은 순으로 정리했습니다."
+                if group_similar:
+                    result += f" (같은 상품을 묶어 {len(priced)}개 상품으로 비교)"
+            
+            call.success = True
+            return result
         
-        # 가격 낮은 순으로 검색
-        items = await search_shopping(keyword, sort="asc")
+        except ShopCatchError as e:
+            call.error = e
+            logger.warning("툴 실행 실패: %s", e.message, extra=e.details)
+            return e.to_user_message()
         
-        # 결과 포맷팅 (최저가 강조)
-        if not items:
-            return f"'{keyword}'에 대한 검색 결과가 없습니다."
+        except Exception as e:
+            call.error = e
+            logger.error("툴 실행 중 예외 발생: %s", e, exc_info=True)
+            return format_error_message("api_error", str(e))
+
+
+@mcp.tool()
+@rejections_as_message
+async def compare_prices(
+    keywords: List[str],
+    sort: str = "asc"
+) -> str:
+    """
+    여러 상품의 최저가를 한 번에 비교합니다.
+    
+    키워드마다 search_naver_shopping을 따로 호출하는 대신 이 툴 하나로
+    최대 20개 상품을 동시에 검색하고, 상품별 최저가를 한 줄씩 정리해 보여줍니다.
+    일부 키워드가 실패해도 나머지 결과는 정상적으로 반환됩니다.
+    
+    Args:
+        keywords: 비교할 상품명 목록 (예: ["아이폰 15", "갤럭시 S24", "픽셀 8"])
+        sort: 각 키워드의 검색 정렬 방식 ("asc": 가격 낮은 순(기본값), "sim": 정확도순)
+    
+    Returns:
+        키워드별 최저가, 상품명, 판매처, 구매 링크
+    
+    Examples:
+        - "아이폰 15, 갤럭시 S24, 픽셀 8 가격 비교해줘"
+          → compare_prices(keywords=["아이폰 15", "갤럭시 S24", "픽셀 8"])
+    """
+    params = {"keywords": keywords, "sort": sort}
+    async with tool_call("compare_prices", params) as call:
+        try:
+            logger.info("툴 실행: compare_prices(keywords=%s, sort=%s)", keywords, sort)
+            
+            # 공백 정리 + 중복 제거 (입력 순서 유지)
+            unique_keywords = list(dict.fromkeys(k.strip() for k in keywords if k and k.strip()))
+            if not unique_keywords:
+                raise ValidationError("비교할 검색어를 입력해주세요.")
+            if len(unique_keywords) > settings.BATCH_MAX_KEYWORDS:
+                raise ValidationError(f"한 번에 최대 {settings.BATCH_MAX_KEYWORDS}개까지 비교할 수 있습니다.")
+            
+            # 동시 검색 (동시 실행 수 / 키워드별 제한 시간 적용)
+            results = await search_many(unique_keywords, sort=sort)
+            
+            with span("format"):
+                result = format_comparison_results(results)
+            
+            call.success = any(not isinstance(outcome, BaseException) for _, outcome in results)
+            return result
         
-        result = format_shopping_results(items, keyword)
-        result += "\n\n💡 가격 낮은 순으로 정렬되었습니다."
+        except ShopCatchError as e:
+            call.error = e
+            logger.warning("툴 실행 실패: %s", e.message, extra=e.details)
+            return e.to_user_message()
         
-        success = True
-        return result
+        except Exception as e:
+            call.error = e
+            logger.error("툴 실행 중 예외 발생: %s", e, exc_info=True)
+            return format_error_message("api_error", str(e))
+
+
+@mcp.tool()
+@rejections_as_message
+async def analyze_price(
+    keyword: str,
+    sample_size: Optional[int] = None
+) -> str:
+    """
+    상품의 가격 분포를 분석해 "현실적인 최저가"를 알려줍니다.
     
-    except ShopCatchError as e:
-        logger.warning(f"툴 실행 실패: {e.message}", extra=e.details)
-        return e.to_user_message()
-    
-    except Exception as e:
-        logger.error(f"툴 실행 중 예외 발생: {e}", exc_info=True)
-        return format_error_message("api_error", str(e))
-    
-    finally:
-        duration = time.time() - start_time
-        log_tool_execution(
-            tool_name="get_lowest_price",
-            params={"keyword": keyword},
-            success=success,
-            duration=duration
-        )
+    가격 낮은 순 검색은 케이스, 액세서리 같은 다른 상품이 상위에 섞이기 쉽습니다.
+    이 툴은 많은 검색 결과를 모아 다른 카테고리 상품과 비정상 가격을 걸러낸 뒤
+    최저가, 중앙값, 가격 분포를 보여줍니다.
+    
+    Args:
+        keyword: 분석할 상품명 (예: "아이폰 15 Pro 256GB")
+        sample_size: 분석에 사용할 상품 수 (기본값 300, 최대 1000, 많을수록 정확하지만 느려짐)
+    
+    Returns:
+        현실적인 최저가, 중앙값/백분위 가격, 가격 분포 히스토그램
+    
+    Examples:
+        - "아이폰 15 실제 최저가가 얼마야?" → analyze_price(keyword="아이폰 15")
+        - "다이슨 청소기 가격대 분석해줘" → analyze_price(keyword="다이슨 청소기", sample_size=500)
+    """
+    params = {"keyword": keyword, "sample_size": sample_size}
+    async with tool_call("analyze_price", params, deadline=settings.SCAN_TOOL_DEADLINE) as call:
+        try:
+            logger.info("툴 실행: analyze_price(keyword=%s, sample_size=%s)", keyword, sample_size)
+            
+            sample_size = max(1, min(sample_size or settings.PRICE_STATS_SAMPLE_SIZE, settings.NAVER_SCAN_MAX_RESULTS))
+            
+            # 정확도순 표본 수집 (상위 결과가 검색 의도 카테고리 판단 기준)
+            items = await scan_shopping(keyword, sort="sim", max_results=sample_size)
+            
+            with span("analyze"):
+                stats = analyze_prices(items, iqr_k=settings.PRICE_STATS_IQR_K)
+            if stats is None:
+                return f"'{keyword}'에 대한 검색 결과가 없습니다." + _did_you_mean_note(keyword)
+            
+            with span("format"):
+                result = format_price_stats(stats, keyword)
+            
+            call.success = True
+            return result
+        
+        except ShopCatchError as e:
+            call.error = e
+            logger.warning("툴 실행 실패: %s", e.message, extra=e.details)
+            return e.to_user_message()
+        
+        except Exception as e:
+            call.error = e
+            logger.error("툴 실행 중 예외 발생: %s", e, exc_info=True)
+            return format_error_message("api_error", str(e))
+
+
+@mcp.tool()
+@rejections_as_message
+async def get_price_trend(
+    keyword: str,
+    days: int = 30
+) -> str:
+    """
+    상품의 가격 추이와 역대 최저가를 보여줍니다.
+    
+    지금까지 검색하며 기록된 가격 이력을 바탕으로 일별 최저가 변화를 알려줍니다.
+    "이번 달에 더 싸졌어?", "지금 사도 될까?" 같은 질문에 사용하세요.
+    
+    Args:
+        keyword: 상품명 (예: "아이폰 15 Pro")
+        days: 조회 기간 (일, 기본값 30)
+    
+    Returns:
+        일별 최저가 추이, 현재 최저가, 역대 최저가
+    
+    Examples:
+        - "에어팟 프로 이번 달에 가격 내려갔어?" → get_price_trend(keyword="에어팟 프로")
+        - "갤럭시 S24 3개월 가격 추이 보여줘" → get_price_trend(keyword="갤럭시 S24", days=90)
+    """
+    params = {"keyword": keyword, "days": days}
+    async with tool_call("get_price_trend", params) as call:
+        try:
+            logger.info("툴 실행: get_price_trend(keyword=%s, days=%s)", keyword, days)
+            
+            history = get_price_history()
+            if history is None:
+                return "ℹ️ 가격 이력 기록이 비활성화되어 있습니다."
+            
+            days = max(1, min(days, 365))
+            
+            # 현재 최저가 조회 (결과는 이력에도 기록됨)
+            items = await search_shopping(keyword, sort="asc")
+            current_price = min((item.lprice for item in items if item.lprice > 0), default=0)
+            
+            with span("history"):
+                trend = await history.keyword_trend(keyword, days)
+                all_time_low = await history.keyword_all_time_low(keyword)
+            
+            if not trend and not all_time_low and not current_price:
+                return f"'{keyword}'에 대한 가격 기록이 없습니다."
+            
+            result = format_price_trend(keyword, trend, all_time_low, current_price, days)
+            
+            call.success = True
+            return result
+        
+        except ShopCatchError as e:
+            call.error = e
+            logger.warning("툴 실행 실패: %s", e.message, extra=e.details)
+            return e.to_user_message()
+        
+        except Exception as e:
+            call.error = e
+            logger.error("툴 실행 중 예외 발생: %s", e, exc_info=True)
+            return format_error_message("api_error", str(e))
+
+
+@mcp.tool()
+@rejections_as_message
+async def suggest_keywords(
+    query: str,
+    limit: int = 10
+) -> str:
+    """
+    검색어 자동 완성과 오타 교정을 제안합니다 (네이버 API를 호출하지 않아 즉시 응답).
+    
+    지금까지의 검색어와 검색 결과 상품명 / 브랜드를 바탕으로 추천합니다.
+    검색어가 애매하거나 철자가 불확실할 때, 검색 결과가 없을 때 검색 전에 사용하세요.
+    
+    Args:
+        query: 입력 중인 검색어 또는 철자가 불확실한 검색어 (예: "에어팟", "갤럭시 버즈")
+        limit: 추천 검색어 수 (기본값 10, 최대 20)
+    
+    Returns:
+        "혹시 ~을 찾으셨나요?" 교정 제안, 자주 찾는 순 추천 검색어
+    
+    Examples:
+        - "애어팟 프로 찾아줘" (오타 의심) → suggest_keywords(query="애어팟 프로")
+        - "다이슨으로 시작하는 제품 뭐 있어?" → suggest_keywords(query="다이슨")
+    """
+    params = {"query": query, "limit": limit}
+    async with tool_call("suggest_keywords", params) as call:
+        try:
+            logger.info("툴 실행: suggest_keywords(query=%s, limit=%s)", query, limit)
+            
+            index = get_suggest_index()
+            if index is None:
+                return "ℹ️ 검색어 추천 기능이 비활성화되어 있습니다."
+            if not query or not query.strip():
+                raise ValidationError("검색어를 입력해주세요.")
+            
+            result = format_suggestions(query.strip(), index.suggest(query, max(1, min(limit, 20))))
+            
+            call.success = True
+            return result
+        
+        except ShopCatchError as e:
+            call.error = e
+            logger.warning("툴 실행 실패: %s", e.message, extra=e.details)
+            return e.to_user_message()
+        
+        except Exception as e:
+            call.error = e
+            logger.error("툴 실행 중 예외 발생: %s", e, exc_info=True)
+            return format_error_message("api_error", str(e))
+
+
+@mcp.tool()
+@rejections_as_message
+async def add_price_watch(
+    keyword: str,
+    target_price: int
+) -> str:
+    """
+    상품 가격 알림을 등록합니다.
+    
+    서버가 주기적으로 최저가를 확인하고, 목표가 이하로 내려가면 알림을 남깁니다.
+    (알림은 1회 발생 후 자동 해제, 확인은 list_price_alerts)
+    "~원 아래로 떨어지면 알려줘" 같은 요청에 사용하세요.
+    
+    Args:
+        keyword: 상품명 (예: "에어팟 프로 2")
+        target_price: 목표가 (원, 최저가가 이 가격 이하가 되면 알림)
+    
+    Returns:
+        알림 번호, 최근 확인한 최저가
+    
+    Examples:
+        - "에어팟 프로 25만원 밑으로 떨어지면 알려줘" → add_price_watch(keyword="에어팟 프로", target_price=250000)
+    """
+    params = {"keyword": keyword, "target_price": target_price}
+    async with tool_call("add_price_watch", params) as call:
+        try:
+            logger.info("툴 실행: add_price_watch(keyword=%s, target_price=%s)", keyword, target_price)
+            
+            watcher = get_price_watcher()
+            if watcher is None:
+                return "ℹ️ 가격 알림 기능이 비활성화되어 있습니다."
+            
+            result = format_price_watch_added(await watcher.add(keyword, target_price))
+            
+            call.success = True
+            return result
+        
+        except ShopCatchError as e:
+            call.error = e
+            logger.warning("툴 실행 실패: %s", e.message, extra=e.details)
+            return e.to_user_message()
+        
+        except Exception as e:
+            call.error = e
+            logger.error("툴 실행 중 예외 발생: %s", e, exc_info=True)
+            return format_error_message("api_error", str(e))
+
+
+@mcp.tool()
+@rejections_as_message
+async def remove_price_watch(watch_id: int) -> str:
+    """
+    등록한 가격 알림을 해제합니다.
+    
+    Args:
+        watch_id: 알림 번호 (add_price_watch / list_price_alerts 결과의 #번호)
+    
+    Returns:
+        해제 결과
+    """
+    async with tool_call("remove_price_watch", {"watch_id": watch_id}) as call:
+        try:
+            logger.info("툴 실행: remove_price_watch(watch_id=%s)", watch_id)
+            
+            watcher = get_price_watcher()
+            if watcher is None:
+                return "ℹ️ 가격 알림 기능이 비활성화되어 있습니다."
+            
+            removed = await watcher.remove(watch_id)
+            
+            call.success = True
+            return f"🔕 가격 알림 #{watch_id}을 해제했습니다." if removed else f"가격 알림 #{watch_id}을 찾을 수 없습니다."
+        
+        except ShopCatchError as e:
+            call.error = e
+            logger.warning("툴 실행 실패: %s", e.message, extra=e.details)
+            return e.to_user_message()
+        
+        except Exception as e:
+            call.error = e
+            logger.error("툴 실행 중 예외 발생: %s", e, exc_info=True)
+            return format_error_message("api_error", str(e))
+
+
+@mcp.tool()
+@rejections_as_message
+async def list_price_alerts(only_new: bool = True) -> str:
+    """
+    목표가에 도달한 가격 알림과 감시 중인 알림 목록을 보여줍니다.
+    
+    "알림 온 거 있어?", "가격 알림 목록 보여줘" 같은 질문에 사용하세요.
+    
+    Args:
+        only_new: True면 아직 확인하지 않은 알림만, False면 최근 알림 전체 (기본값 True)
+    
+    Returns:
+        도달 알림 (가격, 판매처, 링크), 감시 중인 알림별 목표가 / 현재 최저가 / 다음 확인 시각
+    """
+    async with tool_call("list_price_alerts", {"only_new": only_new}) as call:
+        try:
+            logger.info("툴 실행: list_price_alerts(only_new=%s)", only_new)
+            
+            watcher = get_price_watcher()
+            if watcher is None:
+                return "ℹ️ 가격 알림 기능이 비활성화되어 있습니다."
+            
+            alerts, watches = await asyncio.gather(watcher.alerts(only_new), watcher.watches())
+            result = format_price_alerts(alerts, watches, only_new)
+            
+            call.success = True
+            return result
+        
+        except ShopCatchError as e:
+            call.error = e
+            logger.warning("툴 실행 실패: %s", e.message, extra=e.details)
+            return e.to_user_message()
+        
+        except Exception as e:
+            call.error = e
+            logger.error("툴 실행 중 예외 발생: %s", e, exc_info=True)
+            return format_error_message("api_error", str(e))
 
 
-# 서버 라이프사이클 이벤트
-#@mcp.on_startup()
-#async def startup():
-    #"""서버 시작 시 실행"""
-    #logger.info(f"🚀 {settings.MCP_SERVER_NAME} 서버 시작")
-    #logger.info(f"환경: {settings.ENVIRONMENT}")
-    #logger.info(f"포트: {settings.PORT}")
-    #logger.info(f"로그 레벨: {settings.LOG_LEVEL}")
+def _service_status() -> Dict[str, Any]:
+    """서버 라이프사이클 + 네이버 API 연동 상태"""
+    status = get_lifecycle().status()
+    stats = get_naver_client().get_stats()
+    breaker = stats["circuit_breaker"]
+    status["healthy"] = status["status"] == "ready" and (breaker is None or breaker["state"] != "open")
+    status["circuit_breaker"] = breaker
+    status["fallbacks_served"] = stats["fallbacks_served"]
+    status["cache"] = stats["cache"]
+    status["credentials"] = {"total": stats["credentials"]["total"], "healthy": stats["credentials"]["healthy"]}
+    admission = get_admission()
+    status["admission"] = admission.stats() if admission else None
+    return status
 
 
-#@mcp.on_shutdown()
-#async def shutdown():
-    #"""서버 종료 시 실행 (리소스 정리)"""
-    #logger.info("🛑 서버 종료 중...")
+@mcp.tool()
+@rejections_as_message
+async def get_service_status() -> str:
+    """
+    ShopCatch 서버와 네이버 쇼핑 API 연동 상태를 확인합니다.
     
-    # HTTP 클라이언트 정리
-   # from services.naver_api import get_naver_client
-    #try:
-        #client = get_naver_client()
-       # await client.close()
-        #logger.info("✅ 네이버 API 클라이언트 정리 완료")
-    #except Exception as e:
-        #logger.error(f"클라이언트 정리 중 오류: {e}")
+    검색이 계속 실패하거나 "이전 결과" 안내가 표시될 때 사용하세요.
     
-    #logger.info("👋 서버 종료 완료")
+    Returns:
+        서버 상태, 네이버 API 차단 여부와 최근 오류율, 캐시 적중률, 사용 가능한 API 키 수
+    """
+    async with tool_call("get_service_status", {}) as call:
+        result = format_health_status(_service_status())
+        call.success = True
+        return result
+
+
+# 스크레이프 시점에 캐시/싱글플라이트/키별 제한기/가격 이력 상태 수집
+registry.add_collector(lambda: get_naver_client().get_stats())
+
+
+def _admission_stats() -> Dict[str, Any]:
+    """툴 호출 대기열 길이 / 거절 수"""
+    admission = get_admission()
+    return {"admission": admission.stats()} if admission else {}
+
+
+registry.add_collector(_admission_stats)
+
+
+def _snapshot_stats() -> Dict[str, Any]:
+    """캐시 스냅샷 복원 / 저장 결과"""
+    snapshot = get_cache_snapshot()
+    return {"cache_snapshot": snapshot.stats()} if snapshot else {}
+
+
+registry.add_collector(_snapshot_stats)
+
+
+def _price_watch_stats() -> Dict[str, Any]:
+    """가격 알림 감시 조회 수 / 알림 수 (조회를 담당하는 워커만 0이 아님)"""
+    watcher = get_price_watcher()
+    return {"price_watch": watcher.stats()} if watcher else {}
+
+
+registry.add_collector(_price_watch_stats)
+
+
+def _tracing_stats() -> Dict[str, Any]:
+    """추적한 툴 호출 수 / 보관 중인 가장 느린 호출 시간"""
+    tracer = get_tracer()
+    return {"tracing": tracer.stats()} if tracer else {}
+
+
+registry.add_collector(_tracing_stats)
+
+
+def create_transport_app(transport: str) -> Starlette:
+    """
+    전송 방식별 ASGI 앱
+    
+    - sse: 클라이언트마다 SSE 연결 + 세션 상태 유지 (연결한 인스턴스에 고정)
+    - streamable-http: POST /mcp 요청 단위 처리 (무상태 모드면 세션 메모리 없음)
+    
+    Raises:
+        ConfigurationError: 지원하지 않는 전송 방식
+    """
+    if transport == "sse":
+        return mcp.sse_app()
+    if transport == "streamable-http":
+        return mcp.streamable_http_app()
+    raise ConfigurationError(
+        f"MCP_TRANSPORT는 {', '.join(TRANSPORTS)} 중 하나여야 합니다",
+        details={"transport": transport}
+    )
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> Response:
+    """Prometheus 메트릭 엔드포인트"""
+    return Response(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@mcp.custom_route("/health", methods=["GET"])
+async def health(request: Request) -> Response:
+    """프로세스 상태 (liveness, 업스트림 장애와 무관하게 200)"""
+    return JSONResponse(_service_status())
+
+
+@mcp.custom_route("/ready", methods=["GET"])
+async def ready(request: Request) -> Response:
+    """트래픽 수신 가능 여부 (연결 예열 완료 후 200, 종료 중 503)"""
+    lifecycle = get_lifecycle()
+    return JSONResponse(lifecycle.status(), status_code=200 if lifecycle.ready else 503)
+
+
+def _admin_denied(request: Request) -> Optional[Response]:
+    """관리용 엔드포인트 인증 (ADMIN_TOKEN 미설정 시 404, 토큰 불일치 시 401)"""
+    if not settings.ADMIN_TOKEN:
+        return JSONResponse({"error": "not_found"}, status_code=404)
+    supplied = request.headers.get("authorization", "").encode()
+    if not hmac.compare_digest(supplied, f"Bearer {settings.ADMIN_TOKEN}".encode()):
+        return JSONResponse({"error": "unauthorized"}, status_code=401)
+    return None
+
+
+def _query_number(request: Request, name: str, default: float) -> float:
+    """쿼리 파라미터 숫자 값 (없으면 default, nan / inf는 거절)"""
+    value = request.query_params.get(name)
+    if value is None:
+        return default
+    try:
+        number = float(value)
+    except ValueError:
+        number = math.nan
+    if not math.isfinite(number):
+        raise ValidationError(f"{name}은(는) 숫자여야 합니다.", details={name: value})
+    return number
+
+
+@mcp.custom_route("/admin/traces", methods=["GET"])
+async def admin_traces(request: Request) -> Response:
+    """
+    느린 툴 호출의 단계별 구간 (요청을 받은 워커 기준)
+
+    Query:
+        tool: 툴 이름 필터
+        limit: 최근 호출 최대 개수 (기본 20)
+        reset: 1이면 조회 후 보관 기록 비우기
+    """
+    denied = _admin_denied(request)
+    if denied is not None:
+        return denied
+    tracer = get_tracer()
+    if tracer is None:
+        return JSONResponse({"error": "tracing_disabled"}, status_code=404)
+    try:
+        limit = int(_query_number(request, "limit", 20))
+    except ValidationError as e:
+        return JSONResponse({"error": e.message}, status_code=400)
+
+    tool = request.query_params.get("tool") or None
+    body = {
+        "worker": current_worker(),
+        **tracer.stats(),
+        "slowest": tracer.slowest(tool),
+        "recent": tracer.recent(tool)[:max(limit, 0)],
+    }
+    if request.query_params.get("reset") == "1":
+        tracer.reset()
+    return JSONResponse(body)
+
+
+@mcp.custom_route("/admin/profile", methods=["GET"])
+async def admin_profile(request: Request) -> Response:
+    """
+    샘플링 프로파일러를 N초 동안 실행하고 collapsed stack 반환 (요청을 받은 워커 기준)
+
+    flamegraph.pl, speedscope, inferno 등에서 바로 열 수 있습니다.
+
+    Query:
+        seconds: 실행 시간 (기본 10, 최대 PROFILE_MAX_SECONDS)
+        hz: 초당 샘플 수 (기본 PROFILE_SAMPLE_HZ, 최대 1000)
+    
+    Usage:
+        curl -H "Authorization: Bearer $ADMIN_TOKEN" "http://host/admin/profile?seconds=30" > profile.folded
+    """
+    denied = _admin_denied(request)
+    if denied is not None:
+        return denied
+    try:
+        seconds = _query_number(request, "seconds", 10.0)
+        hz = _query_number(request, "hz", settings.PROFILE_SAMPLE_HZ)
+    except ValidationError as e:
+        return JSONResponse({"error": e.message}, status_code=400)
+    seconds = max(0.1, min(seconds, settings.PROFILE_MAX_SECONDS))
+    hz = max(1.0, min(hz, 1000.0))
+
+    try:
+        # 샘플링은 별도 스레드에서 실행 (이벤트 루프는 계속 요청 처리)
+        profiler = await asyncio.to_thread(profile, seconds, 1.0 / hz)
+    except ProfilerBusyError as e:
+        return JSONResponse({"error": e.message}, status_code=409)
+    logger.info("프로파일링 완료: %.1f초, 샘플 %s개", seconds, profiler.samples)
+    return Response(
+        profiler.collapsed(),
+        media_type="text/plain; charset=utf-8",
+        headers={
+            "X-Profile-Samples": str(profiler.samples),
+            "X-Profile-Worker": str(current_worker()),
+        }
+    )
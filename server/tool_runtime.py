@@ -0,0 +1,114 @@
+"""
+MCP 툴 실행 공통 처리
+수락 제어(동시 실행 상한 / 대기열), 실행 시간 측정, 실행 중 개수, 실패 예외 집계, 단계별 구간 추적, 실행 로그
+"""
+import functools
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from config import settings
+from utils.deadline import deadline_scope
+from utils.exceptions import ServerBusyError, ServiceUnavailableError
+from utils.logger import log_tool_execution, logger
+from utils.metrics import TOOL_DURATION, TOOL_ERRORS, TOOLS_IN_FLIGHT
+from utils.tracing import get_tracer, span
+from server.lifecycle import get_lifecycle
+from server.admission import client_key, get_admission
+
+
+class ToolCall:
+    """툴 실행 1회의 상태 (툴 본문에서 success / error 를 채움)"""
+
+    __slots__ = ("tool_name", "params", "started", "success", "error")
+
+    def __init__(self, tool_name: str, params: Dict[str, Any]):
+        self.tool_name = tool_name
+        self.params = params
+        self.started = time.perf_counter()
+        self.success = False
+        self.error: Optional[BaseException] = None
+
+
+# 툴 본문 실행 전에 tool_call이 발생시키는 거절 예외 (툴의 try 블록 밖이라 여기서 사용자 메시지로 변환)
+_REJECTIONS = (ServiceUnavailableError, ServerBusyError)
+
+
+def rejections_as_message(function: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """
+    툴 호출 거절을 사용자 메시지로 반환하는 툴 래퍼 (@mcp.tool() 바로 아래에 적용)
+
+    tool_call이 본문 실행 전에 거절하면 예외가 툴의 except ShopCatchError 블록에 닿지 않아
+    FastMCP의 일반 오류로 전달되므로, 다른 실패와 같이 to_user_message()로 응답합니다.
+    """
+    @functools.wraps(function)
+    async def wrapper(*args, **kwargs) -> str:
+        try:
+            return await function(*args, **kwargs)
+        except _REJECTIONS as e:
+            logger.warning("툴 호출 거절: %s", e.message, extra=e.details)
+            return e.to_user_message()
+    return wrapper
+
+
+@asynccontextmanager
+async def tool_call(
+    tool_name: str,
+    params: Dict[str, Any],
+    deadline: Optional[float] = None
+) -> AsyncIterator[ToolCall]:
+    """
+    툴 실행 구간 계측
+
+    Usage:
+        async with tool_call("search_naver_shopping", {"keyword": keyword}) as call:
+            ...
+            call.success = True
+    
+    종료 진행 중이면 ServiceUnavailableError, 동시 실행 / 대기열 한도를 넘으면
+    ServerBusyError를 발생시켜 새 호출을 거부합니다. (툴에 rejections_as_message를 적용해 사용자 메시지로 반환)
+    deadline(초, 기본값 settings.TOOL_DEADLINE)은 대기열 대기와 네이버 API 호출의 대기/타임아웃 상한으로 전파됩니다.
+    추적이 켜져 있으면 호출 구간 안의 span(대기열 대기 포함)이 이 호출의 trace에 기록됩니다.
+    """
+    lifecycle = get_lifecycle()
+    admission = get_admission()
+    call = ToolCall(tool_name, params)
+    in_flight = TOOLS_IN_FLIGHT.labels(tool_name)
+    in_flight.inc()
+    admitted = False
+    slot = False
+    tracer = get_tracer()
+    trace = token = None
+    if tracer is not None:
+        trace, token = tracer.begin(tool_name, params)
+    try:
+        lifecycle.begin_call()
+        admitted = True
+        with deadline_scope(settings.TOOL_DEADLINE if deadline is None else deadline):
+            if admission is not None:
+                with span("admission"):
+                    await admission.acquire(client_key())
+                slot = True
+            yield call
+    except BaseException as e:
+        call.error = e
+        raise
+    finally:
+        if slot:
+            admission.release()
+        if admitted:
+            lifecycle.end_call()
+        in_flight.dec()
+        duration = time.perf_counter() - call.started
+        TOOL_DURATION.labels(tool_name, "success" if call.success else "failure").observe(duration)
+        if call.error is not None:
+            TOOL_ERRORS.labels(tool_name, type(call.error).__name__).inc()
+        if trace is not None:
+            tracer.end(trace, token, call.success, call.error)
+        log_tool_execution(
+            tool_name=tool_name,
+            params=params,
+            success=call.success,
+            duration=duration,
+            phases=trace.phase_ms() if trace is not None else None
+        )
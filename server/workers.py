@@ -0,0 +1,270 @@
+"""
+다중 워커 실행
+부모 프로세스가 리스닝 소켓을 열고 워커 프로세스(spawn)에 나눠 주며, 죽은 워커는 다시 시작
+
+- 워커마다 별도 이벤트 루프에서 툴 실행 / 응답 포맷팅 (코어 수만큼 병렬 처리)
+- 응답 캐시(L2) / 일일 쿼터는 SQLite 공유 저장소로 합산 (services/shared_state.py)
+- 초당 요청 수 제한은 워커 수로 나눠 각 워커에 적용
+- SSE 세션은 스트림을 연 워커에만 존재하므로, 다른 워커로 들어온 메시지는
+  워커 전용 유닉스 소켓으로 전달 (SessionAffinityMiddleware)
+
+제한 사항: /metrics, /health, /admin/*는 요청을 받은 워커 하나의 상태만 보여줍니다.
+"""
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs
+
+import httpx
+import uvicorn
+
+from config import settings
+from utils.logger import logger
+from server.lifecycle import ShopCatchServer
+
+
+# 워커 번호 환경변수 (워커 프로세스에서만 설정됨)
+WORKER_INDEX_ENV = "SHOPCATCH_WORKER_INDEX"
+
+# 워커 간 전달 요청 표시 헤더 (재전달 방지)
+FORWARDED_HEADER = "x-shopcatch-forwarded"
+
+# 워커 간 메시지 전달 제한 시간 (초)
+FORWARD_TIMEOUT = 5.0
+
+# 세션 → 워커 기억 최대 개수 (초과 시 초기화)
+MAX_REMEMBERED_SESSIONS = 10000
+
+# uvicorn 워커 시작 실패 종료 코드 (재시작해도 같은 이유로 실패)
+STARTUP_FAILURE = 3
+
+# 워커는 spawn으로 시작 (fork는 부모의 스레드 / 이벤트 루프 상태를 물려받음)
+_spawn = multiprocessing.get_context("spawn")
+
+_HOP_HEADERS = {b"content-length", b"transfer-encoding", b"connection", b"content-encoding"}
+
+
+def current_worker() -> int:
+    """현재 워커 번호 (단일 프로세스 모드는 0)"""
+    return int(os.environ.get(WORKER_INDEX_ENV, "0"))
+
+
+def worker_socket_path(index: int) -> str:
+    """워커 간 요청 전달용 유닉스 소켓 경로"""
+    directory = os.path.dirname(settings.SHARED_STATE_PATH) or "."
+    return os.path.join(directory, f"worker-{index}.sock")
+
+
+def _bind_unix_socket(path: str) -> socket.socket:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if os.path.exists(path):
+        os.remove(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    return sock
+
+
+def _serve_worker(index: int, config: uvicorn.Config, sockets: List[socket.socket]) -> None:
+    """워커 프로세스 진입점 (공유 리스닝 소켓 + 워커 전용 유닉스 소켓)"""
+    os.environ[WORKER_INDEX_ENV] = str(index)
+    # 새로 시작한 프로세스이므로 uvicorn 로깅 설정을 다시 적용
+    config.configure_logging()
+
+    listeners = list(sockets)
+    try:
+        listeners.append(_bind_unix_socket(worker_socket_path(index)))
+    except OSError as e:
+        # 전달 소켓 없이도 자기 세션은 처리 가능
+        logger.warning("워커 %s 전달 소켓 생성 실패: %s", index, e)
+
+    ShopCatchServer(config).run(sockets=listeners)
+
+
+def _start_worker(index: int, config: uvicorn.Config, sock: socket.socket):
+    process = _spawn.Process(target=_serve_worker, args=(index, config, [sock]), name=f"shopcatch-worker-{index}")
+    process.start()
+    return process
+
+
+def run_workers(config: uvicorn.Config, workers: int) -> None:
+    """
+    워커 프로세스 실행 및 감시
+
+    SIGINT/SIGTERM을 받으면 모든 워커에 SIGTERM을 보내고
+    각 워커가 진행 중 툴 호출을 정리할 때까지 기다립니다.
+    """
+    sock = config.bind_socket()
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+
+    logger.info("워커 %s개 시작 (부모 프로세스 %s)", workers, os.getpid())
+    processes = [_start_worker(index, config, sock) for index in range(workers)]
+
+    while not stop.wait(0.5):
+        for index, process in enumerate(processes):
+            if process.is_alive():
+                continue
+            if process.exitcode == STARTUP_FAILURE:
+                logger.error("워커 %s 시작 실패, 서버를 종료합니다", index)
+                stop.set()
+                break
+            logger.warning("워커 %s 비정상 종료 (exit %s), 다시 시작", index, process.exitcode)
+            processes[index] = _start_worker(index, config, sock)
+
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    join_timeout = settings.SHUTDOWN_DRAIN_TIMEOUT + settings.SHUTDOWN_CONNECTION_TIMEOUT + 5
+    for process in processes:
+        process.join(join_timeout)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+    sock.close()
+    for index in range(workers):
+        try:
+            os.remove(worker_socket_path(index))
+        except OSError:
+            pass
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    return b"".join(chunks)
+
+
+class SessionAffinityMiddleware:
+    """
+    SSE 세션 친화성 보장 (다중 워커)
+
+    SSE 스트림(GET /sse)과 메시지 전송(POST /messages/?session_id=...)이 서로 다른 워커로
+    연결되면 세션을 찾지 못해 404가 됩니다. 이 경우 다른 워커의 전용 소켓으로 요청을 전달하고,
+    성공한 워커를 세션별로 기억해 다음 메시지는 바로 전달합니다.
+    """
+
+    def __init__(self, app: Any, message_path: str, workers: Optional[int] = None):
+        self.app = app
+        self.message_path = message_path
+        self.workers = workers or settings.SERVER_WORKERS
+        self.index = current_worker()
+        self._owners: Dict[str, int] = {}
+        self._clients: Dict[int, httpx.AsyncClient] = {}
+
+        self.forwarded = 0
+        self.forward_failures = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not scope["path"].startswith(self.message_path)
+            or any(name == FORWARDED_HEADER.encode() for name, _ in scope["headers"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        session_id = (query.get("session_id") or [""])[0]
+
+        owner = self._owners.get(session_id)
+        if owner is not None and owner != self.index:
+            if await self._forward(owner, scope, body, send):
+                return
+            self._owners.pop(session_id, None)
+
+        # 이 워커에서 먼저 처리 (세션이 없어 404면 응답을 보류)
+        held: List[Dict[str, Any]] = []
+
+        async def capture(message) -> None:
+            if held or (message["type"] == "http.response.start" and message["status"] == 404):
+                held.append(message)
+                return
+            await send(message)
+
+        replayed = False
+
+        async def replay():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay, capture)
+        if not held:
+            return
+
+        for index in range(self.workers):
+            if index in (self.index, owner):
+                continue
+            if await self._forward(index, scope, body, send):
+                if len(self._owners) >= MAX_REMEMBERED_SESSIONS:
+                    self._owners.clear()
+                self._owners[session_id] = index
+                return
+
+        for message in held:
+            await send(message)
+
+    def _client(self, index: int) -> httpx.AsyncClient:
+        client = self._clients.get(index)
+        if client is None:
+            client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=worker_socket_path(index)),
+                base_url="http://worker",
+                timeout=FORWARD_TIMEOUT
+            )
+            self._clients[index] = client
+        return client
+
+    async def _forward(self, index: int, scope, body: bytes, send) -> bool:
+        """다른 워커로 메시지 전달 (그 워커에도 세션이 없거나 연결 실패 시 False)"""
+        headers = [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in scope["headers"] if name not in _HOP_HEADERS
+        ]
+        headers.append((FORWARDED_HEADER, str(self.index)))
+        url = scope["path"]
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode("latin-1")
+
+        try:
+            response = await self._client(index).post(url, content=body, headers=headers)
+        except httpx.HTTPError as e:
+            self.forward_failures += 1
+            logger.debug("워커 %s 전달 실패: %s", index, e)
+            return False
+        if response.status_code == 404:
+            return False
+
+        self.forwarded += 1
+        response_headers = [
+            (name, value) for name, value in response.headers.raw if name.lower() not in _HOP_HEADERS
+        ]
+        response_headers.append((b"content-length", str(len(response.content)).encode()))
+        await send({"type": "http.response.start", "status": response.status_code, "headers": response_headers})
+        await send({"type": "http.response.body", "body": response.content})
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker": self.index,
+            "forwarded": self.forwarded,
+            "forward_failures": self.forward_failures,
+            "remembered_sessions": len(self._owners)
+        }
@@ -0,0 +1,167 @@
+"""
+검색 결과 인메모리 캐시
+TTL + LRU(개수/바이트 제한) + stale-while-revalidate
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class CacheEntry:
+    """캐시 엔트리 (메모리 절약을 위해 __slots__ 사용)"""
+
+    __slots__ = ("value", "size", "expires_at", "stale_until")
+
+    def __init__(self, value: Any, size: int, expires_at: float, stale_until: float):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class SearchCache:
+    """
+    검색 응답 캐시 (단일 이벤트 루프 전용, 락 없음)
+
+    - TTL 이내: 신선한 응답 (hit)
+    - TTL ~ TTL + stale_ttl: 오래된 응답을 즉시 반환하고 백그라운드 갱신 (stale hit)
+    - 그 이후: 만료 (miss)
+    - 엔트리 개수 / 총 바이트 초과 시 LRU 순서로 제거
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl: float,
+        stale_ttl: float = 0.0
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+
+        # 통계 카운터
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(keyword: str, sort: str, display: int, start: int = 1) -> Tuple[str, str, int, int]:
+        """캐시 키 생성 (공백 정규화 + 소문자)"""
+        return (" ".join(keyword.split()).lower(), sort, display, start)
+
+    def get(self, key: Hashable) -> Tuple[Optional[Any], bool]:
+        """
+        캐시 조회
+
+        Returns:
+            (값, stale 여부) - 없거나 만료된 경우 (None, False)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None, False
+
+        now = time.monotonic()
+        if now < entry.expires_at:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value, False
+
+        if now < entry.stale_until:
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            return entry.value, True
+
+        self._remove(key)
+        self.expirations += 1
+        self.misses += 1
+        return None, False
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        size: int,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None
+    ) -> None:
+        """캐시 저장 (용량 초과 시 LRU 제거, ttl / stale_ttl 생략 시 기본값)"""
+        if size > self.max_bytes:
+            # 단일 엔트리가 전체 용량보다 크면 캐시하지 않음
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        now = time.monotonic()
+        ttl = self.ttl if ttl is None else ttl
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        self._entries[key] = CacheEntry(
+            value=value,
+            size=size,
+            expires_at=now + ttl,
+            stale_until=now + ttl + stale_ttl
+        )
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def export(self, limit: int) -> List[Tuple[Hashable, Any, float, float]]:
+        """
+        최근 사용 순으로 최대 limit개 엔트리 내보내기 (만료된 엔트리 제외)
+
+        Returns:
+            [(키, 값, 신선한 상태로 남은 시간, stale 응답 허용까지 남은 시간), ...]
+        """
+        now = time.monotonic()
+        exported = []
+        for key in reversed(self._entries):
+            if len(exported) >= limit:
+                break
+            entry = self._entries[key]
+            if entry.stale_until > now:
+                exported.append((key, entry.value, entry.expires_at - now, entry.stale_until - now))
+        return exported
+
+    def invalidate(self, key: Hashable) -> None:
+        """특정 키 삭제"""
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 통계"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0
+        }
@@ -0,0 +1,191 @@
+"""
+응답 캐시 스냅샷 (SQLite 파일)
+재시작 / 유휴 후 첫 요청부터 캐시가 채워진 상태로 시작하도록 인기 검색 결과를 주기적으로 저장
+
+- 저장: 최근 사용 순 상위 max_entries개를 임시 파일에 기록 후 원자적으로 교체 (쓰기 중 중단돼도 이전 스냅샷 유지)
+- 엔트리마다 CRC32 체크섬과 만료 시각(epoch)을 함께 저장
+- 읽기: 서버가 ready로 전환되기 전에 실행, 만료 / 체크섬 불일치 엔트리는 버림
+- 파일이 손상됐거나 형식 버전이 다르면 스냅샷 전체를 무시하고 빈 캐시로 시작
+"""
+import json
+import os
+import sqlite3
+import time
+import zlib
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from config import settings
+from utils.logger import logger
+from services.models import ShoppingItem, decode_items, encode_items
+
+
+SCHEMA = """
+CREATE TABLE meta (
+    name  TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE entries (
+    key         TEXT    PRIMARY KEY,
+    value       BLOB    NOT NULL,
+    checksum    INTEGER NOT NULL,
+    expires_at  REAL    NOT NULL,
+    stale_until REAL    NOT NULL
+);
+"""
+
+# 스냅샷 형식 버전 (ShoppingItem 필드 구성이 바뀌면 올림)
+SNAPSHOT_VERSION = "1"
+
+# (키, 검색 결과, 신선한 상태로 남은 시간, stale 응답 허용까지 남은 시간)
+SnapshotEntry = Tuple[Hashable, List[ShoppingItem], float, float]
+
+
+class CacheSnapshot:
+    """응답 캐시 스냅샷 파일 읽기 / 쓰기 (동기 함수, asyncio.to_thread로 호출)"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self.saved = 0
+        self.loaded = 0
+        self.dropped_expired = 0
+        self.dropped_corrupt = 0
+        self.save_errors = 0
+        self.load_errors = 0
+        self.last_saved_at: Optional[float] = None
+        self.last_save_ms = 0.0
+        self.last_load_ms = 0.0
+
+    @staticmethod
+    def _encode_key(key: Hashable) -> str:
+        return json.dumps(key, ensure_ascii=False)
+
+    @staticmethod
+    def _decode_key(text: str) -> Hashable:
+        key = json.loads(text)
+        return tuple(key) if isinstance(key, list) else key
+
+    def save(self, entries: List[SnapshotEntry]) -> int:
+        """
+        스냅샷 저장 (기존 파일은 기록이 끝난 뒤 교체)
+
+        Returns:
+            저장한 엔트리 수
+        """
+        started = time.perf_counter()
+        now = time.time()
+        rows = []
+        for key, items, fresh_for, stale_for in entries:
+            value = encode_items(items)
+            rows.append((self._encode_key(key), value, zlib.crc32(value), now + fresh_for, now + stale_for))
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.path}.tmp"
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+        try:
+            conn = sqlite3.connect(temporary)
+            try:
+                # 임시 파일이므로 저널 없이 기록, 교체 전에 fsync
+                conn.execute("PRAGMA journal_mode=OFF")
+                conn.execute("PRAGMA synchronous=OFF")
+                conn.executescript(SCHEMA)
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                        (("version", SNAPSHOT_VERSION), ("written_at", repr(now)))
+                    )
+                    conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+            finally:
+                conn.close()
+            with open(temporary, "rb") as written:
+                os.fsync(written.fileno())
+            os.replace(temporary, self.path)
+        except (OSError, sqlite3.Error) as e:
+            self.save_errors += 1
+            logger.warning("캐시 스냅샷 저장 실패: %s", e)
+            return 0
+
+        self.saved = len(rows)
+        self.last_saved_at = now
+        self.last_save_ms = round((time.perf_counter() - started) * 1000, 2)
+        return len(rows)
+
+    def load(self) -> List[SnapshotEntry]:
+        """
+        스냅샷 읽기 (최근 사용 순)
+
+        만료 / 체크섬 불일치 / 복원 실패 엔트리는 건너뛰고,
+        파일 자체를 읽을 수 없으면 빈 목록을 반환합니다.
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        started = time.perf_counter()
+        now = time.time()
+        try:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            try:
+                meta = dict(conn.execute("SELECT name, value FROM meta").fetchall())
+                if meta.get("version") != SNAPSHOT_VERSION:
+                    logger.warning("캐시 스냅샷 형식 버전 불일치 (%s), 무시합니다", meta.get("version"))
+                    return []
+                rows = conn.execute(
+                    "SELECT key, value, checksum, expires_at, stale_until FROM entries ORDER BY rowid"
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            self.load_errors += 1
+            logger.warning("캐시 스냅샷이 손상되어 무시합니다: %s", e)
+            return []
+
+        entries: List[SnapshotEntry] = []
+        for key, value, checksum, expires_at, stale_until in rows:
+            if stale_until <= now:
+                self.dropped_expired += 1
+                continue
+            if zlib.crc32(value) != checksum:
+                self.dropped_corrupt += 1
+                continue
+            try:
+                entries.append((self._decode_key(key), decode_items(value), expires_at - now, stale_until - now))
+            except (ValueError, TypeError) as e:
+                self.dropped_corrupt += 1
+                logger.debug("캐시 스냅샷 엔트리 복원 실패: %s", e)
+
+        self.loaded = len(entries)
+        self.last_load_ms = round((time.perf_counter() - started) * 1000, 2)
+        if self.dropped_corrupt:
+            logger.warning("캐시 스냅샷 손상 엔트리 %s개 제외", self.dropped_corrupt)
+        return entries
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "dropped_expired": self.dropped_expired,
+            "dropped_corrupt": self.dropped_corrupt,
+            "load_errors": self.load_errors,
+            "load_ms": self.last_load_ms,
+            "saved": self.saved,
+            "save_errors": self.save_errors,
+            "save_ms": self.last_save_ms,
+            "last_saved_age_sec": round(time.time() - self.last_saved_at, 1) if self.last_saved_at else None
+        }
+
+
+# 싱글톤 인스턴스
+_snapshot: Optional[CacheSnapshot] = None
+
+
+def get_cache_snapshot() -> Optional[CacheSnapshot]:
+    """캐시 스냅샷 반환 (CACHE_SNAPSHOT_PATH가 비어 있거나 캐시 비활성화 시 None)"""
+    global _snapshot
+    if not settings.CACHE_SNAPSHOT_PATH or not settings.CACHE_ENABLED:
+        return None
+    if _snapshot is None:
+        _snapshot = CacheSnapshot(settings.CACHE_SNAPSHOT_PATH)
+    return _snapshot
@@ -0,0 +1,206 @@
+"""
+서킷 브레이커
+슬라이딩 윈도우의 오류율 / 느린 응답 비율로 업스트림 장애를 감지해 빠르게 실패
+
+- closed: 모든 요청 허용, 윈도우 통계가 기준을 넘으면 open
+- open: open_seconds 동안 모든 요청 즉시 거부
+- half_open: 제한된 수의 시험 요청만 허용, 모두 성공하면 closed / 하나라도 실패하면 다시 open
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from utils.exceptions import CircuitOpenError
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 모니터링용 숫자 상태값
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """
+    단일 이벤트 루프 전용 서킷 브레이커 (락 없음)
+
+    윈도우는 1초 단위 버킷(window_seconds개)으로 나눠 요청 수 / 실패 수 / 느린 응답 수를 집계합니다.
+    """
+
+    def __init__(
+        self,
+        classify: Callable[[BaseException], Optional[bool]],
+        window_seconds: int = 30,
+        min_requests: int = 20,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 3.0,
+        slow_call_rate: float = 0.8,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 3
+    ):
+        """
+        Args:
+            classify: 예외 분류 함수 (True: 장애, False: 정상 응답, None: 판단에서 제외)
+        """
+        self.classify = classify
+        self.window_seconds = max(int(window_seconds), 1)
+        self.min_requests = min_requests
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.half_open_probes = max(half_open_probes, 1)
+
+        self.state = CLOSED
+        self.opened_until = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+        # 버킷: [초, 요청 수, 실패 수, 느린 응답 수]
+        self._buckets: List[List[int]] = [[-1, 0, 0, 0] for _ in range(self.window_seconds)]
+
+        self.rejected = 0
+        self.opened = 0
+
+    # ------------------------------------------------------------------
+    # 요청 허용 판단
+    # ------------------------------------------------------------------
+
+    def allow(self) -> bool:
+        """요청 허용 여부 (허용된 요청은 반드시 record 또는 release 호출)"""
+        if self.state == CLOSED:
+            return True
+
+        if self.state == OPEN:
+            if time.monotonic() < self.opened_until:
+                self.rejected += 1
+                return False
+            self.state = HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+
+        if self._probes_in_flight >= self.half_open_probes:
+            self.rejected += 1
+            return False
+        self._probes_in_flight += 1
+        return True
+
+    def reject_if_open(self) -> None:
+        """
+        차단 중이면 즉시 거절 (상태 변경 없음, 키 / 쿼터를 잡기 전 빠른 실패용)
+
+        Raises:
+            CircuitOpenError: 차단 중
+        """
+        if self.state == OPEN and time.monotonic() < self.opened_until:
+            self.rejected += 1
+            raise self._open_error()
+
+    def _open_error(self) -> CircuitOpenError:
+        return CircuitOpenError(
+            "네이버 API 일시 차단 (장애 감지)",
+            details={"retry_after": round(self.retry_after(), 1)}
+        )
+
+    def retry_after(self) -> float:
+        """open 상태 남은 시간 (초)"""
+        return max(self.opened_until - time.monotonic(), 0.0)
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        요청 1회 보호
+
+        Raises:
+            CircuitOpenError: 차단 중 (요청을 보내지 않음)
+        """
+        if not self.allow():
+            raise self._open_error()
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            failed = self.classify(e) if isinstance(e, Exception) else None
+            if failed is None:
+                self.release()
+            else:
+                self.record(not failed, time.monotonic() - started)
+            raise
+        self.record(True, time.monotonic() - started)
+
+    # ------------------------------------------------------------------
+    # 결과 기록
+    # ------------------------------------------------------------------
+
+    def release(self) -> None:
+        """판단에서 제외할 요청 종료 (취소 / 클라이언트 측 제한 등)"""
+        if self.state == HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def record(self, success: bool, duration: float) -> None:
+        slow = duration >= self.slow_call_seconds
+
+        if self.state == HALF_OPEN:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+            if not success or slow:
+                self._open()
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_probes:
+                self._close()
+            return
+
+        now = int(time.monotonic())
+        bucket = self._buckets[now % self.window_seconds]
+        if bucket[0] != now:
+            bucket[:] = [now, 0, 0, 0]
+        bucket[1] += 1
+        if not success:
+            bucket[2] += 1
+        if slow:
+            bucket[3] += 1
+
+        # 비율은 나쁜 결과가 들어올 때만 높아지므로 그때만 평가
+        if self.state == CLOSED and (not success or slow):
+            total, failures, slow_calls = self._window_totals(now)
+            if total >= self.min_requests and (
+                failures / total >= self.failure_rate or slow_calls / total >= self.slow_call_rate
+            ):
+                self._open()
+
+    def _window_totals(self, now: int):
+        total = failures = slow_calls = 0
+        oldest = now - self.window_seconds
+        for second, count, failed, slow in self._buckets:
+            if second > oldest:
+                total += count
+                failures += failed
+                slow_calls += slow
+        return total, failures, slow_calls
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened_until = time.monotonic() + self.open_seconds
+        self.opened += 1
+
+    def _close(self) -> None:
+        self.state = CLOSED
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        for bucket in self._buckets:
+            bucket[:] = [-1, 0, 0, 0]
+
+    def stats(self) -> Dict[str, Any]:
+        total, failures, slow_calls = self._window_totals(int(time.monotonic()))
+        return {
+            "state": self.state,
+            "state_value": STATE_VALUES[self.state],
+            "window_seconds": self.window_seconds,
+            "window_requests": total,
+            "failure_rate": round(failures / total, 4) if total else 0.0,
+            "slow_call_rate": round(slow_calls / total, 4) if total else 0.0,
+            "retry_after_sec": round(self.retry_after(), 1) if self.state == OPEN else 0,
+            "opened": self.opened,
+            "rejected": self.rejected
+        }
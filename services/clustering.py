@@ -0,0 +1,218 @@
+"""
+동일 상품 묶기 (판매처별 중복 목록 제거)
+같은 상품이 여러 판매처에 조금씩 다른 제목으로 올라온 목록을 상품 1개로 묶음
+
+1. 같은 productId는 바로 묶음
+2. 제목 토큰 shingle(단어 1-gram + 2-gram)의 MinHash 서명을 LSH 밴드로 나눠
+   같은 버킷에 들어온 후보 쌍만 실제 Jaccard 유사도로 확인 (전체 쌍 비교 없이 거의 선형 시간)
+3. 새상품/중고/단종 등 상품 유형이 다르거나 숫자가 들어간 규격 토큰(용량, 모델명 등)이
+   서로 어긋나면 제목이 비슷해도 묶지 않음
+
+numpy가 설치되어 있으면 MinHash 계산을 벡터화합니다. (없으면 순수 파이썬, 같은 해시라 결과 동일)
+"""
+import random
+import re
+import zlib
+from typing import FrozenSet, List, Optional, Sequence
+
+from services.models import SearchResults, ShoppingItem
+
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 시 순수 파이썬 구현 사용
+    np = None
+
+
+_TOKEN_PATTERN = re.compile(r"[0-9a-z가-힣]+")
+
+# 상품과 무관한 판매처 홍보 문구 (유사도 계산에서 제외)
+_NOISE_TOKENS = frozenset((
+    "무료배송", "당일발송", "당일출고", "정품", "국내정품", "정품인증", "공식", "공식판매처",
+    "공식인증", "특가", "할인", "최저가", "쿠폰", "새상품", "사은품", "증정", "빠른배송", "best"
+))
+
+# MinHash 해시: multiply-shift ((a * x + b) mod 2^64의 상위 32비트, a는 홀수)
+_PRIME = (1 << 61) - 1  # 계수 범위
+_MASK64 = (1 << 64) - 1
+
+# numpy 계산 시 한 번에 처리할 항목 수 (중간 배열 크기 제한)
+_NUMPY_CHUNK = 512
+
+
+class ProductGroup(ShoppingItem):
+    """
+    여러 판매처 목록을 묶은 상품 1개
+
+    대표 필드(제목, 링크, 최저가, 판매처)는 가장 싼 목록 기준이며
+    max_price / offers / mall_count로 가격 범위와 판매처 수를 함께 보관합니다.
+    """
+
+    __slots__ = ("max_price", "offers", "mall_count")
+
+    def __init__(self, cheapest: ShoppingItem, members: List[ShoppingItem]):
+        super().__init__(*(getattr(cheapest, field) for field in ShoppingItem.__slots__))
+        prices = [item.lprice for item in members if item.lprice > 0]
+        self.max_price = max(prices) if prices else cheapest.lprice
+        self.offers = len(members)
+        self.mall_count = len({item.mall_name for item in members if item.mall_name}) or 1
+
+    def __repr__(self) -> str:
+        return (
+            f"ProductGroup(offers={self.offers}, lprice={self.lprice}, "
+            f"max_price={self.max_price}, title={self.title!r})"
+        )
+
+
+def title_tokens(title: str) -> List[str]:
+    """상품명 토큰 (소문자 한글/영문/숫자 단위, 판매처 홍보 문구 제외)"""
+    return [token for token in _TOKEN_PATTERN.findall(title.lower()) if token not in _NOISE_TOKENS]
+
+
+def _shingles(tokens: List[str]) -> FrozenSet[str]:
+    return frozenset(tokens).union(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+
+
+def _condition(item: ShoppingItem) -> int:
+    """productType 1~3 새상품, 4~6 중고, 7~9 단종, 10~12 판매예정 (0 = 정보 없음)"""
+    return (item.product_type - 1) // 3 if item.product_type > 0 else -1
+
+
+def _compatible_specs(a: FrozenSet[str], b: FrozenSet[str]) -> bool:
+    """규격 토큰은 한쪽이 다른 쪽을 포함해야 함 (256gb vs 512gb는 다른 상품)"""
+    return a <= b or b <= a
+
+
+def _jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    return len(a & b) / len(a | b)
+
+
+def _permutations(num_perm: int):
+    rng = random.Random(1)
+    return (
+        [rng.randrange(1, _PRIME) | 1 for _ in range(num_perm)],
+        [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+    )
+
+
+def _signatures_numpy(hashed: List[List[int]], num_perm: int):
+    """shingle 해시를 묶음 단위로 이어 붙여 한 번에 계산 후 항목별 최솟값 (reduceat)"""
+    a, b = _permutations(num_perm)
+    # uint64 곱셈은 자연 오버플로 후 상위 32비트만 사용 (multiply-shift 해시)
+    a = np.array(a, dtype=np.uint64)[:, None]
+    b = np.array(b, dtype=np.uint64)[:, None]
+    signatures = np.empty((len(hashed), num_perm), dtype=np.uint64)
+
+    for start in range(0, len(hashed), _NUMPY_CHUNK):
+        chunk = hashed[start:start + _NUMPY_CHUNK]
+        lengths = np.fromiter((len(values) for values in chunk), dtype=np.int64, count=len(chunk))
+        flat = np.fromiter(
+            (value for values in chunk for value in values), dtype=np.uint64, count=int(lengths.sum())
+        )
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        mixed = (a * flat[None, :] + b) >> np.uint64(32)
+        signatures[start:start + len(chunk)] = np.minimum.reduceat(mixed, offsets, axis=1).T
+    return signatures
+
+
+def _signatures_python(hashed: List[List[int]], num_perm: int):
+    a, b = _permutations(num_perm)
+    return [
+        [min(((ai * value + bi) & _MASK64) >> 32 for value in values) for ai, bi in zip(a, b)]
+        for values in hashed
+    ]
+
+
+def cluster_items(
+    items: Sequence[ShoppingItem],
+    threshold: float = 0.6,
+    num_perm: int = 64,
+    bands: int = 16
+) -> List[ShoppingItem]:
+    """
+    판매처별 중복 목록을 상품 단위로 묶기
+
+    Args:
+        items: 검색 결과 (순서 = 검색 순위)
+        threshold: 같은 상품으로 볼 제목 shingle Jaccard 유사도
+        num_perm: MinHash 해시 함수 수
+        bands: LSH 밴드 수 (num_perm의 약수)
+
+    Returns:
+        상품 목록 (가장 높은 순위 목록의 위치 유지). 2개 이상 묶인 상품은 ProductGroup이며
+        가장 싼 목록이 대표가 됩니다. 입력의 stale_since는 그대로 유지됩니다.
+    """
+    stale_since: Optional[float] = getattr(items, "stale_since", None)
+    count = len(items)
+    if count < 2:
+        return SearchResults(items, stale_since=stale_since)
+
+    tokens = [title_tokens(item.title) for item in items]
+    shingles = [_shingles(words) for words in tokens]
+    conditions = [_condition(item) for item in items]
+    # 그룹(루트)별 규격 토큰 합집합 - 256gb 목록과 512gb 목록이 공통 목록을 거쳐 이어지지 않도록
+    specs = [frozenset(word for word in words if any(char.isdigit() for char in word)) for words in tokens]
+    parent = list(range(count))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(root_i: int, root_j: int) -> None:
+        # 순위가 높은(인덱스가 작은) 쪽을 루트로 유지
+        if root_j < root_i:
+            root_i, root_j = root_j, root_i
+        parent[root_j] = root_i
+        specs[root_i] = specs[root_i] | specs[root_j]
+
+    # 1. 같은 productId
+    first_by_id = {}
+    for index, item in enumerate(items):
+        if item.product_id:
+            root_i, root_j = find(first_by_id.setdefault(item.product_id, index)), find(index)
+            if root_i != root_j:
+                union(root_i, root_j)
+
+    # 2. 제목 유사도 (MinHash + LSH)
+    candidates = [index for index in range(count) if shingles[index]]
+    hashed = [[zlib.crc32(shingle.encode()) for shingle in shingles[index]] for index in candidates]
+    if np is not None:
+        signatures = _signatures_numpy(hashed, num_perm)
+        band_key = lambda position, start, stop: signatures[position, start:stop].tobytes()
+    else:
+        signatures = _signatures_python(hashed, num_perm)
+        band_key = lambda position, start, stop: tuple(signatures[position][start:stop])
+
+    rows = max(num_perm // bands, 1)
+    for start in range(0, rows * bands, rows):
+        buckets = {}
+        for position, index in enumerate(candidates):
+            buckets.setdefault((conditions[index], band_key(position, start, start + rows)), []).append(index)
+        # 버킷 안의 모든 후보 쌍 확인 (이미 같은 그룹이면 건너뜀)
+        for bucket in buckets.values():
+            for offset, i in enumerate(bucket):
+                for j in bucket[offset + 1:]:
+                    root_i, root_j = find(i), find(j)
+                    if (
+                        root_i != root_j
+                        and _compatible_specs(specs[root_i], specs[root_j])
+                        and _jaccard(shingles[i], shingles[j]) >= threshold
+                    ):
+                        union(root_i, root_j)
+
+    # 3. 그룹 구성 (루트 = 그룹 내 최고 순위)
+    members = {}
+    for index in range(count):
+        members.setdefault(find(index), []).append(items[index])
+
+    grouped = []
+    for root in sorted(members):
+        listing = members[root]
+        if len(listing) == 1:
+            grouped.append(listing[0])
+            continue
+        priced = [item for item in listing if item.lprice > 0]
+        cheapest = min(priced, key=lambda item: item.lprice) if priced else listing[0]
+        grouped.append(ProductGroup(cheapest, listing))
+    return SearchResults(grouped, stale_since=stale_since)
@@ -0,0 +1,253 @@
+"""
+네이버 API 인증키 풀
+여러 애플리케이션 키에 요청을 분산하고 키별 사용량/상태를 추적
+"""
+import time
+from typing import Any, Dict, List, Optional
+from utils.exceptions import ConfigurationError, NaverAPIError, QuotaExceededError, RateLimitError
+from services.rate_limiter import TokenBucket, DailyQuota, SharedDailyQuota
+
+
+class NaverCredential:
+    """인증키 1쌍과 키별 호출 제한/사용량 상태"""
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        weight: float,
+        rate: float,
+        burst: int,
+        daily_quota: int,
+        ledger: Any = None,
+        quota_lease_size: int = 1
+    ):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.weight = weight
+
+        # 네이버 호출 제한은 애플리케이션(키) 단위로 적용됨
+        # (다중 워커 모드에서는 일일 쿼터를 공유 장부로 워커 간 합산)
+        self.rate_limiter = TokenBucket(rate=rate, capacity=burst)
+        if ledger is not None:
+            self.quota: DailyQuota = SharedDailyQuota(daily_quota, ledger, client_id, quota_lease_size)
+        else:
+            self.quota = DailyQuota(daily_quota)
+
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.last_status: Optional[int] = None
+        self.benched_until = 0.0
+        self.bench_reason: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        """로그/모니터링용 마스킹된 키 ID"""
+        return f"{self.client_id[:4]}***"
+
+    def is_benched(self, now: float) -> bool:
+        return now < self.benched_until
+
+    def load(self) -> float:
+        """가중치 반영 사용량 (작을수록 우선 선택)"""
+        return (self.quota.used + self.in_flight) / self.weight
+
+    def stats(self, now: float) -> Dict[str, Any]:
+        benched = self.is_benched(now)
+        return {
+            "key": self.label,
+            "weight": self.weight,
+            "healthy": not benched and self.quota.remaining != 0,
+            "benched_for_sec": round(self.benched_until - now, 1) if benched else 0,
+            "bench_reason": self.bench_reason if benched else None,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+            "last_status": self.last_status,
+            "quota": self.quota.stats(),
+            "rate_limit": self.rate_limiter.stats()
+        }
+
+
+def parse_credentials(
+    primary_id: str,
+    primary_secret: str,
+    extra: str,
+    rate: float,
+    burst: int,
+    daily_quota: int,
+    ledger: Any = None,
+    quota_lease_size: int = 1
+) -> List[NaverCredential]:
+    """
+    설정값에서 인증키 목록 생성
+
+    Args:
+        primary_id / primary_secret: NAVER_CLIENT_ID / NAVER_CLIENT_SECRET
+        extra: NAVER_CREDENTIALS ("id:secret[:weight],id:secret[:weight]")
+        ledger: 워커 간 공유 쿼터 장부 (SharedState, 단일 워커는 None)
+
+    Raises:
+        ConfigurationError: 키가 없거나 형식이 잘못된 경우
+    """
+    pairs = []
+    if primary_id and primary_secret:
+        pairs.append((primary_id, primary_secret, 1.0))
+
+    for raw in extra.split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        parts = raw.split(":")
+        if len(parts) not in (2, 3) or not parts[0] or not parts[1]:
+            raise ConfigurationError(
+                "NAVER_CREDENTIALS 형식 오류 (id:secret[:weight])",
+                details={"entry": f"{parts[0][:4]}***"}
+            )
+        try:
+            weight = float(parts[2]) if len(parts) == 3 else 1.0
+        except ValueError:
+            raise ConfigurationError(
+                "NAVER_CREDENTIALS 가중치는 숫자여야 합니다",
+                details={"entry": f"{parts[0][:4]}***"}
+            )
+        pairs.append((parts[0], parts[1], max(weight, 0.01)))
+
+    # 같은 키가 중복 설정된 경우 하나만 사용
+    seen = set()
+    credentials = []
+    for client_id, client_secret, weight in pairs:
+        if client_id in seen:
+            continue
+        seen.add(client_id)
+        credentials.append(NaverCredential(
+            client_id, client_secret, weight, rate=rate, burst=burst, daily_quota=daily_quota,
+            ledger=ledger, quota_lease_size=quota_lease_size
+        ))
+
+    if not credentials:
+        raise ConfigurationError("네이버 API 인증키가 설정되지 않았습니다")
+    return credentials
+
+
+class CredentialPool:
+    """
+    가중치 기반 최소 사용량 스케줄링
+
+    - 쿼터가 남아 있고 일시 제외되지 않은 키 중 (사용량 + 진행 중 요청) / 가중치가 가장 작은 키 선택
+    - 429 응답 키는 bench_seconds, 401 응답 키는 auth_bench_seconds 동안 제외
+    """
+
+    def __init__(
+        self,
+        credentials: List[NaverCredential],
+        bench_seconds: float,
+        auth_bench_seconds: float
+    ):
+        self.credentials = credentials
+        self.bench_seconds = bench_seconds
+        self.auth_bench_seconds = auth_bench_seconds
+
+    def __len__(self) -> int:
+        return len(self.credentials)
+
+    async def replenish(self) -> None:
+        """차감 전 쿼터 준비 (공유 쿼터 예약분이 빈 키는 장부 예약을 기다림)"""
+        for credential in self.credentials:
+            await credential.quota.replenish()
+
+    def acquire(self) -> NaverCredential:
+        """
+        키 선택 및 일일 쿼터 1회 차감
+
+        Raises:
+            QuotaExceededError: 모든 키의 일일 쿼터 소진
+            RateLimitError: 남은 키가 모두 일시 제외됨
+        """
+        now = time.monotonic()
+        candidates = [
+            c for c in self.credentials
+            if not c.is_benched(now) and c.quota.remaining != 0
+        ]
+
+        # 공유 쿼터는 다른 워커가 먼저 소진했을 수 있으므로 차감에 실패하면 다음 키 시도
+        while candidates:
+            credential = min(candidates, key=NaverCredential.load)
+            if credential.quota.try_consume():
+                credential.in_flight += 1
+                return credential
+            candidates.remove(credential)
+
+        if all(c.quota.remaining == 0 for c in self.credentials):
+            first_reset = min(self.credentials, key=lambda c: c.quota.reset_at)
+            raise QuotaExceededError(
+                "일일 API 쿼터 소진",
+                details={
+                    "status_code": 429,
+                    "keys": len(self.credentials),
+                    "reset_at_kst": first_reset.quota.reset_time_kst()
+                }
+            )
+        raise RateLimitError(
+            "사용 가능한 API 키 없음 (일시 제외 중)",
+            details={"status_code": 429, "keys": len(self.credentials)}
+        )
+
+    def try_acquire_now(self) -> Optional[NaverCredential]:
+        """
+        대기 없이 호출 허가 획득 (쿼터와 초당 토큰이 모두 즉시 가능할 때만)
+
+        Returns:
+            선택된 키, 불가능하면 None
+        """
+        try:
+            credential = self.acquire()
+        except NaverAPIError:
+            return None
+        if not credential.rate_limiter.try_acquire():
+            self.cancel(credential)
+            return None
+        return credential
+
+    def cancel(self, credential: NaverCredential) -> None:
+        """전송하지 못한 요청 반환 (쿼터 환불)"""
+        credential.in_flight -= 1
+        credential.quota.refund()
+
+    def release(self, credential: NaverCredential, status_code: Optional[int], cancelled: bool = False) -> None:
+        """
+        요청 완료 보고 (429/401이면 일시 제외)
+
+        cancelled: 응답 전에 취소된 요청 (hedge 경쟁에서 진 요청 등, 쿼터는 쓰였으므로 환불하지 않고 통계에서만 제외)
+        """
+        credential.in_flight -= 1
+        if cancelled:
+            return
+        credential.requests += 1
+        credential.last_status = status_code
+
+        if status_code == 200:
+            return
+
+        credential.failures += 1
+        if status_code == 429:
+            credential.benched_until = time.monotonic() + self.bench_seconds
+            credential.bench_reason = "rate_limited"
+        elif status_code == 401:
+            credential.benched_until = time.monotonic() + self.auth_bench_seconds
+            credential.bench_reason = "unauthorized"
+
+    def close(self) -> None:
+        """종료 시 공유 쿼터 예약분 반납"""
+        for credential in self.credentials:
+            credential.quota.close()
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        keys = [c.stats(now) for c in self.credentials]
+        return {
+            "total": len(keys),
+            "healthy": sum(1 for k in keys if k["healthy"]),
+            "keys": keys
+        }
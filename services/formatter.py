@@ -2,16 +2,29 @@
 LLM 친화적 데이터 포매터
 토큰 효율성과 가독성을 동시에 최적화
 """
-from typing import List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple
+import csv
+import io
+import json
 import re
+from services.models import ShoppingItem
+from services.clustering import ProductGroup
+from utils.exceptions import ValidationError
+
+
+KST = timezone(timedelta(hours=9))
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
 
 
 def clean_html(text: str) -> str:
-    """HTML 태그 제거 (네이버 API는 <b> 태그를 포함함)"""
-    return re.sub(r'<[^>]+>', '', text)
+    """HTML 태그 제거 (검색 결과 제목은 디코딩 시 이미 제거됨)"""
+    return _TAG_PATTERN.sub('', text)
 
 
-def format_price(price: str) -> str:
+def format_price(price: int) -> str:
     """가격 포맷팅 (천 단위 구분)"""
     try:
         return f"{int(price):,}원"
@@ -19,52 +32,438 @@ def format_price(price: str) -> str:
         return f"{price}원"
 
 
-def format_shopping_results(items: List[Dict[str, Any]], keyword: str) -> str:
+OUTPUT_MODES = ("rich", "compact", "table", "json", "csv")
+
+# 텍스트 안내 문구를 덧붙여도 되는 모드 (json/csv는 파싱 가능해야 함)
+TEXT_OUTPUT_MODES = ("rich", "compact", "table")
+
+CATALOG_URL = "https://search.shopping.naver.com/catalog/"
+
+
+def short_link(item: ShoppingItem) -> str:
     """
-    네이버 쇼핑 검색 결과를 LLM이 이해하기 쉬운 형식으로 변환
+    가격비교(카탈로그) 상품은 짧은 카탈로그 URL로 대체
     
-    성능 최적화:
-    - 불필요한 필드 제거
-    - 토큰 수 최소화
-    - 시각적 구분자 활용
+    productType 1/4/7/10 = 가격비교 상품 (일반/중고/단종/판매예정)
     """
-    if not items:
-        return f"'{keyword}'에 대한 검색 결과가 없습니다. 다른 키워드로 검색해보세요."
-    
+    if item.product_id and item.product_type > 0 and (item.product_type - 1) % 3 == 0:
+        return CATALOG_URL + item.product_id
+    return item.link
+
+
+def _truncate(text: str, limit: int) -> str:
+    if limit and len(text) > limit:
+        return text[:limit - 1] + "…"
+    return text
+
+
+def _price_range(item: ShoppingItem) -> str:
+    """묶인 상품은 가격 범위 + 판매처 수 (예: 10,000~12,000원, 3곳)"""
+    if isinstance(item, ProductGroup) and item.max_price > item.lprice:
+        return f"{item.lprice:,}~{item.max_price:,}원 ({item.mall_count}곳)"
+    if isinstance(item, ProductGroup):
+        return f"{item.lprice:,}원 ({item.mall_count}곳)"
+    return f"{item.lprice:,}원"
+
+
+def _render_rich(items: List[ShoppingItem], keyword: str, total: int, title_limit: int, shorten: bool) -> str:
     result_lines = [
-        f"🔍 '{keyword}' 검색 결과 (총 {len(items)}개)\n",
+        f"🔍 '{keyword}' 검색 결과 (총 {total}개)\n",
         "─" * 60
     ]
     
     for idx, item in enumerate(items, 1):
-        title = clean_html(item.get('title', '제목 없음'))
-        price = format_price(item.get('lprice', '0'))
-        link = item.get('link', '')
-        brand = item.get('brand', '').strip()
-        mall_name = item.get('mallName', '').strip()
-        
         # 간결하면서도 정보량이 풍부한 포맷
         product_info = [
-            f"\n📦 {idx}. {title}",
-            f"   💰 최저가: {price}"
+            f"\n📦 {idx}. {_truncate(item.title, title_limit)}",
+            f"   💰 최저가: {format_price(item.lprice)}"
         ]
         
         # 선택적 정보 추가 (있을 때만)
-        if brand:
-            product_info.append(f"   🏷️  브랜드: {brand}")
-        if mall_name:
-            product_info.append(f"   🏬 판매처: {mall_name}")
+        if isinstance(item, ProductGroup):
+            product_info.append(
+                f"   📊 가격 범위: {_price_range(item)} - 판매 목록 {item.offers}개"
+            )
+        if item.brand:
+            product_info.append(f"   🏷️  브랜드: {item.brand}")
+        if item.mall_name:
+            label = "최저가 판매처" if isinstance(item, ProductGroup) else "판매처"
+            product_info.append(f"   🏬 {label}: {item.mall_name}")
         
-        product_info.append(f"   🔗 구매링크: {link}")
+        product_info.append(f"   🔗 구매링크: {short_link(item) if shorten else item.link}")
         
         result_lines.extend(product_info)
     
+    if len(items) < total:
+        result_lines.append(f"\n… 외 {total - len(items)}개 생략")
+    
     result_lines.append("\n" + "─" * 60)
     result_lines.append("💡 가격은 실시간으로 변동될 수 있습니다.")
     
     return "\n".join(result_lines)
 
 
+def _render_compact(items: List[ShoppingItem], keyword: str, total: int, title_limit: int, shorten: bool) -> str:
+    lines = [f"'{keyword}' 검색 결과 {total}개 (상품명 | 최저가 | 판매처 | 링크)"]
+    for idx, item in enumerate(items, 1):
+        link = short_link(item) if shorten else item.link
+        lines.append(f"{idx}. {_truncate(item.title, title_limit)} | {_price_range(item)} | {item.mall_name} | {link}")
+    if len(items) < total:
+        lines.append(f"… 외 {total - len(items)}개 생략")
+    return "\n".join(lines)
+
+
+def _render_table(items: List[ShoppingItem], keyword: str, total: int, title_limit: int, shorten: bool) -> str:
+    lines = [
+        f"'{keyword}' 검색 결과 {total}개",
+        "| # | 상품명 | 최저가 | 판매처 | 링크 |",
+        "|---|---|---:|---|---|"
+    ]
+    for idx, item in enumerate(items, 1):
+        title = _truncate(item.title, title_limit).replace("|", "/")
+        link = short_link(item) if shorten else item.link
+        lines.append(f"| {idx} | {title} | {_price_range(item)} | {item.mall_name} | {link} |")
+    if len(items) < total:
+        lines.append(f"\n… 외 {total - len(items)}개 생략")
+    return "\n".join(lines)
+
+
+def _json_item(item: ShoppingItem, title_limit: int, shorten: bool) -> Dict[str, Any]:
+    entry = {
+        "title": _truncate(item.title, title_limit),
+        "price": item.lprice,
+        "mall": item.mall_name,
+        "brand": item.brand,
+        "link": short_link(item) if shorten else item.link
+    }
+    if isinstance(item, ProductGroup):
+        entry.update(max_price=item.max_price, offers=item.offers, malls=item.mall_count)
+    return entry
+
+
+def _render_json(
+    items: List[ShoppingItem],
+    keyword: str,
+    total: int,
+    title_limit: int,
+    shorten: bool,
+    extra: Optional[Dict[str, Any]] = None
+) -> str:
+    payload = {"keyword": keyword, "total": total, **(extra or {})}
+    payload["items"] = [_json_item(item, title_limit, shorten) for item in items]
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _render_csv(items: List[ShoppingItem], keyword: str, total: int, title_limit: int, shorten: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    # 묶인 상품이 있을 때만 가격 범위 / 판매처 수 열 추가
+    grouped = any(isinstance(item, ProductGroup) for item in items)
+    header = ("title", "price", "mall", "brand", "link")
+    writer.writerow(header + ("max_price", "offers", "malls") if grouped else header)
+    for item in items:
+        row = (
+            _truncate(item.title, title_limit),
+            item.lprice,
+            item.mall_name,
+            item.brand,
+            short_link(item) if shorten else item.link
+        )
+        if grouped:
+            row += (
+                (item.max_price, item.offers, item.mall_count)
+                if isinstance(item, ProductGroup) else (item.lprice, 1, 1)
+            )
+        writer.writerow(row)
+    return buffer.getvalue().rstrip("\n")
+
+
+_RENDERERS = {
+    "rich": _render_rich,
+    "compact": _render_compact,
+    "table": _render_table,
+    "json": _render_json,
+    "csv": _render_csv,
+}
+
+def _stale_time(stale_since: float) -> str:
+    return datetime.fromtimestamp(stale_since, KST).strftime("%m-%d %H:%M")
+
+
+def _stale_notice(stale_since: Optional[float], mode: str) -> str:
+    """이전 결과 안내 문구 (정상 결과면 빈 문자열, 결과 앞에 붙일 줄, json은 _stale_fields 사용)"""
+    if stale_since is None:
+        return ""
+    if mode == "csv":
+        return f"# stale as_of={datetime.fromtimestamp(stale_since, KST).isoformat(timespec='seconds')}\n"
+    return f"⚠️ 네이버 API 장애로 {_stale_time(stale_since)} (KST) 기준 이전 결과입니다. 현재 가격과 다를 수 있습니다.\n\n"
+
+
+def _stale_fields(stale_since: Optional[float]) -> Dict[str, Any]:
+    """json 출력의 이전 결과 표시 필드 (정상 결과면 빈 딕셔너리)"""
+    if stale_since is None:
+        return {}
+    return {"stale": True, "as_of": datetime.fromtimestamp(stale_since, KST).isoformat(timespec="seconds")}
+
+
+# 예산 초과 시 순서대로 시도하는 축약 단계: (제목 최대 길이, 링크 축약 여부)
+_SHRINK_STEPS = ((0, True), (40, True), (20, True))
+
+
+def format_shopping_results(
+    items: List[ShoppingItem],
+    keyword: str,
+    mode: str = "rich",
+    max_chars: int = 0
+) -> str:
+    """
+    네이버 쇼핑 검색 결과를 LLM이 이해하기 쉬운 형식으로 변환
+    
+    성능 최적화:
+    - 불필요한 필드 제거
+    - 토큰 수 최소화 (compact/table/json/csv 모드)
+    - 시각적 구분자 활용 (rich 모드)
+    
+    Args:
+        items: 검색 결과
+        keyword: 검색어
+        mode: 출력 형식 (rich, compact, table, json, csv)
+        max_chars: 최대 글자 수 (0이면 제한 없음). 초과 시 링크 축약 → 제목 축약 →
+            뒤쪽 상품 생략 순으로 줄임
+    
+    업스트림 장애로 받은 이전 결과(items.stale_since)는 조회 시각과 함께 표시합니다.
+    (json: stale / as_of 필드, csv: 첫 줄 주석, 그 외: 안내 문구)
+    json은 예산 안에서도 항상 유효한 JSON을 반환합니다. (상품을 생략하면 truncated 필드,
+    상품 1개도 들어가지 않으면 상품 없이 keyword / total만 담은 객체)
+    
+    Raises:
+        ValidationError: 지원하지 않는 출력 형식
+    """
+    render = _RENDERERS.get(mode)
+    if render is None:
+        raise ValidationError(f"출력 형식은 {', '.join(OUTPUT_MODES)} 중 하나여야 합니다.")
+    
+    if not items:
+        return f"'{keyword}'에 대한 검색 결과가 없습니다. 다른 키워드로 검색해보세요."
+    
+    stale_since = getattr(items, "stale_since", None)
+    notice = ""
+    if mode == "json":
+        fields = _stale_fields(stale_since)
+        render = partial(_render_json, extra=fields)
+    else:
+        notice = _stale_notice(stale_since, mode)
+    if max_chars:
+        max_chars = max(max_chars - len(notice), 1)
+    
+    total = len(items)
+    result = render(items, keyword, total, 0, False)
+    if not max_chars or len(result) <= max_chars:
+        return notice + result
+    
+    for title_limit, shorten in _SHRINK_STEPS:
+        result = render(items, keyword, total, title_limit, shorten)
+        if len(result) <= max_chars:
+            return notice + result
+    
+    # 가장 많이 담을 수 있는 상품 수를 이분 탐색
+    title_limit, shorten = _SHRINK_STEPS[-1]
+    if mode == "json":
+        render = partial(_render_json, extra={**fields, "truncated": True})
+    low, high = 1, total - 1
+    best = render(items[:1], keyword, total, title_limit, shorten)
+    while low <= high:
+        middle = (low + high) // 2
+        candidate = render(items[:middle], keyword, total, title_limit, shorten)
+        if len(candidate) <= max_chars:
+            best, low = candidate, middle + 1
+        else:
+            high = middle - 1
+    
+    if len(best) > max_chars:
+        if mode == "json":
+            # 글자 단위로 자르면 JSON이 깨지므로 상품 없이 최소 객체 반환
+            best = render([], keyword, total, title_limit, shorten)
+        else:
+            best = _truncate(best, max_chars)
+    return notice + best
+
+
+def format_comparison_results(results: List[Tuple[str, Any]]) -> str:
+    """
+    다중 키워드 비교 결과 포맷팅 (키워드당 한 줄)
+    
+    Args:
+        results: (키워드, 결과 리스트 또는 예외) 목록
+    """
+    lines = [f"📊 가격 비교 (총 {len(results)}개 키워드)"]
+    failures = []
+    
+    for idx, (keyword, outcome) in enumerate(results, 1):
+        if isinstance(outcome, BaseException):
+            message = outcome.to_user_message() if hasattr(outcome, "to_user_message") else str(outcome)
+            failures.append(f"- {keyword}: {message}")
+            continue
+        
+        priced = [item for item in outcome if item.lprice > 0]
+        if not priced:
+            lines.append(f"{idx}. {keyword} → 검색 결과 없음")
+            continue
+        
+        best = min(priced, key=lambda item: item.lprice)
+        line = f"{idx}. {keyword} → {format_price(best.lprice)} | {best.title}"
+        if best.mall_name:
+            line += f" | {best.mall_name}"
+        line += f" | {best.link}"
+        stale_since = getattr(outcome, "stale_since", None)
+        if stale_since is not None:
+            line += f" (⚠️ {_stale_time(stale_since)} 기준 이전 결과)"
+        lines.append(line)
+    
+    if failures:
+        lines.append("\n⚠️ 조회 실패")
+        lines.extend(failures)
+    
+    lines.append("\n💡 가격은 실시간으로 변동될 수 있습니다.")
+    return "\n".join(lines)
+
+
+def format_price_stats(stats: Dict[str, Any], keyword: str) -> str:
+    """가격 통계 분석 결과 포맷팅"""
+    cheapest = stats["cheapest_item"]
+    percentiles = stats["percentiles"]
+    
+    lines = [
+        f"📈 '{keyword}' 가격 분석 (표본 {stats['sample_size']}개 중 {stats['count']}개 반영)",
+        f"💰 현실적인 최저가: {format_price(stats['min'])}",
+        f"   {cheapest.title} | {cheapest.mall_name} | {cheapest.link}",
+        f"📊 중앙값 {format_price(int(percentiles[50]))} | "
+        f"하위 10% {format_price(int(percentiles[10]))} | 상위 10% {format_price(int(percentiles[90]))} | "
+        f"최고 {format_price(stats['max'])}",
+    ]
+    
+    if stats.get("category"):
+        lines.append(f"🏷️  기준 카테고리: {stats['category']}")
+    lines.append(
+        f"🧹 제외: 다른 카테고리 {stats['category_rejected']}개, 이상치 {stats['outliers']}개"
+    )
+    
+    lines.append("\n가격 분포:")
+    peak = max(bucket["count"] for bucket in stats["histogram"]) or 1
+    for bucket in stats["histogram"]:
+        bar = "█" * max(1 if bucket["count"] else 0, round(bucket["count"] / peak * 20))
+        lines.append(f"  {bucket['from']:>10,} ~ {bucket['to']:>10,}원 {bar} {bucket['count']}")
+    
+    lines.append("\n💡 가격은 실시간으로 변동될 수 있습니다.")
+    return "\n".join(lines)
+
+
+def format_price_trend(
+    keyword: str,
+    trend: List[Dict[str, Any]],
+    all_time_low: Dict[str, Any],
+    current_price: int,
+    days: int
+) -> str:
+    """가격 추이 포맷팅 (일별 최저가 + 역대 최저가)"""
+    lines = [f"📉 '{keyword}' 최근 {days}일 가격 추이"]
+    
+    if trend:
+        first, last = trend[0]["min_price"], trend[-1]["min_price"]
+        lines.append("─" * 40)
+        for point in trend:
+            lines.append(f"  {point['date']}  {format_price(point['min_price'])}")
+        lines.append("─" * 40)
+        
+        change = last - first
+        if change < 0:
+            lines.append(f"⬇️ {trend[0]['date']} 대비 {format_price(-change)} 하락 ({change / first:.1%})")
+        elif change > 0:
+            lines.append(f"⬆️ {trend[0]['date']} 대비 {format_price(change)} 상승 (+{change / first:.1%})")
+        else:
+            lines.append(f"➡️ {trend[0]['date']} 대비 변동 없음")
+    
+    if current_price:
+        lines.append(f"💰 현재 최저가: {format_price(current_price)}")
+    
+    if all_time_low:
+        observed = datetime.fromtimestamp(all_time_low["observed_at"], KST).strftime("%Y-%m-%d")
+        lines.append(
+            f"🏆 역대 최저가: {format_price(all_time_low['lprice'])} ({observed}, {all_time_low['mall_name']})"
+        )
+        if all_time_low["title"]:
+            lines.append(f"   {all_time_low['title']} | {all_time_low['link']}")
+    
+    if not trend:
+        lines.append("ℹ️ 아직 쌓인 가격 기록이 적습니다. 검색할수록 추이가 정확해집니다.")
+    
+    return "\n".join(lines)
+
+
+def format_suggestions(query: str, suggestions: Dict[str, Any]) -> str:
+    """검색어 추천 (자동 완성 + 교정 제안) 포맷팅"""
+    lines = []
+    if suggestions["did_you_mean"]:
+        lines.append("🔤 혹시 이 검색어를 찾으셨나요? " + ", ".join(f"'{term}'" for term in suggestions["did_you_mean"]))
+    if suggestions["completions"]:
+        lines.append(f"🔎 '{query}' 추천 검색어")
+        for rank, (term, _) in enumerate(suggestions["completions"], 1):
+            lines.append(f"  {rank}. {term}")
+    if not lines:
+        lines.append(f"'{query}'에 대한 추천 검색어가 없습니다. 검색 기록이 쌓일수록 추천이 정확해집니다.")
+    return "\n".join(lines)
+
+
+def _kst(timestamp: float, fmt: str = "%m-%d %H:%M") -> str:
+    return datetime.fromtimestamp(timestamp, KST).strftime(fmt)
+
+
+def format_price_watch_added(watch: Dict[str, Any]) -> str:
+    """가격 알림 등록 결과 포맷팅"""
+    lines = [
+        f"🔔 가격 알림 등록 (#{watch['id']})",
+        f"   '{watch['keyword']}' 최저가가 {format_price(watch['target_price'])} 이하가 되면 알려드립니다."
+    ]
+    if watch["last_price"]:
+        lines.append(f"💰 최근 확인한 최저가: {format_price(watch['last_price'])}")
+    if watch["shared_with"]:
+        lines.append(f"ℹ️ 같은 상품의 다른 알림 {watch['shared_with']}개와 함께 확인합니다.")
+    lines.append("💡 list_price_alerts로 도달 알림을 확인하세요.")
+    return "\n".join(lines)
+
+
+def format_price_alerts(alerts: List[Dict[str, Any]], watches: List[Dict[str, Any]], only_new: bool = True) -> str:
+    """가격 알림 (목표가 도달 내역 + 감시 중인 목록) 포맷팅"""
+    lines = []
+    if alerts:
+        lines.append(f"🔔 목표가 도달 알림 {len(alerts)}건")
+        lines.append("─" * 40)
+        for alert in alerts:
+            marker = "🆕 " if alert["new"] else ""
+            lines.append(
+                f"{marker}#{alert['watch_id']} '{alert['keyword']}' {format_price(alert['price'])} "
+                f"(목표 {format_price(alert['target_price'])}, {_kst(alert['triggered_at'])})"
+            )
+            lines.append(f"   {alert['title']} | {alert['mall_name']} | {alert['link']}")
+        lines.append("─" * 40)
+    else:
+        lines.append("🔕 새로 도달한 알림이 없습니다." if only_new else "🔕 도달한 알림이 없습니다.")
+
+    if watches:
+        lines.append(f"👀 감시 중 {len(watches)}개")
+        for watch in watches:
+            current = format_price(watch["last_price"]) if watch["last_price"] else "확인 전"
+            next_check = f", 다음 확인 {_kst(watch['next_poll_at'])}" if watch["next_poll_at"] else ""
+            lines.append(
+                f"  #{watch['id']} '{watch['keyword']}' 목표 {format_price(watch['target_price'])} | "
+                f"현재 {current}{next_check}"
+            )
+    elif not alerts:
+        lines.append("ℹ️ 등록된 가격 알림이 없습니다. add_price_watch로 등록하세요.")
+
+    return "\n".join(lines)
+
+
 def format_error_message(error_type: str, details: str = "") -> str:
     """에러 메시지 포맷팅 (사용자 친화적)"""
     error_templates = {
@@ -82,7 +481,52 @@ def format_error_message(error_type: str, details: str = "") -> str:
     return base_message
 
 
+_CIRCUIT_LABELS = {
+    "closed": "정상",
+    "half_open": "복구 확인 중",
+    "open": "차단 (장애 감지)",
+}
+
+
 def format_health_status(status: Dict[str, Any]) -> str:
-    """헬스체크 결과 포맷팅"""
+    """
+    헬스체크 결과 포맷팅
+    
+    Args:
+        status: 서버 상태 (status, healthy, in_flight, uptime_sec) +
+            선택 항목 circuit_breaker / admission / cache / credentials / fallbacks_served
+    """
     emoji = "✅" if status.get("healthy") else "❌"
-    return f"{emoji} 서버 상태: {status.get('status', 'unknown')}"
+    lines = [f"{emoji} 서버 상태: {status.get('status', 'unknown')}"]
+    
+    if "in_flight" in status:
+        lines.append(f"   처리 중 {status['in_flight']}건 | 가동 {status.get('uptime_sec', 0)}초")
+    
+    breaker = status.get("circuit_breaker")
+    if breaker:
+        state = breaker.get("state", "unknown")
+        line = f"🔌 네이버 API: {_CIRCUIT_LABELS.get(state, state)}"
+        line += f" | 최근 {breaker.get('window_seconds', 0)}초 오류율 {breaker.get('failure_rate', 0) * 100:.1f}%"
+        if breaker.get("retry_after_sec"):
+            line += f" | {breaker['retry_after_sec']}초 후 재시도"
+        lines.append(line)
+        if status.get("fallbacks_served"):
+            lines.append(f"   장애 중 이전 결과 제공 {status['fallbacks_served']}회")
+    
+    admission = status.get("admission")
+    if admission:
+        shed = sum(admission.get("shed", {}).values())
+        lines.append(
+            f"🚦 동시 실행 {admission.get('in_flight', 0)}/{admission.get('max_concurrent', 0)} | "
+            f"대기 {admission.get('queued', 0)}건 | 거절 누적 {shed}건"
+        )
+    
+    cache = status.get("cache")
+    if cache:
+        lines.append(f"🗂️ 캐시: {cache.get('entries', 0)}개 | 적중률 {cache.get('hit_ratio', 0) * 100:.1f}%")
+    
+    credentials = status.get("credentials")
+    if credentials:
+        lines.append(f"🔑 API 키: {credentials.get('healthy', 0)}/{credentials.get('total', 0)} 사용 가능")
+    
+    return "\n".join(lines)
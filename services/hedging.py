@@ -0,0 +1,93 @@
+"""
+Hedged 요청 보조 도구
+최근 응답 지연 분위수 추적 (hedge 임계값) + 전체 요청 대비 hedge 비율 제한
+"""
+from typing import Any, Dict, List
+
+
+class LatencyTracker:
+    """
+    최근 성공 응답 지연의 분위수 추적
+
+    고정 크기 링 버퍼에 기록하고, 임계값은 refresh_every 건마다 다시 계산합니다.
+    (요청마다 정렬하지 않도록)
+    """
+
+    def __init__(
+        self,
+        quantile: float,
+        initial: float,
+        floor: float,
+        window: int = 512,
+        min_samples: int = 50,
+        refresh_every: int = 32
+    ):
+        self.quantile = quantile
+        self.floor = floor
+        self.min_samples = min_samples
+        self.refresh_every = refresh_every
+        self._samples: List[float] = [0.0] * window
+        self._index = 0
+        self._count = 0
+        self._since_refresh = 0
+        self._threshold = max(initial, floor)
+
+    def observe(self, seconds: float) -> None:
+        self._samples[self._index] = seconds
+        self._index = (self._index + 1) % len(self._samples)
+        if self._count < len(self._samples):
+            self._count += 1
+        self._since_refresh += 1
+        if self._count >= self.min_samples and self._since_refresh >= self.refresh_every:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        window = sorted(self._samples[:self._count])
+        position = min(int(len(window) * self.quantile), len(window) - 1)
+        self._threshold = max(window[position], self.floor)
+        self._since_refresh = 0
+
+    def threshold(self) -> float:
+        """hedge 요청을 보낼 대기 시간 (초)"""
+        return self._threshold
+
+    def stats(self) -> Dict[str, Any]:
+        return {"samples": self._count, "threshold_ms": round(self._threshold * 1000, 1)}
+
+
+class HedgeBudget:
+    """
+    hedge 요청 비율 상한
+
+    일반 요청마다 ratio 만큼 적립하고 hedge 1회에 1을 소모합니다.
+    (ratio=0.05 → 장기적으로 전체 요청의 5% 이하, 최대 burst 회까지 몰아서 사용 가능)
+    """
+
+    def __init__(self, ratio: float, burst: float = 10.0):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = 0.0
+        self.requests = 0
+        self.hedged = 0
+        self.won = 0
+        self.skipped = 0
+
+    def on_request(self) -> None:
+        self.requests += 1
+        self.tokens = min(self.tokens + self.ratio, self.burst)
+
+    def available(self) -> bool:
+        return self.tokens >= 1.0
+
+    def spend(self) -> None:
+        self.tokens -= 1.0
+        self.hedged += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "won": self.won,
+            "skipped": self.skipped,
+            "tokens": round(self.tokens, 2)
+        }
@@ -0,0 +1,131 @@
+"""
+검색 결과 데이터 모델
+API 응답에서 사용하는 필드만 추출해 가벼운 객체로 보관
+"""
+import json
+import re
+import sys
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    _loads = json.loads
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def _to_int(value: Any) -> int:
+    """가격 문자열을 정수로 변환 (빈 값/잘못된 값은 0)"""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+class ShoppingItem:
+    """
+    네이버 쇼핑 검색 결과 1건
+
+    - 가격은 int로 변환 (가격 없음 = 0)
+    - 제목의 <b> 태그는 디코딩 시 한 번만 제거
+    - image, maker 등 사용하지 않는 필드는 보관하지 않음
+    """
+
+    __slots__ = (
+        "title", "link", "lprice", "hprice", "mall_name", "product_id",
+        "product_type", "brand", "category1", "category2", "category3"
+    )
+
+    def __init__(
+        self,
+        title: str,
+        link: str,
+        lprice: int,
+        hprice: int = 0,
+        mall_name: str = "",
+        product_id: str = "",
+        product_type: int = 0,
+        brand: str = "",
+        category1: str = "",
+        category2: str = "",
+        category3: str = ""
+    ):
+        self.title = title
+        self.link = link
+        self.lprice = lprice
+        self.hprice = hprice
+        self.mall_name = mall_name
+        self.product_id = product_id
+        self.product_type = product_type
+        self.brand = brand
+        self.category1 = category1
+        self.category2 = category2
+        self.category3 = category3
+
+    @classmethod
+    def from_api(cls, raw: Dict[str, Any]) -> "ShoppingItem":
+        """API 응답 항목(dict)에서 생성"""
+        return cls(
+            title=_TAG_PATTERN.sub("", raw.get("title") or "") or "제목 없음",
+            link=raw.get("link") or "",
+            lprice=_to_int(raw.get("lprice")),
+            hprice=_to_int(raw.get("hprice")),
+            mall_name=(raw.get("mallName") or "").strip(),
+            product_id=raw.get("productId") or "",
+            product_type=_to_int(raw.get("productType")),
+            brand=(raw.get("brand") or "").strip(),
+            category1=raw.get("category1") or "",
+            category2=raw.get("category2") or "",
+            category3=raw.get("category3") or ""
+        )
+
+    def approx_size(self) -> int:
+        """캐시 용량 계산용 메모리 크기 추정 (바이트)"""
+        return sys.getsizeof(self) + sum(
+            sys.getsizeof(getattr(self, field)) for field in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        return f"ShoppingItem(product_id={self.product_id!r}, lprice={self.lprice}, title={self.title!r})"
+
+
+class SearchResults(list):
+    """
+    검색 결과 목록
+
+    업스트림 장애로 마지막 정상 결과를 대신 반환한 경우 stale_since에
+    원래 조회 시각(epoch 초)이 기록됩니다. (정상 결과는 None)
+    """
+
+    __slots__ = ("stale_since",)
+
+    def __init__(self, items=(), stale_since: Optional[float] = None):
+        super().__init__(items)
+        self.stale_since = stale_since
+
+
+def decode_search_response(content: bytes) -> List[ShoppingItem]:
+    """
+    검색 API 응답 본문 디코딩 (orjson 사용 가능 시 우선 사용)
+
+    원본 dict는 변환 직후 버려지므로 필요한 필드만 메모리에 남습니다.
+    """
+    data = _loads(content)
+    return [ShoppingItem.from_api(raw) for raw in data.get("items") or ()]
+
+
+def encode_items(items: List[ShoppingItem]) -> bytes:
+    """프로세스 간 공유용 직렬화 (필드 순서대로 배열)"""
+    return _dumps([[getattr(item, field) for field in ShoppingItem.__slots__] for item in items])
+
+
+def decode_items(content: bytes) -> List[ShoppingItem]:
+    """encode_items 결과 복원"""
+    return [ShoppingItem(*fields) for fields in _loads(content)]
@@ -2,44 +2,245 @@
 네이버 쇼핑 API 클라이언트
 비동기, 재시도, 타임아웃 등 프로덕션 그레이드 구현
 """
+import asyncio
+import time
+from contextlib import nullcontext
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import (
+    List, Dict, Any, Optional, Set, Hashable, Callable, Awaitable, TypeVar, AsyncIterator, Tuple
+)
 from config import settings
 from utils.logger import logger
-from utils.exceptions import NaverAPIError, NetworkError, ValidationError
+from utils.metrics import (
+    UPSTREAM_ERRORS, UPSTREAM_HEDGES, UPSTREAM_IN_FLIGHT, UPSTREAM_LATENCY, UPSTREAM_RESPONSE_BYTES
+)
+from utils.exceptions import (
+    NaverAPIError, NetworkError, ValidationError, RateLimitError, DeadlineExceededError,
+    QuotaExceededError, CircuitOpenError
+)
+from utils.deadline import detached, remaining
+from utils.tracing import http_extensions, span, untraced
+from services.cache import SearchCache
+from services.credentials import CredentialPool, NaverCredential, parse_credentials
+from services.price_history import get_price_history
+from services.suggest import get_suggest_index
+from services.shared_state import SharedCache, get_shared_state
+from services.models import SearchResults, ShoppingItem, decode_search_response
+from services.circuit_breaker import CircuitBreaker
+from services.hedging import HedgeBudget, LatencyTracker
+
+
+T = TypeVar("T")
+
+# 네이버 쇼핑 API 페이지 제한 (display 최대 100, start 최대 1000)
+MAX_DISPLAY = 100
+MAX_START = 1000
+
+# 오류 응답 본문 로그 최대 길이 (바이트)
+ERROR_BODY_LOG_BYTES = 512
+
+
+class SingleFlight:
+    """
+    동일 키 동시 요청 병합 (single-flight)
+    
+    같은 키로 동시에 들어온 호출은 하나의 업스트림 요청을 공유하며,
+    모든 대기자가 같은 결과(또는 같은 예외)를 받습니다.
+    개별 대기자가 취소되어도 공유 요청은 취소되지 않습니다.
+    
+    공유 요청은 마감 시간 없이(detached) 업스트림 타임아웃까지 실행되고, 각 대기자는 자신의
+    마감 시간까지만 기다립니다. (먼저 온 호출의 짧은 마감 시간이 나중 대기자에게 적용되지 않도록)
+    추적 중이면 공유 요청의 세부 구간은 요청을 처음 보낸 호출의 trace에 기록됩니다.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.coalesced = 0  # 기존 요청에 합류한 호출 수
+    
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            with detached():
+                task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        else:
+            self.coalesced += 1
+        
+        # shield: 대기자 취소 / 마감 시간 초과가 공유 작업으로 전파되지 않도록 보호
+        timeout = remaining(float("inf"))
+        if timeout == float("inf"):
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), max(timeout, 0))
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError("요청 마감 시간 초과", details={"error": "deadline"})
+    
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 대기자가 모두 취소된 경우 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {"in_flight": len(self._inflight), "coalesced": self.coalesced}
 
 
 class NaverShoppingClient:
     """네이버 쇼핑 API 클라이언트 (싱글톤 패턴)"""
     
-    BASE_URL = "https://openapi.naver.com/v1/search/shop.json"
+    BASE_URL = settings.NAVER_API_BASE_URL
     
-    def __init__(self):
-        self.client_id = settings.NAVER_CLIENT_ID
-        self.client_secret = settings.NAVER_CLIENT_SECRET
+    def __init__(self, credentials: Optional[List[NaverCredential]] = None):
+        # 다중 워커 모드: 응답 캐시(L2) / 일일 쿼터를 공유 저장소로 워커 간 공유
+        shared_state = get_shared_state()
+        
+        # 인증키 풀 (키별 초당 요청 수 / 일일 쿼터 / 상태 추적)
+        # 초당 요청 수는 워커 수로 나눠 적용 (워커 합계가 키별 한도를 넘지 않도록)
+        if credentials is None:
+            workers = max(settings.SERVER_WORKERS, 1)
+            credentials = parse_credentials(
+                settings.NAVER_CLIENT_ID,
+                settings.NAVER_CLIENT_SECRET,
+                settings.NAVER_CREDENTIALS,
+                rate=settings.NAVER_RATE_LIMIT_PER_SEC / workers,
+                burst=max(settings.NAVER_RATE_LIMIT_BURST // workers, 1),
+                daily_quota=settings.NAVER_DAILY_QUOTA,
+                ledger=shared_state,
+                quota_lease_size=settings.QUOTA_LEASE_SIZE
+            )
+        self._credentials = CredentialPool(
+            credentials,
+            bench_seconds=settings.NAVER_KEY_BENCH_SECONDS,
+            auth_bench_seconds=settings.NAVER_KEY_AUTH_BENCH_SECONDS
+        )
         self.timeout = settings.NAVER_API_TIMEOUT
         
         # HTTPX 클라이언트 설정 (성능 최적화)
+        # hedge 요청은 별도 연결 풀 사용 (느린 연결과 다른 연결로 보내기 위함)
         self._client: Optional[httpx.AsyncClient] = None
+        self._hedge_client: Optional[httpx.AsyncClient] = None
+        
+        # 응답 캐시 (동일 키워드 반복 호출 시 업스트림 생략)
+        self._cache: Optional[SearchCache] = None
+        if settings.CACHE_ENABLED:
+            self._cache = SearchCache(
+                max_entries=settings.CACHE_MAX_ENTRIES,
+                max_bytes=settings.CACHE_MAX_BYTES,
+                ttl=settings.CACHE_TTL,
+                stale_ttl=settings.CACHE_STALE_TTL
+            )
+        self._shared_cache: Optional[SharedCache] = None
+        if settings.CACHE_ENABLED and shared_state is not None:
+            self._shared_cache = SharedCache(
+                shared_state,
+                ttl=settings.CACHE_TTL,
+                stale_ttl=settings.CACHE_STALE_TTL,
+                max_entries=settings.SHARED_CACHE_MAX_ENTRIES
+            )
+        self._refreshing: Set[Hashable] = set()
+        self._background_tasks: Set[asyncio.Task] = set()
+        
+        # 동일 요청 병합 (캐시 미스가 동시에 몰릴 때 업스트림 1회 호출)
+        self._singleflight = SingleFlight()
+        
+        # 가격 이력 기록 (백그라운드 스레드에서 일괄 저장)
+        self._history = get_price_history()
+        
+        # 검색어 추천 색인 갱신 (백그라운드 스레드에서 반영)
+        self._suggest = get_suggest_index()
+        
+        # 마지막 업스트림 요청 시각 (유휴 연결 유지 판단용)
+        self._last_request_at = 0.0
+        
+        # hedged 요청 (최근 응답 지연 p95 초과 시 1회 추가 요청, 비율 상한 적용)
+        self._latency = LatencyTracker(
+            quantile=settings.NAVER_HEDGE_QUANTILE,
+            initial=settings.NAVER_HEDGE_INITIAL_DELAY,
+            floor=settings.NAVER_HEDGE_MIN_DELAY
+        )
+        self._hedge_budget = HedgeBudget(settings.NAVER_HEDGE_MAX_RATIO)
+        
+        # 서킷 브레이커 + 장애 시 대신 제공할 마지막 정상 결과
+        self._breaker: Optional[CircuitBreaker] = None
+        self._last_good: Optional[SearchCache] = None
+        self.fallbacks_served = 0
+        if settings.CIRCUIT_BREAKER_ENABLED:
+            self._breaker = CircuitBreaker(
+                classify=_classify_failure,
+                window_seconds=settings.CIRCUIT_WINDOW_SECONDS,
+                min_requests=settings.CIRCUIT_MIN_REQUESTS,
+                failure_rate=settings.CIRCUIT_FAILURE_RATE,
+                slow_call_seconds=settings.CIRCUIT_SLOW_CALL_SECONDS,
+                slow_call_rate=settings.CIRCUIT_SLOW_CALL_RATE,
+                open_seconds=settings.CIRCUIT_OPEN_SECONDS,
+                half_open_probes=settings.CIRCUIT_HALF_OPEN_PROBES
+            )
+            self._last_good = SearchCache(
+                max_entries=settings.CIRCUIT_FALLBACK_MAX_ENTRIES,
+                max_bytes=settings.CACHE_MAX_BYTES,
+                ttl=settings.CIRCUIT_FALLBACK_TTL
+            )
     
-    async def _get_client(self) -> httpx.AsyncClient:
-        """비동기 HTTP 클라이언트 (연결 재사용)"""
+    async def _get_client(self, hedge: bool = False) -> httpx.AsyncClient:
+        """비동기 HTTP 클라이언트 (연결 재사용, hedge=True면 hedge 전용 연결 풀)"""
+        if hedge:
+            if self._hedge_client is None:
+                self._hedge_client = self._create_http_client()
+            return self._hedge_client
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout),
-                limits=httpx.Limits(
-                    max_connections=settings.HTTPX_MAX_CONNECTIONS,
-                    max_keepalive_connections=settings.HTTPX_MAX_KEEPALIVE
-                ),
-                http2=True  # HTTP/2 지원 (성능 향상)
-            )
+            self._client = self._create_http_client()
         return self._client
     
+    def _create_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=settings.HTTPX_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTPX_MAX_KEEPALIVE,
+                keepalive_expiry=settings.HTTPX_KEEPALIVE_EXPIRY
+            ),
+            http2=True  # HTTP/2 지원 (성능 향상)
+        )
+    
+    async def warm_up(self, connections: int) -> int:
+        """
+        업스트림 연결 미리 열기 (DNS / TLS / HTTP/2 핸드셰이크를 첫 사용자 요청 전에 처리)
+        
+        인증 헤더 없는 HEAD 요청이므로 쿼터를 사용하지 않습니다.
+        HTTP/2에서는 하나의 연결을 다중화하므로 실제 연결 수는 더 적을 수 있습니다.
+        
+        Returns:
+            응답을 받은 요청 수
+        """
+        client = await self._get_client()
+        results = await asyncio.gather(
+            *(client.head(self.BASE_URL) for _ in range(max(connections, 0))),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("연결 예열 실패: %s", result)
+        return sum(1 for result in results if not isinstance(result, BaseException))
+    
+    async def keep_warm(self, interval: float, connections: int) -> None:
+        """유휴 상태가 interval 이상 지속되면 연결 유지 요청 (keepalive 만료 방지)"""
+        while True:
+            await asyncio.sleep(interval)
+            if time.monotonic() - self._last_request_at >= interval:
+                await self.warm_up(connections)
+                self._last_request_at = time.monotonic()
+    
     async def close(self):
         """클라이언트 종료 (리소스 정리)"""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        for task in list(self._background_tasks):
+            task.cancel()
+        for client in (self._client, self._hedge_client):
+            if client is not None:
+                await client.aclose()
+        self._client = self._hedge_client = None
+        self._credentials.close()
     
     def _validate_keyword(self, keyword: str) -> None:
         """검색어 유효성 검증"""
@@ -53,8 +254,10 @@ class NaverShoppingClient:
         self,
         keyword: str,
         display: int = None,
-        sort: str = "sim"  # sim(정확도), date(날짜), asc(가격 낮은 순), dsc(가격 높은 순)
-    ) -> List[Dict[str, Any]]:
+        sort: str = "sim",  # sim(정확도), date(날짜), asc(가격 낮은 순), dsc(가격 높은 순)
+        start: int = 1,
+        fresh: bool = False
+    ) -> List[ShoppingItem]:
         """
         네이버 쇼핑 검색
         
@@ -62,77 +265,522 @@ class NaverShoppingClient:
             keyword: 검색어
             display: 결과 개수 (기본값: settings.NAVER_MAX_RESULTS)
             sort: 정렬 방식
+            start: 검색 시작 위치 (1 ~ 1000)
+            fresh: True면 캐시를 읽지 않고 업스트림에서 새로 조회 (결과는 캐시에 저장)
         
         Returns:
             검색 결과 리스트
         
         Raises:
             ValidationError: 입력값 오류
-            NaverAPIError: API 호출 오류
+            NaverAPIError: API 호출 오류 (CircuitOpenError: 장애 감지로 차단 중)
             NetworkError: 네트워크 오류
+        
+        업스트림 장애(차단 포함) 시 마지막 정상 결과가 있으면 예외 대신
+        stale_since가 기록된 SearchResults를 반환합니다.
         """
         # 검증
+        with span("validate"):
+            self._validate_keyword(keyword)
+        display = min(display or settings.NAVER_MAX_RESULTS, MAX_DISPLAY)
+        if not 1 <= start <= MAX_START:
+            raise ValidationError(f"검색 시작 위치는 1~{MAX_START} 사이여야 합니다.")
+        
+        key = SearchCache.make_key(keyword, sort, display, start)
+        
+        if self._cache is not None and not fresh:
+            items, stale = self._cache.get(key)
+            if items is not None:
+                if stale:
+                    # 오래된 응답은 즉시 반환하고 백그라운드에서 갱신
+                    self._schedule_refresh(key, keyword, display, sort, start)
+                return items
+        
+        if self._shared_cache is not None and not fresh:
+            # 다른 워커가 받아 둔 응답 (L2)
+            with span("shared_cache"):
+                items, stale, fresh_for = await self._shared_cache.get(key)
+            if items is not None:
+                if stale:
+                    self._schedule_refresh(key, keyword, display, sort, start)
+                elif self._cache is not None:
+                    self._cache.set(key, items, _estimate_size(items), ttl=fresh_for)
+                return items
+        
+        try:
+            # 업스트림 요청 대기 (같은 요청에 합류한 호출도 기록, 세부 단계는 요청을 보낸 호출에 기록)
+            with span("fetch"):
+                return await self._singleflight.do(
+                    key, lambda: self._fetch_and_store(key, keyword, display, sort, start)
+                )
+        except (NaverAPIError, NetworkError) as e:
+            fallback = self._fallback(key, e)
+            if fallback is None:
+                raise
+            return fallback
+    
+    def _fallback(self, key: Hashable, error: Exception) -> Optional[SearchResults]:
+        """업스트림 장애 시 마지막 정상 결과 (없거나 장애가 아닌 오류면 None)"""
+        if self._last_good is None:
+            return None
+        # 마감 시간 초과는 브레이커 판단과 별개로 이전 결과 제공 (응답을 기다릴 수 없는 상황)
+        if not isinstance(error, (CircuitOpenError, DeadlineExceededError)) and not _classify_failure(error):
+            return None
+        
+        entry, _ = self._last_good.get(key)
+        if entry is None:
+            return None
+        items, fetched_at = entry
+        self.fallbacks_served += 1
+        logger.warning("업스트림 장애로 이전 결과 제공: %s (%s)", key, type(error).__name__)
+        return SearchResults(items, stale_since=fetched_at)
+    
+    async def iter_pages(
+        self,
+        keyword: str,
+        sort: str = "sim",
+        max_results: int = MAX_START,
+        concurrency: int = None
+    ) -> AsyncIterator[Tuple[int, List[ShoppingItem]]]:
+        """
+        여러 페이지(start=1, 101, ...)를 동시에 요청하고 도착 순서대로 반환
+        
+        - 동시 요청 수는 concurrency(기본값: settings.NAVER_SCAN_CONCURRENCY)로 제한
+        - 결과가 끝난 페이지(100개 미만)가 오면 그 뒤 페이지는 요청하지 않음
+        - 첫 페이지 실패는 예외로 전파, 나머지 페이지 실패는 건너뜀
+        - 호출자가 순회를 중단하면 남은 요청은 취소
+        
+        Yields:
+            (start, 페이지 결과)
+        """
         self._validate_keyword(keyword)
-        display = display or settings.NAVER_MAX_RESULTS
+        max_results = max(1, min(max_results, MAX_START))
+        semaphore = asyncio.Semaphore(concurrency or settings.NAVER_SCAN_CONCURRENCY)
+        
+        async def fetch_page(start: int, display: int) -> List[ShoppingItem]:
+            async with semaphore:
+                return await self.search(keyword, display=display, sort=sort, start=start)
+        
+        pending: Dict[asyncio.Task, Tuple[int, int]] = {}
+        for start in range(1, max_results + 1, MAX_DISPLAY):
+            display = min(MAX_DISPLAY, max_results - start + 1)
+            pending[asyncio.create_task(fetch_page(start, display))] = (start, display)
+        
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    start, display = pending.pop(task)
+                    try:
+                        page = task.result()
+                    except Exception as e:
+                        if start == 1:
+                            raise
+                        logger.warning("페이지 조회 실패 (start=%s): %s", start, e)
+                        continue
+                    
+                    if len(page) < display:
+                        # 마지막 페이지 이후는 결과가 없으므로 쿼터 절약을 위해 취소
+                        for other, (other_start, _) in list(pending.items()):
+                            if other_start > start:
+                                other.cancel()
+                                pending.pop(other)
+                    
+                    yield start, page
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def deep_search(
+        self,
+        keyword: str,
+        sort: str = "sim",
+        max_results: int = MAX_START,
+        stop_when: Optional[Callable[[List[ShoppingItem]], bool]] = None,
+        concurrency: int = None
+    ) -> List[ShoppingItem]:
+        """
+        대량 검색 (최대 1,000개, 페이지 병렬 요청)
+        
+        Args:
+            keyword: 검색어
+            sort: 정렬 방식
+            max_results: 최대 결과 개수 (최대 1000)
+            stop_when: 페이지가 도착할 때마다 지금까지 모은 결과로 호출되며,
+                True를 반환하면 남은 요청을 취소하고 종료
+            concurrency: 동시 요청 수
+        
+        Returns:
+            productId 기준으로 중복 제거된 결과 (검색 순위 순, 이전 결과가 섞이면 가장 오래된 조회 시각 기록)
+        """
+        ranked: Dict[str, Tuple[int, ShoppingItem]] = {}
+        stale_since: Optional[float] = None
+        
+        pages = self.iter_pages(keyword, sort=sort, max_results=max_results, concurrency=concurrency)
+        try:
+            async for start, page in pages:
+                page_stale = getattr(page, "stale_since", None)
+                if page_stale is not None:
+                    stale_since = page_stale if stale_since is None else min(stale_since, page_stale)
+                for offset, item in enumerate(page):
+                    product_id = item.product_id or item.link
+                    rank = start + offset
+                    if product_id not in ranked or rank < ranked[product_id][0]:
+                        ranked[product_id] = (rank, item)
+                
+                if stop_when is not None and stop_when([item for _, item in ranked.values()]):
+                    break
+        finally:
+            await pages.aclose()
+        
+        return SearchResults(
+            (item for _, item in sorted(ranked.values(), key=lambda entry: entry[0])),
+            stale_since=stale_since
+        )
+    
+    async def _fetch_and_store(self, key: Hashable, keyword: str, display: int, sort: str, start: int) -> List[ShoppingItem]:
+        """업스트림 호출 후 캐시 저장 (single-flight 공유 작업)"""
+        items = await self._fetch(keyword, display, sort, start)
+        size = _estimate_size(items)
+        if self._cache is not None:
+            self._cache.set(key, items, size)
+        if self._last_good is not None:
+            self._last_good.set(key, (items, time.time()), size)
+        if self._shared_cache is not None:
+            task = asyncio.create_task(self._shared_cache.set(key, items))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        if self._history is not None:
+            self._history.record(keyword, items)
+        if self._suggest is not None:
+            self._suggest.record(keyword, items)
+        return items
+    
+    def _schedule_refresh(self, key: Hashable, keyword: str, display: int, sort: str, start: int) -> None:
+        """stale 엔트리 백그라운드 갱신 (키당 1개만 실행)"""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, keyword, display, sort, start))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _refresh(self, key: Hashable, keyword: str, display: int, sort: str, start: int) -> None:
+        try:
+            # 요청한 툴 호출의 마감 시간 / 추적과 무관하게 갱신
+            with detached(), untraced():
+                await self._singleflight.do(
+                    key, lambda: self._fetch_and_store(key, keyword, display, sort, start)
+                )
+        except Exception as e:
+            logger.warning("캐시 갱신 실패: %s (%s)", keyword, e)
+        finally:
+            self._refreshing.discard(key)
+    
+    async def _acquire_slot(self) -> NaverCredential:
+        """
+        호출 허가 획득 (키 선택 + 일일 쿼터 차감 → 키별 토큰 버킷 대기)
+        
+        Raises:
+            QuotaExceededError: 모든 키의 일일 쿼터 소진 (대기 없이 즉시 실패)
+            RateLimitError: 최대 대기 시간 내에 토큰을 얻지 못함
+            DeadlineExceededError: 툴 호출 마감 시간 경과
+        """
+        max_wait = remaining(settings.NAVER_RATE_LIMIT_MAX_WAIT)
+        if max_wait <= 0:
+            raise DeadlineExceededError("요청 마감 시간 초과", details={"error": "deadline"})
+        
+        await self._credentials.replenish()
+        credential = self._credentials.acquire()
+        
+        try:
+            acquired = await credential.rate_limiter.acquire(max_wait)
+        except asyncio.CancelledError:
+            self._credentials.cancel(credential)
+            raise
+        
+        if not acquired:
+            self._credentials.cancel(credential)
+            raise RateLimitError(
+                "초당 요청 한도 초과",
+                details={"status_code": 429, "rate_per_sec": credential.rate_limiter.rate}
+            )
+        return credential
+    
+    async def _fetch(self, keyword: str, display: int, sort: str, start: int) -> List[ShoppingItem]:
+        """
+        네이버 API 실제 호출 (캐시 미적용)
+        
+        429/401 응답은 해당 키를 일시 제외하고 다른 키로 1회 재시도합니다.
+        서킷 브레이커가 open이면 요청을 보내지 않고 CircuitOpenError를 발생시킵니다.
+        브레이커는 업스트림 전송 구간만 측정합니다. (클라이언트 측 토큰 대기는 느린 응답으로 집계하지 않음)
+        """
+        attempts = min(len(self._credentials), 2)
+        for attempt in range(attempts):
+            credential = None
+            try:
+                if self._breaker is not None:
+                    self._breaker.reject_if_open()
+                with span("rate_limit"):
+                    credential = await self._acquire_slot()
+                try:
+                    guard = self._breaker.guard() if self._breaker else nullcontext()
+                    with guard:
+                        try:
+                            return await self._send(credential, keyword, display, sort, start)
+                        except (NaverAPIError, NetworkError) as e:
+                            UPSTREAM_ERRORS.labels(type(e).__name__).inc()
+                            raise
+                except CircuitOpenError:
+                    # 토큰 대기 중 차단됨 (half-open 시험 요청 한도 포함) → 보내지 않은 요청 반환
+                    self._credentials.cancel(credential)
+                    raise
+            except NaverAPIError as e:
+                # 업스트림 응답의 429/401만 재시도 (클라이언트 측 제한 / 차단은 즉시 실패)
+                if (
+                    type(e) is NaverAPIError
+                    and e.details.get("status_code") in (401, 429)
+                    and attempt + 1 < attempts
+                ):
+                    logger.warning("키 일시 제외 후 재시도: %s (%s)", credential.label, e.details.get('status_code'))
+                    continue
+                raise
+    
+    async def _send(
+        self,
+        credential: NaverCredential,
+        keyword: str,
+        display: int,
+        sort: str,
+        start: int
+    ) -> List[ShoppingItem]:
+        """
+        요청 전송 (hedge 활성화 시 hedged 요청)
+        
+        첫 요청이 최근 응답 지연 분위수(기본 p95) 안에 끝나지 않으면 별도 연결 풀로
+        같은 요청을 한 번 더 보내고 먼저 성공한 응답을 사용합니다. (나머지는 취소)
+        hedge 요청은 비율 상한 안에서, 쿼터와 초당 토큰을 대기 없이 얻을 수 있을 때만 보냅니다.
+        """
+        if not settings.NAVER_HEDGE_ENABLED:
+            return await self._request(credential, keyword, display, sort, start)
+        
+        self._hedge_budget.on_request()
+        primary = asyncio.ensure_future(self._request(credential, keyword, display, sort, start))
+        tasks = {primary}
+        try:
+            delay = remaining(self._latency.threshold())
+            done, _ = await asyncio.wait(tasks, timeout=max(delay, 0))
+            if done or delay <= 0:
+                return await primary
+            
+            hedge_credential = None
+            if self._hedge_budget.available():
+                hedge_credential = self._credentials.try_acquire_now()
+            if hedge_credential is None:
+                self._hedge_budget.skipped += 1
+                UPSTREAM_HEDGES.labels("skipped").inc()
+                return await primary
+            
+            self._hedge_budget.spend()
+            UPSTREAM_HEDGES.labels("sent").inc()
+            hedge = asyncio.ensure_future(
+                self._request(hedge_credential, keyword, display, sort, start, hedge=True)
+            )
+            tasks.add(hedge)
+            
+            # 먼저 성공한 응답 사용 (둘 다 실패하면 첫 요청의 예외 전파)
+            pending = set(tasks)
+            winner = None
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and winner is None:
+                        winner = task
+            
+            if winner is hedge:
+                self._hedge_budget.won += 1
+                UPSTREAM_HEDGES.labels("won").inc()
+            return (winner or primary).result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def _request(
+        self,
+        credential: NaverCredential,
+        keyword: str,
+        display: int,
+        sort: str,
+        start: int,
+        hedge: bool = False
+    ) -> List[ShoppingItem]:
+        """선택된 키로 단일 HTTP 요청 수행 (마감 시간이 있으면 남은 시간을 타임아웃으로 사용)"""
+        timeout = remaining(self.timeout)
+        if timeout <= 0:
+            self._credentials.cancel(credential)
+            raise DeadlineExceededError("요청 마감 시간 초과", details={"error": "deadline"})
         
         # 요청 준비
         headers = {
-            "X-Naver-Client-Id": self.client_id,
-            "X-Naver-Client-Secret": self.client_secret,
+            "X-Naver-Client-Id": credential.client_id,
+            "X-Naver-Client-Secret": credential.client_secret,
             "User-Agent": "ShopCatch-MCP/1.0"
         }
         
         params = {
             "query": keyword.strip(),
-            "display": min(display, 100),  # 최대 100개
+            "display": display,
+            "start": start,
             "sort": sort
         }
         
-        logger.info(f"네이버 쇼핑 검색 시작: {keyword} (정렬: {sort})")
+        logger.info("네이버 쇼핑 검색 시작: %s (정렬: %s, 시작: %s, 키: %s)", keyword, sort, start, credential.label)
         
+        status_code = None
+        outcome = "error"
+        UPSTREAM_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        self._last_request_at = time.monotonic()
         try:
-            client = await self._get_client()
+            client = await self._get_client(hedge)
+            # 추적 중이면 연결 획득 / 업스트림 응답 / 본문 수신 구간 기록
             response = await client.get(
                 self.BASE_URL,
                 headers=headers,
-                params=params
+                params=params,
+                timeout=timeout,
+                extensions=http_extensions()
             )
+            status_code = response.status_code
+            UPSTREAM_RESPONSE_BYTES.observe(len(response.content))
             
             # 상태 코드 확인
             if response.status_code != 200:
-                logger.error(f"네이버 API 오류: {response.status_code} - {response.text}")
+                # 오류 본문은 앞부분만 기록 (대용량 HTML 오류 페이지 대비)
+                body = response.content[:ERROR_BODY_LOG_BYTES].decode("utf-8", "replace")
+                logger.error("네이버 API 오류: %s - %s", response.status_code, body)
                 raise NaverAPIError(
                     f"API 호출 실패 (상태 코드: {response.status_code})",
-                    details={"status_code": response.status_code, "response": response.text}
+                    details={"status_code": response.status_code, "response": body}
                 )
             
-            # 응답 파싱
-            data = response.json()
-            items = data.get("items", [])
+            # 응답 파싱 (필요한 필드만 ShoppingItem으로 변환)
+            with span("decode"):
+                items = decode_search_response(response.content)
+            self._latency.observe(time.perf_counter() - started)
             
-            logger.info(f"검색 완료: {len(items)}개 결과")
+            logger.info("검색 완료: %s개 결과", len(items))
             return items
         
+        except NaverAPIError:
+            raise
+        
         except httpx.TimeoutException as e:
-            logger.error(f"타임아웃 오류: {e}")
+            logger.error("타임아웃 오류: %s", e)
+            if timeout < self.timeout:
+                raise DeadlineExceededError(
+                    "요청 마감 시간 초과",
+                    details={"error": "deadline", "timeout": round(timeout, 3)}
+                )
             raise NaverAPIError(
                 "응답 시간 초과",
                 details={"error": "timeout", "timeout": self.timeout}
             )
         
         except httpx.NetworkError as e:
-            logger.error(f"네트워크 오류: {e}")
+            logger.error("네트워크 오류: %s", e)
             raise NetworkError(
                 "네트워크 연결 실패",
                 details={"error": str(e)}
             )
         
+        except asyncio.CancelledError:
+            # hedge 경쟁에서 진 요청 또는 호출자 취소
+            outcome = "cancelled"
+            raise
+        
         except Exception as e:
-            logger.error(f"예상치 못한 오류: {e}", exc_info=True)
+            logger.error("예상치 못한 오류: %s", e, exc_info=True)
             raise NaverAPIError(
                 f"검색 중 오류 발생: {str(e)}",
                 details={"error": str(e)}
             )
+        
+        finally:
+            UPSTREAM_IN_FLIGHT.dec()
+            UPSTREAM_LATENCY.labels(status_code or outcome).observe(time.perf_counter() - started)
+            self._credentials.release(credential, status_code, cancelled=outcome == "cancelled")
+    
+    def export_cache(self, limit: int) -> List[Tuple[Hashable, List[ShoppingItem], float, float]]:
+        """스냅샷용 응답 캐시 내보내기 (최근 사용 순, 캐시 비활성화 시 빈 목록)"""
+        if self._cache is None:
+            return []
+        return self._cache.export(limit)
+    
+    def restore_cache(self, entries: List[Tuple[Hashable, List[ShoppingItem], float, float]]) -> int:
+        """
+        스냅샷에서 읽은 엔트리를 응답 캐시에 복원 (남은 TTL 유지)
+        
+        신선한 기간이 지난 엔트리는 stale 상태로 들어가 첫 조회 시 백그라운드 갱신됩니다.
+        
+        Returns:
+            복원한 엔트리 수
+        """
+        if self._cache is None:
+            return 0
+        # 최근 사용 순으로 들어오므로 역순으로 넣어 LRU 순서 유지
+        for key, items, fresh_for, stale_for in reversed(entries):
+            ttl = max(fresh_for, 0.0)
+            self._cache.set(key, items, _estimate_size(items), ttl=ttl, stale_ttl=max(stale_for - ttl, 0.0))
+        return len(entries)
+    
+    def circuit_stats(self) -> Optional[Dict[str, Any]]:
+        """서킷 브레이커 상태 (비활성화 시 None)"""
+        return self._breaker.stats() if self._breaker else None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """모니터링용 내부 상태"""
+        return {
+            "cache": self._cache.stats() if self._cache else None,
+            "shared_cache": self._shared_cache.stats() if self._shared_cache else None,
+            "singleflight": self._singleflight.stats(),
+            "credentials": self._credentials.stats(),
+            "circuit_breaker": self.circuit_stats(),
+            "fallbacks_served": self.fallbacks_served,
+            "hedging": {**self._hedge_budget.stats(), **self._latency.stats()} if settings.NAVER_HEDGE_ENABLED else None,
+            "price_history": self._history.stats() if self._history else None,
+            "suggest": self._suggest.stats() if self._suggest else None
+        }
+
+
+def _classify_failure(error: BaseException) -> Optional[bool]:
+    """
+    서킷 브레이커용 예외 분류
+    
+    Returns:
+        True: 업스트림 장애 (네트워크 오류, 타임아웃, 5xx)
+        False: 업스트림은 정상 응답 (4xx 요청 오류)
+        None: 판단 제외 (클라이언트 측 제한, 키/쿼터 문제)
+    """
+    if isinstance(error, NetworkError):
+        return True
+    if isinstance(error, (RateLimitError, QuotaExceededError, CircuitOpenError)):
+        return None
+    if isinstance(error, DeadlineExceededError):
+        # 호출자 마감 시간으로 줄어든 타임아웃은 업스트림과 무관 (전체 타임아웃이 지난 경우만 장애)
+        return True if error.details.get("timeout", 0) >= settings.NAVER_API_TIMEOUT else None
+    if isinstance(error, NaverAPIError):
+        status_code = error.details.get("status_code")
+        if status_code in (401, 429):
+            return None
+        return status_code is None or status_code >= 500
+    return None
+
+
+def _estimate_size(items: List[ShoppingItem]) -> int:
+    """캐시 용량 계산용 응답 메모리 크기 추정 (바이트)"""
+    return sum(item.approx_size() for item in items)
 
 
 # 싱글톤 인스턴스
@@ -147,7 +795,13 @@ def get_naver_client() -> NaverShoppingClient:
     return _naver_client
 
 
-async def search_shopping(keyword: str, sort: str = "sim") -> List[Dict[str, Any]]:
+async def close_naver_client() -> None:
+    """클라이언트가 생성된 경우 연결 풀 정리"""
+    if _naver_client is not None:
+        await _naver_client.close()
+
+
+async def search_shopping(keyword: str, sort: str = "sim") -> List[ShoppingItem]:
     """
     편의 함수: 네이버 쇼핑 검색
     
@@ -156,3 +810,52 @@ async def search_shopping(keyword: str, sort: str = "sim") -> List[Dict[str, Any
     """
     client = get_naver_client()
     return await client.search(keyword, sort=sort)
+
+
+async def scan_shopping(
+    keyword: str,
+    sort: str = "sim",
+    max_results: int = MAX_START,
+    stop_when: Optional[Callable[[List[ShoppingItem]], bool]] = None
+) -> List[ShoppingItem]:
+    """
+    편의 함수: 대량 검색 (최대 1,000개, 페이지 병렬 요청)
+    
+    Usage:
+        results = await scan_shopping("노트북", max_results=500)
+    """
+    client = get_naver_client()
+    return await client.deep_search(keyword, sort=sort, max_results=max_results, stop_when=stop_when)
+
+
+async def search_many(
+    keywords: List[str],
+    sort: str = "sim",
+    concurrency: int = None,
+    timeout: float = None
+) -> List[Tuple[str, Any]]:
+    """
+    편의 함수: 여러 키워드 동시 검색 (부분 실패 허용)
+    
+    Returns:
+        입력 순서대로 (키워드, 결과 리스트 또는 예외) 목록
+    
+    Usage:
+        results = await search_many(["아이폰 15", "갤럭시 S24"], sort="asc")
+    """
+    client = get_naver_client()
+    semaphore = asyncio.Semaphore(concurrency or settings.BATCH_CONCURRENCY)
+    timeout = timeout or settings.BATCH_KEYWORD_TIMEOUT
+    
+    async def run(keyword: str) -> List[ShoppingItem]:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(client.search(keyword, sort=sort), timeout)
+            except asyncio.TimeoutError:
+                raise NaverAPIError(
+                    "응답 시간 초과",
+                    details={"error": "timeout", "timeout": timeout}
+                )
+    
+    results = await asyncio.gather(*(run(keyword) for keyword in keywords), return_exceptions=True)
+    return list(zip(keywords, results))
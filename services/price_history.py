@@ -0,0 +1,251 @@
+"""
+가격 이력 저장소 (SQLite 내장 DB)
+요청 경로에서는 큐에 넣기만 하고, 백그라운드 스레드가 묶어서 기록
+"""
+import asyncio
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from config import settings
+from utils.logger import logger
+from services.models import ShoppingItem
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS price_observations (
+    product_id  TEXT    NOT NULL,
+    keyword     TEXT    NOT NULL,
+    mall_name   TEXT    NOT NULL,
+    lprice      INTEGER NOT NULL,
+    observed_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_obs_product_time ON price_observations (product_id, observed_at);
+CREATE INDEX IF NOT EXISTS idx_obs_keyword_time ON price_observations (keyword, observed_at);
+
+CREATE TABLE IF NOT EXISTS products (
+    product_id TEXT PRIMARY KEY,
+    title      TEXT NOT NULL,
+    link       TEXT NOT NULL,
+    last_seen  INTEGER NOT NULL
+);
+"""
+
+_STOP = object()
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.split()).lower()
+
+
+class PriceHistoryStore:
+    """
+    가격 관측 기록 저장소
+
+    - record(): 논블로킹 (큐가 가득 차면 버리고 dropped 카운트 증가)
+    - 쓰기: 전용 스레드에서 batch_size개 또는 flush_interval초 단위로 일괄 INSERT
+    - 읽기: asyncio.to_thread로 이벤트 루프 밖에서 실행 (WAL 모드로 쓰기와 동시 진행)
+    """
+
+    def __init__(self, path: str, batch_size: int, flush_interval: float, queue_size: int):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._writer: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        self.recorded = 0
+        self.dropped = 0
+        self.write_errors = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def start(self) -> None:
+        """
+        쓰기 스레드 시작 (서버 시작 시 호출, 시작 전 첫 기록이면 자동 호출)
+
+        디렉터리 / 스키마 생성은 쓰기 스레드에서 수행하므로 이벤트 루프를 막지 않습니다.
+        """
+        with self._start_lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(target=self._run, name="price-history-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+
+    def record(self, keyword: str, items: List[ShoppingItem]) -> None:
+        """검색 결과 가격 기록 (요청 경로용, 블로킹 없음)"""
+        if not items:
+            return
+        if self._writer is None:
+            self.start()
+
+        observed_at = int(time.time())
+        try:
+            self._queue.put_nowait((normalize_keyword(keyword), observed_at, items))
+        except queue.Full:
+            self.dropped += len(items)
+
+    def _prepare(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _run(self) -> None:
+        try:
+            conn = self._prepare()
+        except (OSError, sqlite3.Error) as e:
+            # 저장소를 열 수 없으면 기록하지 않음 (큐가 차면 dropped로 집계)
+            self.write_errors += 1
+            logger.error("가격 이력 저장소 열기 실패: %s", e)
+            return
+        batch: List[Tuple[str, int, List[ShoppingItem]]] = []
+        pending = 0
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            try:
+                entry = self._queue.get(timeout=max(deadline - time.monotonic(), 0.01))
+            except queue.Empty:
+                entry = None
+
+            if entry is _STOP:
+                self._flush(conn, batch)
+                break
+            if entry is not None:
+                batch.append(entry)
+                pending += len(entry[2])
+
+            if pending >= self.batch_size or time.monotonic() >= deadline:
+                self._flush(conn, batch)
+                batch, pending = [], 0
+                deadline = time.monotonic() + self.flush_interval
+
+        conn.close()
+
+    def _flush(self, conn: sqlite3.Connection, batch: List[Tuple[str, int, List[ShoppingItem]]]) -> None:
+        if not batch:
+            return
+        observations = []
+        products = []
+        for keyword, observed_at, items in batch:
+            for item in items:
+                if not item.product_id or item.lprice <= 0:
+                    continue
+                observations.append((item.product_id, keyword, item.mall_name, item.lprice, observed_at))
+                products.append((item.product_id, item.title, item.link, observed_at))
+
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO price_observations (product_id, keyword, mall_name, lprice, observed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    observations
+                )
+                conn.executemany(
+                    "INSERT INTO products (product_id, title, link, last_seen) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(product_id) DO UPDATE SET "
+                    "title = excluded.title, link = excluded.link, last_seen = excluded.last_seen",
+                    products
+                )
+            self.recorded += len(observations)
+        except sqlite3.Error as e:
+            self.write_errors += 1
+            logger.error("가격 이력 저장 실패: %s", e)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 기록을 모두 쓰고 쓰기 스레드 종료"""
+        if self._writer is None:
+            return
+        if not self._writer.is_alive():
+            # 저장소를 열지 못해 종료된 경우 (큐가 가득 차 있을 수 있음)
+            self._writer = None
+            return
+        self._queue.put(_STOP)
+        self._writer.join(timeout)
+        self._writer = None
+
+    # ------------------------------------------------------------------
+    # 조회 (스레드에서 실행)
+    # ------------------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple) -> List[tuple]:
+        if not os.path.exists(self.path):
+            return []
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    async def keyword_trend(self, keyword: str, days: int) -> List[Dict[str, Any]]:
+        """키워드 일별 최저가 추이 (KST 기준 날짜)"""
+        since = int(time.time()) - days * 86400
+        rows = await asyncio.to_thread(
+            self._query,
+            "SELECT date(observed_at, 'unixepoch', '+9 hours') AS day, MIN(lprice), COUNT(*) "
+            "FROM price_observations WHERE keyword = ? AND observed_at >= ? "
+            "GROUP BY day ORDER BY day",
+            (normalize_keyword(keyword), since)
+        )
+        return [{"date": day, "min_price": price, "observations": count} for day, price, count in rows]
+
+    async def keyword_all_time_low(self, keyword: str) -> Optional[Dict[str, Any]]:
+        """키워드 역대 최저가 기록"""
+        rows = await asyncio.to_thread(
+            self._query,
+            "SELECT o.product_id, o.mall_name, o.lprice, o.observed_at, p.title, p.link "
+            "FROM price_observations o LEFT JOIN products p ON p.product_id = o.product_id "
+            "WHERE o.keyword = ? ORDER BY o.lprice ASC, o.observed_at DESC LIMIT 1",
+            (normalize_keyword(keyword),)
+        )
+        if not rows:
+            return None
+        product_id, mall_name, lprice, observed_at, title, link = rows[0]
+        return {
+            "product_id": product_id,
+            "mall_name": mall_name,
+            "lprice": lprice,
+            "observed_at": observed_at,
+            "title": title or "",
+            "link": link or ""
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "recorded": self.recorded,
+            "queued": self._queue.qsize(),
+            "dropped": self.dropped,
+            "write_errors": self.write_errors
+        }
+
+
+# 싱글톤 인스턴스
+_price_history: Optional[PriceHistoryStore] = None
+
+
+def get_price_history() -> Optional[PriceHistoryStore]:
+    """가격 이력 저장소 반환 (비활성화 시 None)"""
+    global _price_history
+    if not settings.PRICE_HISTORY_ENABLED:
+        return None
+    if _price_history is None:
+        _price_history = PriceHistoryStore(
+            path=settings.PRICE_HISTORY_PATH,
+            batch_size=settings.PRICE_HISTORY_BATCH_SIZE,
+            flush_interval=settings.PRICE_HISTORY_FLUSH_INTERVAL,
+            queue_size=settings.PRICE_HISTORY_QUEUE_SIZE
+        )
+    return _price_history
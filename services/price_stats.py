@@ -0,0 +1,165 @@
+"""
+가격 통계 분석
+검색 결과를 열(column) 단위 배열로 변환해 한 번에 계산 (numpy 사용 가능 시 벡터 연산)
+"""
+from array import array
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from services.models import ShoppingItem
+
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 시 순수 파이썬 경로 사용
+    np = None
+
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+class PriceColumns:
+    """
+    검색 결과의 열 지향 표현
+
+    - lprice: int64 배열 (array 모듈, numpy에서 복사 없이 사용)
+    - category: 카테고리 코드 배열 (categories 목록의 인덱스, 대>중>소 경로 단위)
+    - 배열 순서 = 검색 순위
+    """
+
+    __slots__ = ("lprice", "category", "categories", "items")
+
+    def __init__(self, items: List[ShoppingItem]):
+        self.items = items
+        self.lprice = array("q", [item.lprice for item in items])
+
+        paths = [(item.category1, item.category2, item.category3) for item in items]
+        codes: Dict[tuple, int] = {}
+        self.category = array("i", [codes.setdefault(path, len(codes)) for path in paths])
+        self.categories: List[str] = [">".join(part for part in path if part) for path in codes]
+
+    def __len__(self) -> int:
+        return len(self.lprice)
+
+
+def _dominant_category(columns: PriceColumns, top_k: int) -> Optional[int]:
+    """상위 검색 결과에서 가장 많이 등장한 카테고리 (검색 의도 추정)"""
+    head = columns.category[:top_k]
+    if not head:
+        return None
+    return Counter(head).most_common(1)[0][0]
+
+
+def _percentile(sorted_values: List[int], q: float) -> float:
+    """선형 보간 백분위수 (numpy.percentile 기본 방식과 동일)"""
+    if len(sorted_values) == 1:
+        return float(sorted_values[0])
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def _histogram(sorted_values: List[int], bins: int) -> List[Dict[str, int]]:
+    low, high = sorted_values[0], sorted_values[-1]
+    width = (high - low) / bins or 1
+    counts = [0] * bins
+    for value in sorted_values:
+        counts[min(int((value - low) / width), bins - 1)] += 1
+    return [
+        {"from": int(low + width * i), "to": int(low + width * (i + 1)), "count": counts[i]}
+        for i in range(bins)
+    ]
+
+
+def _analyze_numpy(columns: PriceColumns, dominant: Optional[int], iqr_k: float, bins: int):
+    lprice = np.frombuffer(columns.lprice, dtype=np.int64)
+    category = np.frombuffer(columns.category, dtype=np.intc)
+
+    valid = lprice > 0
+    in_category = valid & (category == dominant) if dominant is not None else valid
+    candidates = lprice[in_category]
+    if candidates.size == 0:
+        return None
+
+    q1, q3 = np.percentile(candidates, (25, 75))
+    lower_fence = q1 - iqr_k * (q3 - q1)
+    upper_fence = q3 + iqr_k * (q3 - q1)
+    keep = in_category & (lprice >= lower_fence) & (lprice <= upper_fence)
+    prices = lprice[keep]
+
+    counts, edges = np.histogram(prices, bins=bins)
+    return {
+        "valid": int(valid.sum()),
+        "category_rejected": int(valid.sum() - in_category.sum()),
+        "outliers": int(in_category.sum() - keep.sum()),
+        "count": int(prices.size),
+        "min": int(prices.min()),
+        "max": int(prices.max()),
+        "mean": float(prices.mean()),
+        "percentiles": dict(zip(PERCENTILES, (float(p) for p in np.percentile(prices, PERCENTILES)))),
+        "histogram": [
+            {"from": int(edges[i]), "to": int(edges[i + 1]), "count": int(counts[i])}
+            for i in range(len(counts))
+        ],
+        "cheapest_index": int(np.flatnonzero(keep)[np.argmin(prices)])
+    }
+
+
+def _analyze_python(columns: PriceColumns, dominant: Optional[int], iqr_k: float, bins: int):
+    lprice, category = columns.lprice, columns.category
+
+    valid = [i for i in range(len(lprice)) if lprice[i] > 0]
+    in_category = [i for i in valid if dominant is None or category[i] == dominant]
+    if not in_category:
+        return None
+
+    candidates = sorted(lprice[i] for i in in_category)
+    q1, q3 = _percentile(candidates, 25), _percentile(candidates, 75)
+    lower_fence = q1 - iqr_k * (q3 - q1)
+    upper_fence = q3 + iqr_k * (q3 - q1)
+    keep = [i for i in in_category if lower_fence <= lprice[i] <= upper_fence]
+    prices = sorted(lprice[i] for i in keep)
+
+    return {
+        "valid": len(valid),
+        "category_rejected": len(valid) - len(in_category),
+        "outliers": len(in_category) - len(keep),
+        "count": len(prices),
+        "min": prices[0],
+        "max": prices[-1],
+        "mean": sum(prices) / len(prices),
+        "percentiles": {q: _percentile(prices, q) for q in PERCENTILES},
+        "histogram": _histogram(prices, bins),
+        "cheapest_index": min(keep, key=lambda i: lprice[i])
+    }
+
+
+def analyze_prices(
+    items: List[ShoppingItem],
+    category_top_k: int = 20,
+    iqr_k: float = 1.5,
+    bins: int = 8
+) -> Optional[Dict[str, Any]]:
+    """
+    가격 분포 분석 및 "현실적인 최저가" 계산
+
+    1. 상위 category_top_k개 결과의 최빈 카테고리와 다른 상품 제외 (케이스/액세서리 등)
+    2. IQR 범위(Q1 - k*IQR ~ Q3 + k*IQR) 밖의 가격 제외
+    3. 남은 상품으로 최저가/백분위수/히스토그램 계산
+
+    Returns:
+        통계 딕셔너리 (가격 정보가 있는 상품이 없으면 None)
+    """
+    columns = PriceColumns(items)
+    if not len(columns):
+        return None
+
+    dominant = _dominant_category(columns, category_top_k)
+    analyze = _analyze_numpy if np is not None else _analyze_python
+    stats = analyze(columns, dominant, iqr_k, bins)
+    if stats is None:
+        return None
+
+    stats["sample_size"] = len(columns)
+    stats["category"] = columns.categories[dominant] if dominant is not None else ""
+    stats["cheapest_item"] = items[stats.pop("cheapest_index")]
+    return stats
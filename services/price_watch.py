@@ -0,0 +1,448 @@
+"""
+가격 알림 (관심 상품 목표가 감시)
+(키워드, 목표가) 감시를 등록해 두면 백그라운드에서 주기적으로 최저가를 조회하고,
+목표가 이하로 내려가면 알림을 남김
+
+- 같은 키워드(정규화 기준) 감시는 하나의 조회 대상(topic)으로 묶어 업스트림 조회 1회로 처리
+- 조회 간격은 topic별로 조정: 가격이 자주 바뀌면 절반으로, 변동이 없으면 늘림,
+  목표가에 가까우면 하한 근처로 (PRICE_WATCH_MIN_INTERVAL ~ PRICE_WATCH_MAX_INTERVAL)
+- 일일 쿼터 중 PRICE_WATCH_QUOTA_SHARE 비율만 사용하도록 토큰 버킷으로 조회를 분산,
+  예산이 부족하면 가장 오래 밀린 topic부터 조회
+- 감시 / 조회 상태 / 알림은 SQLite에 저장 (재시작 후 이어서 감시, 다중 워커는 0번 워커만 조회)
+"""
+import asyncio
+import os
+import random
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+from config import settings
+from utils.logger import logger
+from utils.exceptions import ValidationError
+from services.price_history import normalize_keyword
+from services.price_stats import analyze_prices
+from services.rate_limiter import TokenBucket
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS watches (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword      TEXT    NOT NULL,
+    display      TEXT    NOT NULL,
+    target_price INTEGER NOT NULL,
+    created_at   INTEGER NOT NULL,
+    triggered_at INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_watches_keyword ON watches (keyword, triggered_at);
+
+CREATE TABLE IF NOT EXISTS topics (
+    keyword      TEXT    PRIMARY KEY,
+    display      TEXT    NOT NULL,
+    interval     REAL    NOT NULL,
+    next_poll_at REAL    NOT NULL,
+    last_price   INTEGER,
+    last_polled  REAL,
+    polls        INTEGER NOT NULL DEFAULT 0,
+    errors       INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_topics_due ON topics (next_poll_at);
+
+CREATE TABLE IF NOT EXISTS alerts (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    watch_id     INTEGER NOT NULL,
+    keyword      TEXT    NOT NULL,
+    target_price INTEGER NOT NULL,
+    price        INTEGER NOT NULL,
+    title        TEXT    NOT NULL,
+    mall_name    TEXT    NOT NULL,
+    link         TEXT    NOT NULL,
+    triggered_at INTEGER NOT NULL,
+    seen         INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# 스케줄러 확인 주기 (초)
+TICK_SECONDS = 5.0
+# 변동이 없을 때 조회 간격 증가 배수
+STABLE_BACKOFF = 1.5
+# 목표가와 이 비율 이내로 가까워지면 조회 간격을 하한 근처로
+NEAR_TARGET_RATIO = 0.05
+# 조회 시각을 흩어 놓기 위한 간격 흔들기 비율 (±)
+JITTER = 0.1
+
+
+def next_interval(
+    previous: float,
+    last_price: Optional[int],
+    price: int,
+    target_price: Optional[int],
+    min_interval: float,
+    max_interval: float,
+    volatility: float
+) -> float:
+    """
+    다음 조회 간격 (초)
+
+    직전 조회 대비 가격 변동률이 volatility 이상이면 절반, 아니면 STABLE_BACKOFF배,
+    가장 높은 목표가와 NEAR_TARGET_RATIO 이내로 가까우면 min_interval의 2배 이하로 제한
+    """
+    interval = previous
+    if last_price:
+        change = abs(price - last_price) / last_price
+        interval = previous / 2 if change >= volatility else previous * STABLE_BACKOFF
+    if target_price and price and (price - target_price) / price <= NEAR_TARGET_RATIO:
+        interval = min(interval, min_interval * 2)
+    return min(max(interval, min_interval), max_interval)
+
+
+class PriceWatchStore:
+    """감시 / 조회 상태 / 알림 저장소 (동기 함수, asyncio.to_thread로 호출)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if not self._initialized:
+            conn.executescript(SCHEMA)
+            self._initialized = True
+        return conn
+
+    def add_watch(self, keyword: str, target_price: int, max_watches: int, min_interval: float) -> Dict[str, Any]:
+        """
+        감시 등록 (같은 키워드 topic이 있으면 합류, 없으면 바로 조회 대상으로 추가)
+
+        Raises:
+            ValidationError: 활성 감시 수가 max_watches에 도달
+        """
+        norm = normalize_keyword(keyword)
+        display = " ".join(keyword.split())
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                active = conn.execute("SELECT COUNT(*) FROM watches WHERE triggered_at IS NULL").fetchone()[0]
+                if active >= max_watches:
+                    raise ValidationError(f"가격 알림은 최대 {max_watches}개까지 등록할 수 있습니다.")
+                cursor = conn.execute(
+                    "INSERT INTO watches (keyword, display, target_price, created_at) VALUES (?, ?, ?, ?)",
+                    (norm, display, target_price, int(now))
+                )
+                # 이미 목표가 이하일 수 있으므로 기존 topic도 다음 확인 때 바로 조회
+                conn.execute(
+                    "INSERT INTO topics (keyword, display, interval, next_poll_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(keyword) DO UPDATE SET next_poll_at = MIN(next_poll_at, excluded.next_poll_at)",
+                    (norm, display, min_interval, now)
+                )
+                topic = conn.execute(
+                    "SELECT last_price, (SELECT COUNT(*) FROM watches WHERE keyword = ? AND triggered_at IS NULL) "
+                    "FROM topics WHERE keyword = ?",
+                    (norm, norm)
+                ).fetchone()
+        finally:
+            conn.close()
+        return {"id": cursor.lastrowid, "keyword": display, "target_price": target_price,
+                "last_price": topic[0], "shared_with": topic[1] - 1}
+
+    def remove_watch(self, watch_id: int) -> bool:
+        """감시 해제 (남은 감시가 없는 topic은 조회 중단)"""
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute("SELECT keyword FROM watches WHERE id = ?", (watch_id,)).fetchone()
+                if row is None:
+                    return False
+                conn.execute("DELETE FROM watches WHERE id = ?", (watch_id,))
+                self._drop_idle_topic(conn, row[0])
+        finally:
+            conn.close()
+        return True
+
+    @staticmethod
+    def _drop_idle_topic(conn: sqlite3.Connection, keyword: str) -> None:
+        conn.execute(
+            "DELETE FROM topics WHERE keyword = ? AND NOT EXISTS "
+            "(SELECT 1 FROM watches WHERE keyword = ? AND triggered_at IS NULL)",
+            (keyword, keyword)
+        )
+
+    def due_topics(self, now: float, limit: int) -> List[Dict[str, Any]]:
+        """조회 시각이 지난 topic (가장 오래 밀린 순)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT t.keyword, t.display, t.interval, t.next_poll_at, t.last_price, "
+                "(SELECT MAX(target_price) FROM watches w WHERE w.keyword = t.keyword AND w.triggered_at IS NULL) "
+                "FROM topics t WHERE t.next_poll_at <= ? ORDER BY t.next_poll_at LIMIT ?",
+                (now, limit)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [
+            {"keyword": keyword, "display": display, "interval": interval, "next_poll_at": next_poll_at,
+             "last_price": last_price, "target_price": target_price}
+            for keyword, display, interval, next_poll_at, last_price, target_price in rows
+        ]
+
+    def record_poll(self, keyword: str, price: int, item, interval: float, now: float) -> int:
+        """
+        조회 결과 기록 + 목표가 이하 감시를 알림으로 전환 (감시는 1회 알림 후 종료)
+
+        Returns:
+            새로 생긴 알림 수
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE topics SET interval = ?, next_poll_at = ?, last_price = ?, last_polled = ?, "
+                    "polls = polls + 1 WHERE keyword = ?",
+                    (interval, now + interval, price, now, keyword)
+                )
+                triggered = conn.execute(
+                    "SELECT id, display, target_price FROM watches "
+                    "WHERE keyword = ? AND triggered_at IS NULL AND target_price >= ?",
+                    (keyword, price)
+                ).fetchall()
+                if triggered:
+                    conn.executemany(
+                        "INSERT INTO alerts (watch_id, keyword, target_price, price, title, mall_name, link, "
+                        "triggered_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        [(watch_id, display, target, price, item.title, item.mall_name, item.link, int(now))
+                         for watch_id, display, target in triggered]
+                    )
+                    conn.executemany(
+                        "UPDATE watches SET triggered_at = ? WHERE id = ?",
+                        [(int(now), watch_id) for watch_id, _, _ in triggered]
+                    )
+                    self._drop_idle_topic(conn, keyword)
+        finally:
+            conn.close()
+        return len(triggered)
+
+    def record_failure(self, keyword: str, retry_after: float, now: float) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE topics SET next_poll_at = ?, errors = errors + 1 WHERE keyword = ?",
+                    (now + retry_after, keyword)
+                )
+        finally:
+            conn.close()
+
+    def watches(self) -> List[Dict[str, Any]]:
+        """활성 감시 목록 (topic 조회 상태 포함)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT w.id, w.display, w.target_price, w.created_at, t.last_price, t.last_polled, t.next_poll_at "
+                "FROM watches w LEFT JOIN topics t ON t.keyword = w.keyword "
+                "WHERE w.triggered_at IS NULL ORDER BY w.id"
+            ).fetchall()
+        finally:
+            conn.close()
+        return [
+            {"id": watch_id, "keyword": display, "target_price": target, "created_at": created_at,
+             "last_price": last_price, "last_polled": last_polled, "next_poll_at": next_poll_at}
+            for watch_id, display, target, created_at, last_price, last_polled, next_poll_at in rows
+        ]
+
+    def alerts(self, only_new: bool, limit: int) -> List[Dict[str, Any]]:
+        """알림 목록 (최신 순, 조회한 알림은 확인 처리)"""
+        conn = self._connect()
+        try:
+            with conn:
+                rows = conn.execute(
+                    "SELECT id, watch_id, keyword, target_price, price, title, mall_name, link, triggered_at, seen "
+                    "FROM alerts " + ("WHERE seen = 0 " if only_new else "") + "ORDER BY id DESC LIMIT ?",
+                    (limit,)
+                ).fetchall()
+                conn.executemany("UPDATE alerts SET seen = 1 WHERE id = ?", [(row[0],) for row in rows if not row[9]])
+        finally:
+            conn.close()
+        return [
+            {"id": alert_id, "watch_id": watch_id, "keyword": keyword, "target_price": target, "price": price,
+             "title": title, "mall_name": mall_name, "link": link, "triggered_at": triggered_at, "new": not seen}
+            for alert_id, watch_id, keyword, target, price, title, mall_name, link, triggered_at, seen in rows
+        ]
+
+    def counts(self) -> Dict[str, int]:
+        conn = self._connect()
+        try:
+            watches, topics, unseen = conn.execute(
+                "SELECT (SELECT COUNT(*) FROM watches WHERE triggered_at IS NULL), "
+                "(SELECT COUNT(*) FROM topics), (SELECT COUNT(*) FROM alerts WHERE seen = 0)"
+            ).fetchone()
+        finally:
+            conn.close()
+        return {"watches": watches, "topics": topics, "unseen_alerts": unseen}
+
+
+class PriceWatcher:
+    """
+    가격 감시 스케줄러
+
+    TICK_SECONDS마다 조회 시각이 지난 topic을 가져와 예산(토큰 버킷)이 허락하는 만큼
+    최대 concurrency개씩 동시에 조회합니다. 예산이 부족해 밀린 topic은 다음 확인 때
+    가장 먼저 조회됩니다.
+    """
+
+    def __init__(self, store: PriceWatchStore, polls_per_day: float):
+        self.store = store
+        self.concurrency = max(1, settings.PRICE_WATCH_CONCURRENCY)
+        # 일일 쿼터 무제한이면 동시 조회 수만 제한
+        rate = polls_per_day / 86400 if polls_per_day > 0 else self.concurrency / TICK_SECONDS
+        self.budget = TokenBucket(rate, self.concurrency)
+        self.polls_per_day = polls_per_day
+
+        self.polls = 0
+        self.poll_errors = 0
+        self.alerts_triggered = 0
+        self.deferred = 0
+        self.last_counts: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # 툴에서 호출
+    # ------------------------------------------------------------------
+
+    async def add(self, keyword: str, target_price: int) -> Dict[str, Any]:
+        """
+        Raises:
+            ValidationError: 검색어 / 목표가가 잘못됐거나 감시 수 한도 초과
+        """
+        if not keyword or not keyword.strip():
+            raise ValidationError("감시할 상품명을 입력해주세요.")
+        if len(keyword) > 100:
+            raise ValidationError("검색어는 100자 이하로 입력해주세요.")
+        if target_price <= 0:
+            raise ValidationError("목표가는 0원보다 커야 합니다.")
+        return await asyncio.to_thread(
+            self.store.add_watch, keyword, target_price,
+            settings.PRICE_WATCH_MAX_WATCHES, settings.PRICE_WATCH_MIN_INTERVAL
+        )
+
+    async def remove(self, watch_id: int) -> bool:
+        return await asyncio.to_thread(self.store.remove_watch, watch_id)
+
+    async def watches(self) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.store.watches)
+
+    async def alerts(self, only_new: bool = True, limit: int = 20) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.store.alerts, only_new, limit)
+
+    # ------------------------------------------------------------------
+    # 백그라운드 조회
+    # ------------------------------------------------------------------
+
+    async def run(self) -> None:
+        """감시 루프 (lifecycle에서 작업으로 실행, 취소 시 종료)"""
+        logger.info("가격 알림 감시 시작 (일일 조회 예산 %s회)", int(self.polls_per_day) or "무제한")
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error("가격 알림 감시 오류: %s", e, exc_info=True)
+            await asyncio.sleep(TICK_SECONDS)
+
+    async def tick(self) -> int:
+        """
+        조회 시각이 지난 topic 조회
+
+        Returns:
+            이번에 조회한 topic 수
+        """
+        now = time.time()
+        due = await asyncio.to_thread(self.store.due_topics, now, self.concurrency * 4)
+        batch = []
+        for topic in due:
+            if not self.budget.try_acquire():
+                self.deferred += len(due) - len(batch)
+                break
+            batch.append(topic)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def poll(topic: Dict[str, Any]) -> None:
+            async with semaphore:
+                await self._poll(topic)
+
+        await asyncio.gather(*(poll(topic) for topic in batch))
+        self.last_counts = await asyncio.to_thread(self.store.counts)
+        return len(batch)
+
+    async def _poll(self, topic: Dict[str, Any]) -> None:
+        from services.naver_api import get_naver_client
+
+        keyword = topic["keyword"]
+        try:
+            # 캐시의 오래된 응답(stale-while-revalidate)으로는 가격 변화를 놓칠 수 있어 항상 새로 조회
+            items = await get_naver_client().search(
+                topic["display"], display=settings.PRICE_WATCH_SAMPLE_SIZE, sort="sim", fresh=True
+            )
+            # 장애 중 제공되는 이전 결과로는 알림을 만들지 않음
+            if getattr(items, "stale_since", None) is not None:
+                raise RuntimeError("업스트림 장애로 이전 결과 제공 중")
+            stats = analyze_prices(items, iqr_k=settings.PRICE_STATS_IQR_K)
+        except Exception as e:
+            self.poll_errors += 1
+            logger.warning("가격 알림 조회 실패 (%s): %s", topic["display"], e)
+            await asyncio.to_thread(self.store.record_failure, keyword, settings.PRICE_WATCH_MIN_INTERVAL, time.time())
+            return
+
+        self.polls += 1
+        if stats is None:
+            # 검색 결과가 없으면 가격 변화 없이 다음 간격으로
+            interval = min(topic["interval"] * STABLE_BACKOFF, settings.PRICE_WATCH_MAX_INTERVAL)
+            await asyncio.to_thread(self.store.record_failure, keyword, interval, time.time())
+            return
+
+        price = stats["min"]
+        interval = next_interval(
+            topic["interval"], topic["last_price"], price, topic["target_price"],
+            settings.PRICE_WATCH_MIN_INTERVAL, settings.PRICE_WATCH_MAX_INTERVAL, settings.PRICE_WATCH_VOLATILITY
+        )
+        interval *= random.uniform(1 - JITTER, 1 + JITTER)
+        triggered = await asyncio.to_thread(
+            self.store.record_poll, keyword, price, stats["cheapest_item"], interval, time.time()
+        )
+        if triggered:
+            self.alerts_triggered += triggered
+            logger.info("🔔 가격 알림 %s건: '%s' %s원", triggered, topic["display"], price)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.last_counts,
+            "polls": self.polls,
+            "poll_errors": self.poll_errors,
+            "alerts_triggered": self.alerts_triggered,
+            "deferred": self.deferred,
+            "polls_per_day": self.polls_per_day
+        }
+
+
+# 싱글톤 인스턴스
+_watcher: Optional[PriceWatcher] = None
+
+
+def get_price_watcher() -> Optional[PriceWatcher]:
+    """가격 알림 감시기 반환 (비활성화 시 None)"""
+    global _watcher
+    if not settings.PRICE_WATCH_ENABLED:
+        return None
+    if _watcher is None:
+        # 일일 쿼터는 키별 한도이므로 키 수를 곱한 전체 한도에서 비율만큼 사용
+        from services.naver_api import get_naver_client
+
+        keys = get_naver_client().get_stats()["credentials"]["total"]
+        polls_per_day = settings.NAVER_DAILY_QUOTA * keys * settings.PRICE_WATCH_QUOTA_SHARE
+        _watcher = PriceWatcher(PriceWatchStore(settings.PRICE_WATCH_PATH), polls_per_day)
+    return _watcher
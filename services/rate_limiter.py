@@ -0,0 +1,253 @@
+"""
+네이버 API 호출 제한 관리
+초당 요청 수(토큰 버킷) + 일일 쿼터(KST 자정 초기화)
+"""
+import asyncio
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from utils.logger import logger
+
+
+# 네이버 일일 쿼터는 한국 시간 자정에 초기화됨
+KST = timezone(timedelta(hours=9))
+
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷 (단일 이벤트 루프 전용, 락 없음)
+
+    토큰을 미리 예약(음수 허용)하는 방식이라 대기자는 도착 순서대로 처리되며,
+    예상 대기 시간이 max_wait를 넘으면 기다리지 않고 즉시 거절합니다.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+
+        self.waiting = 0
+        self.rejected = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _reserve(self, max_wait: float) -> Optional[float]:
+        """토큰 1개 예약 후 대기 시간 반환 (불가능하면 None)"""
+        self._refill()
+        wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+        if wait > max_wait:
+            return None
+        self._tokens -= 1
+        return wait
+
+    def try_acquire(self) -> bool:
+        """대기 없이 토큰 획득 시도"""
+        return self._reserve(0.0) is not None
+
+    async def acquire(self, max_wait: float) -> bool:
+        """
+        토큰 획득 (필요하면 최대 max_wait초 대기)
+
+        Returns:
+            획득 성공 여부 (대기 한도 초과 시 False)
+        """
+        wait = self._reserve(max_wait)
+        if wait is None:
+            self.rejected += 1
+            return False
+
+        if wait > 0:
+            self.waiting += 1
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # 취소된 대기자의 예약 토큰 반환
+                self._tokens += 1
+                raise
+            finally:
+                self.waiting -= 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "rate_per_sec": self.rate,
+            "capacity": self.capacity,
+            "tokens": round(self._tokens, 2),
+            "waiting": self.waiting,
+            "rejected": self.rejected
+        }
+
+
+def _next_kst_midnight(now: float) -> float:
+    current = datetime.fromtimestamp(now, KST)
+    midnight = (current + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return midnight.timestamp()
+
+
+def _kst_day(now: float) -> str:
+    return datetime.fromtimestamp(now, KST).strftime("%Y-%m-%d")
+
+
+class DailyQuota:
+    """일일 호출 쿼터 카운터 (limit이 0이면 무제한)"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self.reset_at = _next_kst_midnight(time.time())
+
+    def _roll(self) -> None:
+        now = time.time()
+        if now >= self.reset_at:
+            self.used = 0
+            self.reset_at = _next_kst_midnight(now)
+
+    def try_consume(self) -> bool:
+        """쿼터 1회 차감 (소진 시 False)"""
+        self._roll()
+        if self.limit and self.used >= self.limit:
+            return False
+        self.used += 1
+        return True
+
+    def refund(self) -> None:
+        """실제로 전송되지 않은 요청의 쿼터 반환"""
+        if self.used > 0:
+            self.used -= 1
+
+    async def replenish(self) -> None:
+        """차감 전 준비 (프로세스 안 카운터는 준비할 것 없음)"""
+
+    @property
+    def remaining(self) -> Optional[int]:
+        self._roll()
+        if not self.limit:
+            return None
+        return max(self.limit - self.used, 0)
+
+    def reset_time_kst(self) -> str:
+        return datetime.fromtimestamp(self.reset_at, KST).strftime("%Y-%m-%d %H:%M")
+
+    def close(self) -> None:
+        """종료 시 정리 (반납할 예약분 없음)"""
+
+    def stats(self) -> Dict[str, Any]:
+        self._roll()
+        return {
+            "limit": self.limit,
+            "used": self.used,
+            "remaining": self.remaining,
+            "reset_at_kst": self.reset_time_kst()
+        }
+
+
+class SharedDailyQuota(DailyQuota):
+    """
+    워커 프로세스 간 공유 일일 쿼터
+
+    공유 장부(SharedState)에서 lease_size 단위로 예약한 뒤 프로세스 안에서 차감합니다.
+    장부 접근(SQLite 잠금 대기 포함)은 asyncio.to_thread로 이벤트 루프 밖에서 실행하고,
+    try_consume은 메모리의 예약분만 차감합니다.
+    - 예약분이 절반 이하로 줄면 백그라운드에서 미리 추가 예약 (키당 1개만 실행)
+    - 예약분이 비었으면 replenish()에서 예약이 끝날 때까지 대기
+    사용하지 않은 예약분은 종료 시 반납합니다.
+    (비정상 종료 시 워커당 최대 lease_size + lease_size // 2회가 사용되지 않은 채 차감됨)
+
+    used는 이 프로세스의 사용량, remaining은 마지막 예약 시점의 전체 잔여량 기준입니다.
+    (첫 예약 전에는 limit)
+    """
+
+    def __init__(self, limit: int, ledger: Any, client_id: str, lease_size: int):
+        super().__init__(limit)
+        self.ledger = ledger
+        self.client_id = client_id
+        self.lease_size = max(lease_size, 1)
+        self._day = _kst_day(time.time())
+        self._leased = 0
+        self._global_used: Optional[int] = None
+        self._leasing: Optional[asyncio.Task] = None
+
+    def _roll(self) -> None:
+        now = time.time()
+        if now >= self.reset_at:
+            # 이전 날짜 예약분은 의미가 없으므로 반납하지 않음
+            self.used = 0
+            self.reset_at = _next_kst_midnight(now)
+            self._day = _kst_day(now)
+            self._leased = 0
+            self._global_used = None
+
+    def _exhausted(self) -> bool:
+        return self._global_used is not None and self._global_used >= self.limit
+
+    def _start_lease(self) -> asyncio.Task:
+        if self._leasing is None:
+            self._leasing = asyncio.ensure_future(self._lease(self._day))
+        return self._leasing
+
+    async def _lease(self, day: str) -> None:
+        try:
+            granted, global_used = await asyncio.to_thread(
+                self.ledger.lease_quota, self.client_id, day, self.lease_size, self.limit
+            )
+        except sqlite3.Error as e:
+            logger.warning("공유 쿼터 예약 실패: %s", e)
+            return
+        finally:
+            self._leasing = None
+        # 예약하는 동안 날짜가 바뀌었으면 이전 날짜 예약분은 버림
+        if day == self._day:
+            self._leased += granted
+            self._global_used = global_used
+
+    async def replenish(self) -> None:
+        """예약분이 비었으면 공유 장부에서 예약 (대기자가 취소돼도 예약은 계속 진행)"""
+        self._roll()
+        if self.limit and self._leased == 0 and not self._exhausted():
+            await asyncio.shield(self._start_lease())
+
+    def try_consume(self) -> bool:
+        self._roll()
+        if not self.limit:
+            self.used += 1
+            return True
+        if self._leased == 0:
+            return False
+        self._leased -= 1
+        self.used += 1
+        if self._leased <= self.lease_size // 2 and not self._exhausted():
+            self._start_lease()
+        return True
+
+    def refund(self) -> None:
+        if self.used > 0:
+            self.used -= 1
+            if self.limit:
+                self._leased += 1
+
+    @property
+    def remaining(self) -> Optional[int]:
+        self._roll()
+        if not self.limit:
+            return None
+        if self._global_used is None:
+            return self.limit
+        return max(self.limit - self._global_used, 0) + self._leased
+
+    def close(self) -> None:
+        """사용하지 않은 예약분 반납"""
+        if self._leased:
+            self.ledger.return_quota(self.client_id, self._day, self._leased)
+            self._leased = 0
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["leased"] = self._leased
+        return stats
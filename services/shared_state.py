@@ -0,0 +1,227 @@
+"""
+워커 프로세스 간 공유 상태 (SQLite WAL)
+다중 워커 모드에서 검색 응답 캐시(L2)와 일일 쿼터 장부를 Redis 없이 공유
+
+- 응답 캐시: 워커별 인메모리 캐시(L1) 미스 시 조회, 업스트림 응답은 백그라운드로 기록
+- 쿼터 장부: 워커가 quota_lease_size 단위로 미리 예약해 요청마다 DB에 쓰지 않음
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from config import settings
+from utils.logger import logger
+from services.models import ShoppingItem, decode_items, encode_items
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS response_cache (
+    key         TEXT PRIMARY KEY,
+    value       BLOB    NOT NULL,
+    expires_at  REAL    NOT NULL,
+    stale_until REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_stale ON response_cache (stale_until);
+
+CREATE TABLE IF NOT EXISTS quota_ledger (
+    client_id TEXT    NOT NULL,
+    day       TEXT    NOT NULL,
+    used      INTEGER NOT NULL,
+    PRIMARY KEY (client_id, day)
+);
+"""
+
+# 이 횟수만큼 기록할 때마다 만료 / 초과 엔트리 정리
+PRUNE_EVERY = 256
+
+
+class SharedState:
+    """
+    공유 SQLite 저장소
+
+    연결은 스레드마다 따로 엽니다. (캐시 / 쿼터 예약 모두 asyncio.to_thread로 호출)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    # ------------------------------------------------------------------
+    # 응답 캐시
+    # ------------------------------------------------------------------
+
+    def cache_get(self, key: str) -> Optional[Tuple[bytes, float, float]]:
+        """(값, 만료 시각, stale 만료 시각) - 없거나 stale 기간도 지났으면 None"""
+        row = self._conn().execute(
+            "SELECT value, expires_at, stale_until FROM response_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or row[2] <= time.time():
+            return None
+        return row
+
+    def cache_set(self, key: str, value: bytes, ttl: float, stale_ttl: float) -> None:
+        now = time.time()
+        self._conn().execute(
+            "INSERT OR REPLACE INTO response_cache (key, value, expires_at, stale_until) VALUES (?, ?, ?, ?)",
+            (key, value, now + ttl, now + ttl + stale_ttl)
+        )
+
+    def cache_prune(self, max_entries: int) -> int:
+        """만료 엔트리 삭제 후 max_entries 초과분을 먼저 만료되는 순서로 삭제"""
+        conn = self._conn()
+        removed = conn.execute("DELETE FROM response_cache WHERE stale_until <= ?", (time.time(),)).rowcount
+        count = conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+        if count > max_entries:
+            removed += conn.execute(
+                "DELETE FROM response_cache WHERE key IN "
+                "(SELECT key FROM response_cache ORDER BY expires_at LIMIT ?)",
+                (count - max_entries,)
+            ).rowcount
+        return removed
+
+    # ------------------------------------------------------------------
+    # 쿼터 장부
+    # ------------------------------------------------------------------
+
+    def lease_quota(self, client_id: str, day: str, want: int, limit: int) -> Tuple[int, int]:
+        """
+        쿼터 예약
+
+        Returns:
+            (예약된 수, 예약 후 전체 사용량)
+        """
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT used FROM quota_ledger WHERE client_id = ? AND day = ?", (client_id, day)
+            ).fetchone()
+            used = row[0] if row else 0
+            granted = max(min(want, limit - used), 0)
+            if granted:
+                conn.execute(
+                    "INSERT INTO quota_ledger (client_id, day, used) VALUES (?, ?, ?) "
+                    "ON CONFLICT(client_id, day) DO UPDATE SET used = used + excluded.used",
+                    (client_id, day, granted)
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return granted, used + granted
+
+    def return_quota(self, client_id: str, day: str, count: int) -> None:
+        """사용하지 않은 예약분 반납"""
+        if count <= 0:
+            return
+        self._conn().execute(
+            "UPDATE quota_ledger SET used = MAX(used - ?, 0) WHERE client_id = ? AND day = ?",
+            (count, client_id, day)
+        )
+
+
+class SharedCache:
+    """
+    공유 응답 캐시 (L2)
+
+    SQLite 접근은 이벤트 루프 밖(asyncio.to_thread)에서 실행합니다.
+    """
+
+    def __init__(self, state: SharedState, ttl: float, stale_ttl: float, max_entries: int):
+        self.state = state
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._writes = 0
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(key, ensure_ascii=False)
+
+    async def get(self, key: Hashable) -> Tuple[Optional[List[ShoppingItem]], bool, float]:
+        """
+        Returns:
+            (결과, stale 여부, 신선한 상태로 남은 시간) - 없으면 (None, False, 0)
+        """
+        try:
+            row = await asyncio.to_thread(self.state.cache_get, self._key(key))
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("공유 캐시 조회 실패: %s", e)
+            return None, False, 0.0
+
+        if row is None:
+            self.misses += 1
+            return None, False, 0.0
+        value, expires_at, _ = row
+        fresh_for = expires_at - time.time()
+        if fresh_for > 0:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return decode_items(value), fresh_for <= 0, max(fresh_for, 0.0)
+
+    async def set(self, key: Hashable, items: List[ShoppingItem]) -> None:
+        value = encode_items(items)
+        self._writes += 1
+        prune = self._writes % PRUNE_EVERY == 0
+        try:
+            await asyncio.to_thread(self._write, self._key(key), value, prune)
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("공유 캐시 기록 실패: %s", e)
+
+    def _write(self, key: str, value: bytes, prune: bool) -> None:
+        self.state.cache_set(key, value, self.ttl, self.stale_ttl)
+        if prune:
+            self.state.cache_prune(self.max_entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0
+        }
+
+
+# 싱글톤 인스턴스
+_shared_state: Optional[SharedState] = None
+
+
+def get_shared_state() -> Optional[SharedState]:
+    """공유 저장소 반환 (단일 워커 모드에서는 None)"""
+    global _shared_state
+    if settings.SERVER_WORKERS <= 1:
+        return None
+    if _shared_state is None:
+        _shared_state = SharedState(settings.SHARED_STATE_PATH)
+    return _shared_state
@@ -0,0 +1,607 @@
+"""
+검색어 추천 색인 (업스트림 호출 없음)
+이전 검색어와 검색 결과 상품명 / 브랜드로 메모리 색인을 만들어
+검색어 자동 완성과 오타 교정("혹시 ~을 찾으셨나요?")을 제공
+
+- 자동 완성: 정렬된 단어 배열에서 이진 탐색으로 접두어 범위를 찾고 가중치 상위 단어 반환
+  (본 배열 + 최근 추가분 배열 2단계, 새 단어는 작은 배열만 다시 정렬하고 본 배열은 가끔 합침)
+- 오타 교정: 자모 단위로 분해한 단어의 3-gram 역색인으로 후보를 좁힌 뒤 편집 거리 계산
+  (한글 한 글자의 받침 / 모음 오타가 편집 거리 1이 되도록 자모 단위로 비교)
+- 갱신: 요청 경로에서는 큐에 넣기만 하고 전용 스레드가 토큰화 / 색인 반영 (가격 이력 저장소와 같은 방식)
+- 메모리: 단어 수가 max_terms를 넘으면 가중치 낮은 단어부터 제외하고 다시 구성
+- 시작 시 가격 이력 DB의 검색어 / 상품명으로 색인을 채움
+"""
+import atexit
+import bisect
+import heapq
+import os
+import queue
+import sqlite3
+import threading
+import time
+from array import array
+from collections import Counter, OrderedDict
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import settings
+from utils.logger import logger
+from services.clustering import title_tokens
+from services.models import ShoppingItem
+from services.price_history import normalize_keyword
+
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 시 순수 파이썬 구현 사용
+    np = None
+
+
+# 출처별 가중치 (결과가 있었던 검색어 > 브랜드 > 상품명 단어 / 앞부분 구)
+KEYWORD_WEIGHT = 5.0
+BRAND_WEIGHT = 2.0
+TITLE_WEIGHT = 1.0
+
+# 접두어 범위가 이보다 넓으면(짧은 접두어) 본 배열의 상위 결과를 캐시
+_SCAN_LIMIT = 2000
+_PREFIX_CACHE_SIZE = 1024
+_CACHED_TOP = 50
+# 오타 교정 시 편집 거리를 계산할 최대 후보 수
+_FUZZY_CANDIDATES = 16
+# 최근 추가분 배열이 본 배열의 이 비율을 넘으면 본 배열에 합침
+_RECENT_RATIO = 16
+
+# 접두어 범위 끝 (어떤 문자보다 큰 코드 포인트)
+_MAX_CHAR = "\U0010ffff"
+
+_STOP = object()
+
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONG = ("",) + tuple("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+# 한글 음절 → 자모 (str.translate용), 공백 제거
+_JAMO_TABLE: Dict[int, Optional[str]] = {
+    0xAC00 + index: _CHO[index // 588] + _JUNG[index % 588 // 28] + _JONG[index % 28]
+    for index in range(11172)
+}
+_JAMO_TABLE[ord(" ")] = None
+
+
+def fuzzy_key(term: str) -> str:
+    """오타 비교용 키 (한글은 자모로 분해, 공백 제거)"""
+    return term.translate(_JAMO_TABLE)
+
+
+def _grams(key: str) -> set:
+    padded = f"\x02{key}\x03"
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+def _bucket(length: int) -> str:
+    """역색인 키 앞에 붙이는 키 길이 (편집 거리 허용 범위 밖 길이의 단어는 처음부터 제외)"""
+    return chr(min(length, 0xFFFF))
+
+
+def _max_distance(key: str) -> int:
+    """키 길이별 허용 편집 거리 (너무 짧은 단어는 교정하지 않음)"""
+    if len(key) <= 3:
+        return 0
+    if len(key) <= 6:
+        return 1
+    return 2 if len(key) <= 12 else 3
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    편집 거리 (Levenshtein, limit를 넘으면 limit + 1 반환)
+
+    대각선에서 limit 이내 칸만 계산하고, 한 행이 모두 limit를 넘으면 바로 멈춥니다.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    over = limit + 1
+    previous = [column if column <= limit else over for column in range(len(b) + 1)]
+    for row in range(1, len(a) + 1):
+        char_a = a[row - 1]
+        low, high = max(1, row - limit), min(len(b), row + limit)
+        current = [over] * (len(b) + 1)
+        if row <= limit:
+            current[0] = row
+        best = current[0]
+        for column in range(low, high + 1):
+            value = previous[column - 1] + (char_a != b[column - 1])
+            if previous[column] + 1 < value:
+                value = previous[column] + 1
+            if current[column - 1] + 1 < value:
+                value = current[column - 1] + 1
+            current[column] = value if value < over else over
+            if value < best:
+                best = value
+        if best > limit:
+            return over
+        previous = current
+    return previous[-1]
+
+
+def _shared_gram_candidates(postings: List[array], needed: int) -> List[int]:
+    """역색인 목록에 needed번 이상 나온 단어 id (많이 나온 순, 최대 _FUZZY_CANDIDATES개)"""
+    if np is not None:
+        # 쓰기 스레드가 원본 배열에 추가할 수 있으므로 복사본으로 계산 (버퍼를 공유하면 추가가 실패함)
+        ids = array("I")
+        for posting in postings:
+            ids.extend(posting)
+        unique, counts = np.unique(np.frombuffer(ids, dtype=np.uintc), return_counts=True)
+        matched = counts >= needed
+        unique, counts = unique[matched], counts[matched]
+        if len(unique) > _FUZZY_CANDIDATES:
+            top = np.argpartition(-counts, _FUZZY_CANDIDATES)[:_FUZZY_CANDIDATES]
+            unique, counts = unique[top], counts[top]
+        return unique[np.argsort(-counts, kind="stable")].tolist()
+
+    counts: Counter = Counter()
+    for posting in postings:
+        counts.update(posting)
+    matched = ((term_id, count) for term_id, count in counts.items() if count >= needed)
+    return [term_id for term_id, _ in heapq.nlargest(_FUZZY_CANDIDATES, matched, key=itemgetter(1))]
+
+
+def terms_from_results(keyword: str, items: List[ShoppingItem]) -> Dict[str, float]:
+    """
+    검색 결과에서 색인할 단어 추출 (검색어 1개 + 상품명 단어 / 앞 2~3단어 구 + 브랜드)
+
+    한 번의 검색 결과 안에서는 같은 단어를 한 번만 셉니다 (같은 상품 목록이 많아도 과대 평가 방지).
+    """
+    terms: Dict[str, float] = {}
+    for item in items:
+        tokens = title_tokens(item.title)
+        for token in tokens:
+            # 숫자만 있는 단어(용량 / 모델 번호)는 앞 단어와 묶인 구로만 추천
+            if len(token) > 1 and not token.isdigit():
+                terms.setdefault(token, TITLE_WEIGHT)
+        for size in (2, 3):
+            if len(tokens) >= size:
+                terms.setdefault(" ".join(tokens[:size]), TITLE_WEIGHT)
+        if item.brand:
+            brand = normalize_keyword(item.brand)
+            terms[brand] = max(terms.get(brand, 0.0), BRAND_WEIGHT)
+    keyword = normalize_keyword(keyword)
+    if keyword:
+        terms[keyword] = KEYWORD_WEIGHT
+    return terms
+
+
+class _Tier:
+    """정렬된 단어 배열 (단어 / 같은 순서의 단어 id) + 짧은 접두어 상위 결과 캐시"""
+
+    __slots__ = ("terms", "ids", "top")
+
+    def __init__(self, terms: List[str], ids: array):
+        self.terms = terms
+        self.ids = ids
+        self.top: "OrderedDict[str, List[int]]" = OrderedDict()
+
+    @classmethod
+    def build(cls, all_terms: List[str], ids: List[int]) -> "_Tier":
+        ordered = sorted(ids, key=all_terms.__getitem__)
+        return cls([all_terms[term_id] for term_id in ordered], array("I", ordered))
+
+    @classmethod
+    def merge(cls, large: "_Tier", small: "_Tier") -> "_Tier":
+        """
+        정렬된 두 배열 병합 (작은 쪽 단어마다 큰 쪽에서 삽입 위치를 찾아 구간 단위로 복사)
+
+        전체를 다시 정렬하지 않아 작은 쪽 크기에 비례한 시간이 걸리고,
+        파이썬 반복문이라 병합 중에도 이벤트 루프 스레드가 GIL을 얻을 수 있습니다.
+        """
+        if len(small) > len(large):
+            large, small = small, large
+        terms: List[str] = []
+        ids = array("I")
+        start = 0
+        for term, term_id in zip(small.terms, small.ids):
+            position = bisect.bisect_left(large.terms, term, start)
+            terms.extend(large.terms[start:position])
+            ids.extend(large.ids[start:position])
+            terms.append(term)
+            ids.append(term_id)
+            start = position
+        terms.extend(large.terms[start:])
+        ids.extend(large.ids[start:])
+        return cls(terms, ids)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def find(self, term: str) -> Optional[int]:
+        position = bisect.bisect_left(self.terms, term)
+        if position < len(self.terms) and self.terms[position] == term:
+            return self.ids[position]
+        return None
+
+    def best(self, prefix: str, limit: int, weights: array) -> List[int]:
+        """접두어로 시작하는 단어 중 가중치 상위 limit개의 id"""
+        low = bisect.bisect_left(self.terms, prefix)
+        high = bisect.bisect_left(self.terms, prefix + _MAX_CHAR, low)
+        if high - low <= _SCAN_LIMIT:
+            return heapq.nlargest(limit, self.ids[low:high], key=weights.__getitem__)
+
+        cached = self.top.get(prefix)
+        if cached is None:
+            cached = heapq.nlargest(_CACHED_TOP, self.ids[low:high], key=weights.__getitem__)
+            self.top[prefix] = cached
+            if len(self.top) > _PREFIX_CACHE_SIZE:
+                self.top.popitem(last=False)
+        else:
+            self.top.move_to_end(prefix)
+        return cached[:limit]
+
+
+class _Index:
+    """
+    색인 데이터 (쓰기 스레드만 수정, 조회 쪽은 참조를 잡고 읽기만)
+
+    단어 id는 terms / weights의 위치이며 다시 구성(제외)하기 전까지 바뀌지 않습니다.
+    weights는 제자리에서 고치지 않고 새 배열로 교체합니다. (조회 쪽은 tiers → weights 순서로 참조)
+    """
+
+    def __init__(self):
+        self.terms: List[str] = []
+        self.weights = array("d")
+        self.grams: Dict[str, array] = {}
+        # (본 배열, 최근 추가분 배열) - 한 번에 교체해 조회 중에도 일관된 상태를 보장
+        self.tiers: Tuple[_Tier, _Tier] = (_Tier([], array("I")), _Tier([], array("I")))
+
+    def find(self, term: str) -> Optional[int]:
+        for tier in self.tiers:
+            term_id = tier.find(term)
+            if term_id is not None:
+                return term_id
+        return None
+
+    def extend(self, entries, bumps: Optional[Dict[int, float]] = None) -> List[int]:
+        """단어 추가 + 기존 단어 가중치 증가 반영 후 새 id 목록 반환"""
+        weights = array("d", self.weights)
+        for term_id, weight in (bumps or {}).items():
+            weights[term_id] += weight
+        new_ids: List[int] = []
+        additions: Dict[str, List[int]] = {}
+        for term, weight in entries:
+            term_id = len(self.terms)
+            self.terms.append(term)
+            weights.append(weight)
+            new_ids.append(term_id)
+            key = fuzzy_key(term)
+            bucket = _bucket(len(key))
+            for gram in _grams(key):
+                additions.setdefault(bucket + gram, []).append(term_id)
+        # 새 id가 gram 역색인 / tiers에 보이기 전에 가중치 배열부터 교체
+        self.weights = weights
+
+        grams = self.grams
+        for gram, ids in additions.items():
+            posting = grams.get(gram)
+            if posting is None:
+                grams[gram] = array("I", ids)
+            else:
+                posting.extend(ids)
+        return new_ids
+
+
+class SuggestIndex:
+    """
+    검색어 추천 색인
+
+    - record(): 논블로킹 (큐가 가득 차면 버리고 dropped 카운트 증가)
+    - 반영: 전용 스레드가 merge_batch개 또는 merge_interval초 단위로 새 단어를 색인에 합침
+      (아직 합치지 않은 단어도 자동 완성에는 바로 반영)
+    - 조회: complete() / did_you_mean()은 이벤트 루프에서 바로 호출 (I/O 없음)
+    """
+
+    def __init__(
+        self,
+        max_terms: int,
+        merge_batch: int,
+        merge_interval: float,
+        queue_size: int,
+        seed_path: Optional[str] = None,
+        seed_limit: int = 0
+    ):
+        self.max_terms = max_terms
+        self.merge_batch = merge_batch
+        self.merge_interval = merge_interval
+        self.seed_path = seed_path
+        self.seed_limit = seed_limit
+
+        self._index = _Index()
+        self._pending: Dict[str, float] = {}
+        self._bumps: Dict[int, float] = {}  # 이미 색인된 단어 id → 합치기 전 가중치 증가분
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        self.dropped = 0
+        self.merges = 0
+        self.rebuilds = 0
+        self.evicted = 0
+        self.seeded = 0
+        self.last_merge_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._index.terms) + len(self._pending)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """반영 스레드 시작 (첫 기록 / 조회 시 자동 호출, 시작 직후 가격 이력으로 색인 채움)"""
+        with self._start_lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(target=self._run, name="suggest-indexer", daemon=True)
+            self._worker.start()
+            atexit.register(self.close)
+
+    def record(self, keyword: str, items: List[ShoppingItem]) -> None:
+        """검색 결과 반영 (요청 경로용, 블로킹 없음, 결과가 없던 검색어는 오타일 수 있어 제외)"""
+        if not items:
+            return
+        if self._worker is None:
+            self.start()
+        try:
+            self._queue.put_nowait((keyword, items))
+        except queue.Full:
+            self.dropped += 1
+
+    def add_terms(self, term_weights: Dict[str, float]) -> None:
+        """
+        단어 가중치 반영 (호출한 스레드에서 바로 실행, 반영 스레드 / 일괄 적재용)
+
+        새 단어는 merge_batch개가 모이면 색인에 합치고, 이미 있는 단어의 가중치 증가분은
+        다음 합치기 때 함께 반영합니다.
+        """
+        index = self._index
+        bumps = self._bumps
+        for term, weight in term_weights.items():
+            term_id = index.find(term)
+            if term_id is None:
+                self._pending[term] = self._pending.get(term, 0.0) + weight
+            else:
+                bumps[term_id] = bumps.get(term_id, 0.0) + weight
+        if len(self._pending) >= self.merge_batch:
+            self.flush()
+
+    def flush(self) -> None:
+        """대기 중인 새 단어 / 가중치 증가분을 색인에 합침 (단어 수가 max_terms를 넘으면 다시 구성)"""
+        if not self._pending and not self._bumps:
+            return
+        started = time.perf_counter()
+        pending = self._pending
+        index = self._index
+        main, recent = index.tiers
+
+        new_ids = index.extend(pending.items(), self._bumps)
+        self._bumps = {}
+        if len(index.terms) > self.max_terms:
+            self._rebuild()
+        elif new_ids:
+            recent = _Tier.merge(recent, _Tier.build(index.terms, new_ids))
+            if len(recent) > max(self.merge_batch * 8, len(main) // _RECENT_RATIO):
+                index.tiers = (_Tier.merge(main, recent), _Tier([], array("I")))
+            else:
+                index.tiers = (main, recent)
+        # 색인에 반영된 뒤에 비워야 조회 시 단어가 잠시 사라지지 않음
+        self._pending = {}
+
+        self.merges += 1
+        self.last_merge_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    def _rebuild(self) -> None:
+        """가중치 상위 90%만 남겨 색인 다시 구성 (매번 다시 구성하지 않도록 여유를 둠)"""
+        old = self._index
+        keep = int(self.max_terms * 0.9)
+        kept = heapq.nlargest(keep, range(len(old.terms)), key=old.weights.__getitem__)
+        index = _Index()
+        index.extend((old.terms[term_id], old.weights[term_id]) for term_id in kept)
+        index.tiers = (_Tier.build(index.terms, list(range(len(index.terms)))), _Tier([], array("I")))
+        self._index = index
+        self.evicted += len(old.terms) - len(index.terms)
+        self.rebuilds += 1
+
+    def _run(self) -> None:
+        try:
+            self._seed()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("검색어 추천 색인 초기화 실패: %s", e)
+
+        deadline = time.monotonic() + self.merge_interval
+        while True:
+            try:
+                entry = self._queue.get(timeout=max(deadline - time.monotonic(), 0.01))
+            except queue.Empty:
+                entry = None
+
+            if entry is _STOP:
+                self.flush()
+                break
+            if entry is not None:
+                try:
+                    self.add_terms(terms_from_results(*entry))
+                except Exception as e:
+                    logger.error("검색어 추천 색인 반영 실패: %s", e, exc_info=True)
+
+            if time.monotonic() >= deadline:
+                self.flush()
+                deadline = time.monotonic() + self.merge_interval
+
+    def _seed(self) -> None:
+        """가격 이력 DB의 검색어(검색 횟수 비례) / 최근 상품명으로 색인 채우기"""
+        if not self.seed_path or not self.seed_limit or not os.path.exists(self.seed_path):
+            return
+        started = time.perf_counter()
+        conn = sqlite3.connect(f"file:{self.seed_path}?mode=ro", uri=True, timeout=10)
+        try:
+            keywords = conn.execute(
+                "SELECT keyword, COUNT(DISTINCT observed_at) FROM price_observations "
+                "GROUP BY keyword ORDER BY 2 DESC LIMIT ?",
+                (self.seed_limit,)
+            ).fetchall()
+            titles = conn.execute(
+                "SELECT title FROM products ORDER BY last_seen DESC LIMIT ?", (self.seed_limit,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        terms: Dict[str, float] = {}
+        for (title,) in titles:
+            for term, weight in terms_from_results("", [ShoppingItem(title=title, link="", lprice=0)]).items():
+                terms[term] = terms.get(term, 0.0) + weight
+        for keyword, searches in keywords:
+            terms[keyword] = terms.get(keyword, 0.0) + KEYWORD_WEIGHT * searches
+        self.add_terms(terms)
+        self.flush()
+        self.seeded = len(terms)
+        logger.info(
+            "검색어 추천 색인 초기화: 단어 %s개 (%.0fms)", len(self._index.terms), (time.perf_counter() - started) * 1000
+        )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """대기 중인 단어를 반영하고 반영 스레드 종료"""
+        if self._worker is None:
+            return
+        self._queue.put(_STOP)
+        self._worker.join(timeout)
+        self._worker = None
+
+    # ------------------------------------------------------------------
+    # 조회 (이벤트 루프에서 바로 실행)
+    # ------------------------------------------------------------------
+
+    def contains(self, term: str) -> bool:
+        pending = self._pending
+        return term in pending or self._index.find(term) is not None
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """접두어 자동 완성 (가중치 높은 순, 입력과 같은 단어 제외)"""
+        prefix = normalize_keyword(prefix)
+        if not prefix:
+            return []
+        index = self._index
+        tiers = index.tiers
+        weights = index.weights
+        pending = self._pending
+        found: Dict[str, float] = {}
+        for tier in tiers:
+            for term_id in tier.best(prefix, limit + 1, weights):
+                found[index.terms[term_id]] = weights[term_id]
+        for term, weight in list(pending.items()):
+            if term.startswith(prefix):
+                found[term] = found.get(term, 0.0) + weight
+        found.pop(prefix, None)
+        return sorted(found.items(), key=lambda entry: (-entry[1], entry[0]))[:limit]
+
+    def correct(self, text: str, limit: int = 3) -> List[Tuple[str, int]]:
+        """
+        오타 교정 후보 (편집 거리 가까운 순, 같으면 가중치 높은 순)
+
+        Returns:
+            (단어, 자모 단위 편집 거리) 목록
+        """
+        key = fuzzy_key(text)
+        max_distance = _max_distance(key)
+        if not max_distance:
+            return []
+        index = self._index
+        grams = _grams(key)
+        # 편집 거리 허용 범위 안의 길이만 (길이별 3-gram 역색인)
+        postings = []
+        for length in range(max(len(key) - max_distance, 1), len(key) + max_distance + 1):
+            bucket = _bucket(length)
+            postings.extend(index.grams.get(bucket + gram) for gram in grams)
+        postings = [posting for posting in postings if posting]
+        if not postings:
+            return []
+
+        # 편집 1회는 3-gram을 최대 3개 바꾸므로, 공유 gram이 이보다 적은 단어는 후보에서 제외
+        needed = max(1, len(grams) - 3 * max_distance)
+        terms = index.terms
+        scored = [(term_id, fuzzy_key(terms[term_id])) for term_id in _shared_gram_candidates(postings, needed)]
+
+        results = []
+        weights = index.weights
+        for term_id, candidate in scored:
+            if candidate == key:
+                continue
+            distance = edit_distance(key, candidate, max_distance)
+            if distance <= max_distance:
+                results.append((distance, -weights[term_id], terms[term_id]))
+        results.sort()
+        return [(term, distance) for distance, _, term in results[:limit]]
+
+    def did_you_mean(self, query: str, limit: int = 3) -> List[str]:
+        """
+        검색어 교정 제안 (이미 색인에 있는 검색어면 빈 목록)
+
+        검색어 전체로 찾지 못하면 여러 단어 검색어는 단어별로 교정해 다시 조합합니다.
+        """
+        query = normalize_keyword(query)
+        if not query or self.contains(query):
+            return []
+        corrections = [term for term, _ in self.correct(query, limit)]
+        if corrections:
+            return corrections
+
+        tokens = query.split()
+        if len(tokens) < 2:
+            return []
+        fixed, changed = [], False
+        for token in tokens:
+            best = [] if token.isdigit() or self.contains(token) else self.correct(token, 1)
+            if best:
+                fixed.append(best[0][0])
+                changed = True
+            else:
+                fixed.append(token)
+        return [" ".join(fixed)] if changed else []
+
+    def suggest(self, query: str, limit: int = 10) -> Dict[str, Any]:
+        """자동 완성 + 교정 제안"""
+        if self._worker is None:
+            self.start()
+        return {"completions": self.complete(query, limit), "did_you_mean": self.did_you_mean(query)}
+
+    def stats(self) -> Dict[str, Any]:
+        main, recent = self._index.tiers
+        return {
+            "terms": len(self._index.terms),
+            "recent_terms": len(recent),
+            "pending": len(self._pending),
+            "queued": self._queue.qsize(),
+            "dropped": self.dropped,
+            "merges": self.merges,
+            "rebuilds": self.rebuilds,
+            "evicted": self.evicted,
+            "seeded": self.seeded,
+            "merge_ms": self.last_merge_ms
+        }
+
+
+# 싱글톤 인스턴스
+_suggest_index: Optional[SuggestIndex] = None
+
+
+def get_suggest_index() -> Optional[SuggestIndex]:
+    """검색어 추천 색인 반환 (비활성화 시 None)"""
+    global _suggest_index
+    if not settings.SUGGEST_ENABLED:
+        return None
+    if _suggest_index is None:
+        _suggest_index = SuggestIndex(
+            max_terms=settings.SUGGEST_MAX_TERMS,
+            merge_batch=settings.SUGGEST_MERGE_BATCH,
+            merge_interval=settings.SUGGEST_MERGE_INTERVAL,
+            queue_size=settings.SUGGEST_QUEUE_SIZE,
+            seed_path=settings.PRICE_HISTORY_PATH if settings.PRICE_HISTORY_ENABLED else None,
+            seed_limit=settings.SUGGEST_SEED_LIMIT
+        )
+    return _suggest_index
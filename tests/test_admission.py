@@ -0,0 +1,162 @@
+"""
+툴 호출 수락 제어 테스트
+클라이언트별 라운드 로빈 수락, 대기열 / 대기 시간 초과 거절, 슬롯 넘겨주기
+"""
+import asyncio
+
+import pytest
+
+from server.admission import AdmissionController
+from utils.exceptions import ServerBusyError
+
+
+def _controller(**overrides) -> AdmissionController:
+    options = {"max_concurrent": 1, "max_queue": 10, "queue_timeout": 5.0}
+    options.update(overrides)
+    return AdmissionController(**options)
+
+
+async def _enqueue(admission, client, order):
+    await admission.acquire(client)
+    order.append(client)
+
+
+async def _drain(admission, tasks):
+    """대기자가 모두 수락될 때까지 슬롯을 하나씩 반환"""
+    for _ in tasks:
+        admission.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+
+
+def test_admits_immediately_under_limit():
+    async def scenario():
+        admission = _controller(max_concurrent=2)
+        await admission.acquire("a")
+        await admission.acquire("b")
+        return admission.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["in_flight"] == 2
+    assert stats["queued"] == 0
+    assert stats["admitted"] == 2
+
+
+def test_fair_queuing_interleaves_clients():
+    async def scenario():
+        admission = _controller()
+        await admission.acquire("busy")
+        order = []
+        # a가 먼저 3개를 넣어도 b가 번갈아 수락됨
+        tasks = [asyncio.create_task(_enqueue(admission, "a", order)) for _ in range(3)]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(_enqueue(admission, "b", order)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert admission.stats()["clients_waiting"] == 2
+        await _drain(admission, tasks)
+        return admission, order
+
+    admission, order = asyncio.run(scenario())
+    assert order == ["a", "b", "a", "b", "a"]
+    assert admission.waited == 5
+    # 슬롯은 대기자에게 바로 넘겨지므로 실행 중 수는 그대로
+    assert admission.in_flight == 1
+
+
+def test_unfair_queuing_is_fifo():
+    async def scenario():
+        admission = _controller(fair=False)
+        await admission.acquire("busy")
+        order = []
+        tasks = [asyncio.create_task(_enqueue(admission, "a", order)) for _ in range(2)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(_enqueue(admission, "b", order)))
+        await asyncio.sleep(0)
+        await _drain(admission, tasks)
+        return order
+
+    assert asyncio.run(scenario()) == ["a", "a", "b"]
+
+
+def test_queue_full_is_rejected():
+    async def scenario():
+        admission = _controller(max_queue=1)
+        await admission.acquire("busy")
+        waiter = asyncio.create_task(admission.acquire("a"))
+        await asyncio.sleep(0)
+        with pytest.raises(ServerBusyError) as raised:
+            await admission.acquire("b")
+        waiter.cancel()
+        return admission, raised.value
+
+    admission, error = asyncio.run(scenario())
+    assert error.details["reason"] == "queue_full"
+    assert admission.shed_queue_full == 1
+
+
+def test_per_client_limit_is_rejected():
+    async def scenario():
+        admission = _controller(max_queue_per_client=1)
+        await admission.acquire("busy")
+        waiter = asyncio.create_task(admission.acquire("a"))
+        await asyncio.sleep(0)
+        with pytest.raises(ServerBusyError) as raised:
+            await admission.acquire("a")
+        # 다른 클라이언트는 대기 가능
+        other = asyncio.create_task(admission.acquire("b"))
+        await asyncio.sleep(0)
+        queued = admission.queued
+        waiter.cancel()
+        other.cancel()
+        return raised.value, queued
+
+    error, queued = asyncio.run(scenario())
+    assert error.details["reason"] == "client_limit"
+    assert queued == 2
+
+
+def test_queue_timeout_is_rejected_and_dequeued():
+    async def scenario():
+        admission = _controller(queue_timeout=0.01)
+        await admission.acquire("busy")
+        with pytest.raises(ServerBusyError) as raised:
+            await admission.acquire("a")
+        return admission, raised.value
+
+    admission, error = asyncio.run(scenario())
+    assert error.details["reason"] == "timeout"
+    assert admission.shed_timeout == 1
+    assert admission.queued == 0
+    assert admission.stats()["clients_waiting"] == 0
+
+
+def test_release_skips_cancelled_waiters():
+    async def scenario():
+        admission = _controller()
+        await admission.acquire("busy")
+        cancelled = asyncio.create_task(admission.acquire("a"))
+        await asyncio.sleep(0)
+        order = []
+        waiter = asyncio.create_task(_enqueue(admission, "b", order))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        admission.release()
+        await waiter
+        return admission, order
+
+    admission, order = asyncio.run(scenario())
+    assert order == ["b"]
+    assert admission.in_flight == 1
+    assert admission.queued == 0
+
+
+def test_release_without_waiters_frees_slot():
+    async def scenario():
+        admission = _controller()
+        await admission.acquire("a")
+        admission.release()
+        await admission.acquire("b")
+        return admission
+
+    assert asyncio.run(scenario()).in_flight == 1
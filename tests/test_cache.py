@@ -0,0 +1,121 @@
+"""
+검색 응답 캐시 테스트
+TTL / stale-while-revalidate 구간, 개수 / 바이트 제한의 LRU 제거 순서
+"""
+import pytest
+
+from services import cache as cache_module
+from services.cache import SearchCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def _cache(**overrides) -> SearchCache:
+    options = {"max_entries": 10, "max_bytes": 1000, "ttl": 60.0, "stale_ttl": 30.0}
+    options.update(overrides)
+    return SearchCache(**options)
+
+
+def test_fresh_hit(clock):
+    cache = _cache()
+    cache.set("a", ["item"], 10)
+    clock.now += 59
+    assert cache.get("a") == (["item"], False)
+    assert cache.hits == 1
+
+
+def test_stale_hit_within_stale_window(clock):
+    cache = _cache()
+    cache.set("a", ["item"], 10)
+    clock.now += 60
+    assert cache.get("a") == (["item"], True)
+    clock.now += 29
+    assert cache.get("a") == (["item"], True)
+    assert cache.stale_hits == 2
+
+
+def test_expired_after_stale_window(clock):
+    cache = _cache()
+    cache.set("a", ["item"], 10)
+    clock.now += 90
+    assert cache.get("a") == (None, False)
+    assert cache.expirations == 1
+    assert len(cache) == 0
+    assert cache.stats()["bytes"] == 0
+
+
+def test_per_entry_ttl_override(clock):
+    cache = _cache()
+    cache.set("a", ["item"], 10, ttl=5.0, stale_ttl=0.0)
+    clock.now += 5
+    assert cache.get("a") == (None, False)
+
+
+def test_miss(clock):
+    cache = _cache()
+    assert cache.get("missing") == (None, False)
+    assert cache.misses == 1
+
+
+def test_evicts_least_recently_used_by_count(clock):
+    cache = _cache(max_entries=2)
+    cache.set("a", 1, 10)
+    cache.set("b", 2, 10)
+    cache.get("a")  # a가 최근 사용
+    cache.set("c", 3, 10)
+    assert cache.get("b") == (None, False)
+    assert cache.get("a") == (1, False)
+    assert cache.get("c") == (3, False)
+    assert cache.evictions == 1
+
+
+def test_evicts_by_bytes_in_lru_order(clock):
+    cache = _cache(max_bytes=100)
+    cache.set("a", 1, 40)
+    cache.set("b", 2, 40)
+    cache.set("c", 3, 50)
+    assert cache.get("a") == (None, False)
+    assert cache.get("b") == (2, False)
+    assert cache.stats()["bytes"] == 90
+
+
+def test_oversized_entry_is_not_cached(clock):
+    cache = _cache(max_bytes=100)
+    cache.set("a", 1, 10)
+    cache.set("big", 2, 101)
+    assert cache.get("big") == (None, False)
+    assert cache.get("a") == (1, False)
+
+
+def test_overwrite_replaces_size(clock):
+    cache = _cache()
+    cache.set("a", 1, 10)
+    cache.set("a", 2, 30)
+    assert len(cache) == 1
+    assert cache.stats()["bytes"] == 30
+
+
+def test_export_skips_expired_entries(clock):
+    cache = _cache()
+    cache.set("old", 1, 10)
+    clock.now += 80
+    cache.set("new", 2, 10)
+    clock.now += 20
+    assert [entry[0] for entry in cache.export(10)] == ["new"]
+
+
+def test_make_key_normalizes_keyword():
+    assert SearchCache.make_key("  아이폰   15 Pro ", "sim", 10) == SearchCache.make_key("아이폰 15 pro", "sim", 10)
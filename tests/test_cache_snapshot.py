@@ -0,0 +1,87 @@
+"""
+응답 캐시 스냅샷 테스트
+저장 후 복원, 체크섬 불일치 / 만료 엔트리 제외, 손상된 파일 무시
+"""
+import pytest
+
+from services import cache_snapshot
+from services.cache_snapshot import CacheSnapshot
+from services.models import ShoppingItem, encode_items
+
+
+def _items(title: str):
+    return [ShoppingItem(title=title, link="https://example.com/1", lprice=12000, mall_name="테스트몰", product_id="1")]
+
+
+KEY_A = ("아이폰 15", "sim", 10, 1)
+KEY_B = ("갤럭시 s24", "sim", 10, 1)
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    return CacheSnapshot(str(tmp_path / "data" / "cache_snapshot.db"))
+
+
+def test_round_trip(snapshot):
+    assert snapshot.save([(KEY_A, _items("아이폰 15 프로"), 60.0, 120.0), (KEY_B, _items("갤럭시 S24"), 30.0, 90.0)]) == 2
+
+    entries = CacheSnapshot(snapshot.path).load()
+    assert [key for key, _, _, _ in entries] == [KEY_A, KEY_B]
+    key, items, fresh_for, stale_for = entries[0]
+    assert items[0].title == "아이폰 15 프로"
+    assert items[0].lprice == 12000
+    assert 0 < fresh_for <= 60.0
+    assert 60.0 < stale_for <= 120.0
+
+
+def test_corrupt_entry_is_skipped(snapshot):
+    snapshot.save([(KEY_A, _items("아이폰 15 프로"), 60.0, 120.0), (KEY_B, _items("갤럭시 S24"), 60.0, 120.0)])
+
+    # 파일 안의 KEY_A 응답 본문에서 1바이트 뒤집기 (체크섬은 그대로)
+    value = encode_items(_items("아이폰 15 프로"))
+    with open(snapshot.path, "rb") as file:
+        data = bytearray(file.read())
+    offset = data.find(value)
+    assert offset >= 0
+    data[offset + len(value) // 2] ^= 0xFF
+    with open(snapshot.path, "wb") as file:
+        file.write(data)
+
+    loader = CacheSnapshot(snapshot.path)
+    entries = loader.load()
+    assert [key for key, _, _, _ in entries] == [KEY_B]
+    assert loader.dropped_corrupt == 1
+    assert loader.loaded == 1
+
+
+def test_expired_entry_is_skipped(snapshot, monkeypatch):
+    now = 1_800_000_000.0
+    monkeypatch.setattr(cache_snapshot.time, "time", lambda: now)
+    snapshot.save([(KEY_A, _items("아이폰 15 프로"), 10.0, 20.0), (KEY_B, _items("갤럭시 S24"), 10.0, 100.0)])
+
+    now += 50
+    loader = CacheSnapshot(snapshot.path)
+    entries = loader.load()
+    assert [key for key, _, _, _ in entries] == [KEY_B]
+    # 신선한 기간은 지났지만 stale 허용 기간이 남은 엔트리는 복원
+    assert entries[0][2] == -40.0
+    assert entries[0][3] == 50.0
+    assert loader.dropped_expired == 1
+
+
+def test_unreadable_file_is_ignored(tmp_path):
+    with open(str(tmp_path / "broken.db"), "wb") as file:
+        file.write(b"not a sqlite database" * 100)
+    loader = CacheSnapshot(str(tmp_path / "broken.db"))
+    assert loader.load() == []
+    assert loader.load_errors == 1
+
+
+def test_version_mismatch_is_ignored(snapshot, monkeypatch):
+    snapshot.save([(KEY_A, _items("아이폰 15 프로"), 60.0, 120.0)])
+    monkeypatch.setattr(cache_snapshot, "SNAPSHOT_VERSION", "999")
+    assert CacheSnapshot(snapshot.path).load() == []
+
+
+def test_missing_file_loads_nothing(snapshot):
+    assert snapshot.load() == []
@@ -0,0 +1,182 @@
+"""
+서킷 브레이커 테스트
+closed → open → half_open → closed 전이, 시험 요청 수 제한, 취소 시 release
+"""
+import asyncio
+
+import pytest
+
+from services import circuit_breaker
+from services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from utils.exceptions import CircuitOpenError
+
+
+class UpstreamDown(Exception):
+    pass
+
+
+class BadRequest(Exception):
+    pass
+
+
+def _classify(error):
+    if isinstance(error, UpstreamDown):
+        return True
+    if isinstance(error, BadRequest):
+        return False
+    return None
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        _classify, window_seconds=10, min_requests=4, failure_rate=0.5,
+        slow_call_seconds=3.0, slow_call_rate=0.8, open_seconds=30.0, half_open_probes=2
+    )
+
+
+def _call(breaker, error=None, duration=0.0, clock=None):
+    with breaker.guard():
+        if clock is not None:
+            clock.now += duration
+        if error is not None:
+            raise error
+
+
+def _fail(breaker):
+    with pytest.raises(UpstreamDown):
+        _call(breaker, UpstreamDown())
+
+
+def _open(breaker):
+    for _ in range(4):
+        _fail(breaker)
+    assert breaker.state == OPEN
+
+
+def test_stays_closed_below_min_requests(breaker):
+    for _ in range(3):
+        _fail(breaker)
+    assert breaker.state == CLOSED
+
+
+def test_opens_on_failure_rate(breaker):
+    _call(breaker)
+    _call(breaker)
+    _fail(breaker)
+    assert breaker.state == CLOSED
+    _fail(breaker)
+    assert breaker.state == OPEN
+    assert breaker.opened == 1
+
+
+def test_client_errors_count_as_success(breaker):
+    for _ in range(10):
+        with pytest.raises(BadRequest):
+            _call(breaker, BadRequest())
+    assert breaker.state == CLOSED
+
+
+def test_opens_on_slow_calls(breaker, clock):
+    for _ in range(4):
+        _call(breaker, duration=3.0, clock=clock)
+    assert breaker.state == OPEN
+
+
+def test_failures_outside_window_are_forgotten(breaker, clock):
+    for _ in range(3):
+        _fail(breaker)
+    clock.now += 10
+    _fail(breaker)
+    assert breaker.state == CLOSED
+
+
+def test_open_rejects_until_timeout(breaker, clock):
+    _open(breaker)
+    with pytest.raises(CircuitOpenError) as raised:
+        _call(breaker)
+    assert raised.value.details["retry_after"] == 30.0
+    with pytest.raises(CircuitOpenError):
+        breaker.reject_if_open()
+    assert breaker.rejected == 2
+
+    clock.now += 30
+    breaker.reject_if_open()  # 차단 시간이 지나면 시험 요청 허용
+    _call(breaker)
+    assert breaker.state == HALF_OPEN
+
+
+def test_half_open_closes_after_successful_probes(breaker, clock):
+    _open(breaker)
+    clock.now += 30
+    _call(breaker)
+    _call(breaker)
+    assert breaker.state == CLOSED
+    # 닫힐 때 윈도우 초기화 (이전 실패로 바로 다시 열리지 않음)
+    _fail(breaker)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_failure_reopens(breaker, clock):
+    _open(breaker)
+    clock.now += 30
+    _call(breaker)
+    _fail(breaker)
+    assert breaker.state == OPEN
+    assert breaker.opened == 2
+    assert breaker.retry_after() == 30.0
+
+
+def test_half_open_slow_probe_reopens(breaker, clock):
+    _open(breaker)
+    clock.now += 30
+    _call(breaker, duration=3.0, clock=clock)
+    assert breaker.state == OPEN
+
+
+def test_half_open_limits_concurrent_probes(breaker, clock):
+    _open(breaker)
+    clock.now += 30
+    first, second = breaker.guard(), breaker.guard()
+    first.__enter__()
+    second.__enter__()
+    with pytest.raises(CircuitOpenError):
+        _call(breaker)
+    first.__exit__(None, None, None)
+    second.__exit__(None, None, None)
+    assert breaker.state == CLOSED
+
+
+def test_cancelled_probe_is_released(breaker, clock):
+    _open(breaker)
+    clock.now += 30
+    for _ in range(3):
+        with pytest.raises(asyncio.CancelledError):
+            _call(breaker, asyncio.CancelledError())
+    # 취소는 판단에서 제외되고 시험 요청 자리를 반환
+    assert breaker.state == HALF_OPEN
+    _call(breaker)
+    _call(breaker)
+    assert breaker.state == CLOSED
+
+
+def test_neutral_errors_are_not_recorded(breaker):
+    for _ in range(10):
+        with pytest.raises(KeyError):
+            _call(breaker, KeyError())
+    assert breaker.stats()["window_requests"] == 0
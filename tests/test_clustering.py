@@ -0,0 +1,98 @@
+"""
+동일 상품 묶기 테스트
+numpy / 순수 파이썬 구현이 같은 결과를 내고, LSH 버킷 안의 모든 후보 쌍을 비교해야 함
+"""
+import random
+import zlib
+
+import pytest
+
+from services import clustering
+from services.clustering import ProductGroup, cluster_items
+from services.models import SearchResults, ShoppingItem
+
+
+WORDS = "애플 아이폰 15 프로 256gb 블루 자급제 케이스 갤럭시 s24 울트라 512gb 블랙 충전기 필름 맥스".split()
+
+
+def _item(title: str, price: int, mall: str = "테스트몰", product_id: str = "", product_type: int = 1) -> ShoppingItem:
+    return ShoppingItem(
+        title=title, link=f"https://example.com/{zlib.crc32(title.encode())}", lprice=price,
+        mall_name=mall, product_id=product_id, product_type=product_type
+    )
+
+
+def _random_items(count: int, seed: int):
+    rng = random.Random(seed)
+    items = [
+        _item(" ".join(rng.sample(WORDS, 6)), rng.randint(1, 9) * 1000, mall=f"몰{index % 5}")
+        for index in range(count)
+    ]
+    # 판매처 홍보 문구만 다른 중복 목록
+    items += [_item(item.title + " 무료배송", 500, mall="다른몰") for item in items[:count // 5]]
+    return items
+
+
+def _groups(results):
+    return [(item.title, getattr(item, "offers", 1)) for item in results]
+
+
+def test_signatures_match_across_backends():
+    if clustering.np is None:
+        pytest.skip("numpy 미설치")
+    rng = random.Random(7)
+    hashed = [[rng.getrandbits(32) for _ in range(rng.randint(1, 20))] for _ in range(700)]
+    assert clustering._signatures_numpy(hashed, 64).tolist() == clustering._signatures_python(hashed, 64)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_clusters_match_across_backends(monkeypatch, seed):
+    if clustering.np is None:
+        pytest.skip("numpy 미설치")
+    items = _random_items(200, seed)
+    with_numpy = cluster_items(items)
+    monkeypatch.setattr(clustering, "np", None)
+    without_numpy = cluster_items(items)
+    assert _groups(with_numpy) == _groups(without_numpy)
+    assert len(with_numpy) < len(items)
+
+
+def test_duplicates_that_miss_the_first_bucket_member_are_merged(monkeypatch):
+    # 모든 항목이 같은 버킷에 들어가도록 서명을 고정
+    monkeypatch.setattr(clustering, "np", None)
+    monkeypatch.setattr(clustering, "_signatures_python", lambda hashed, num_perm: [[0] * num_perm for _ in hashed])
+    items = [
+        _item("삼성 갤럭시 버즈 케이스", 9000),
+        _item("애플 에어팟 프로 2세대 usb c", 300000),
+        _item("애플 에어팟 프로 2세대 usb c 정품", 290000, mall="다른몰"),
+    ]
+    results = cluster_items(items)
+    assert len(results) == 2
+    group = results[1]
+    assert isinstance(group, ProductGroup)
+    assert (group.offers, group.lprice, group.max_price, group.mall_count) == (2, 290000, 300000, 2)
+
+
+def test_same_product_id_is_grouped():
+    items = [_item("아이폰 15", 1200000, product_id="1"), _item("전혀 다른 제목", 1100000, product_id="1")]
+    (group,) = cluster_items(items)
+    assert group.offers == 2
+    assert group.lprice == 1100000
+
+
+def test_conflicting_specs_are_not_grouped():
+    items = [_item("애플 아이폰 15 프로 256gb 블루", 1500000), _item("애플 아이폰 15 프로 512gb 블루", 1800000)]
+    assert len(cluster_items(items)) == 2
+
+
+def test_different_conditions_are_not_grouped():
+    items = [
+        _item("애플 아이폰 15 프로 256gb 블루", 1500000, product_type=1),
+        _item("애플 아이폰 15 프로 256gb 블루", 900000, product_type=4),
+    ]
+    assert len(cluster_items(items)) == 2
+
+
+def test_stale_since_is_kept():
+    items = SearchResults([_item("아이폰 15", 1000), _item("아이폰 15", 900)], stale_since=123.0)
+    assert cluster_items(items).stale_since == 123.0
@@ -0,0 +1,155 @@
+"""
+인증키 풀 테스트
+설정 파싱, 가중치 기반 키 선택, 429/401 일시 제외, 다른 키로 재시도
+"""
+import asyncio
+from collections import Counter
+
+import pytest
+
+from config import settings
+from services import credentials as credentials_module
+from services.credentials import CredentialPool, parse_credentials
+from services.models import ShoppingItem
+from services.naver_api import NaverShoppingClient
+from utils.exceptions import ConfigurationError, NaverAPIError, QuotaExceededError, RateLimitError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(credentials_module.time, "monotonic", clock)
+    return clock
+
+
+def _credentials(extra: str = "key2:secret2", daily_quota: int = 0):
+    return parse_credentials("key1", "secret1", extra, rate=10.0, burst=10, daily_quota=daily_quota)
+
+
+def _pool(credentials) -> CredentialPool:
+    return CredentialPool(credentials, bench_seconds=60.0, auth_bench_seconds=600.0)
+
+
+def test_parse_credentials_with_weights_and_duplicates():
+    parsed = parse_credentials("key1", "secret1", " key2:secret2:3 , key1:other ,key3:secret3", 10.0, 10, 100)
+    assert [(c.client_id, c.weight) for c in parsed] == [("key1", 1.0), ("key2", 3.0), ("key3", 1.0)]
+    assert parsed[1].label == "key2***"
+
+
+@pytest.mark.parametrize("extra", ["key2", "key2:secret2:heavy", ":secret"])
+def test_parse_credentials_rejects_bad_entries(extra):
+    with pytest.raises(ConfigurationError):
+        parse_credentials("key1", "secret1", extra, 10.0, 10, 100)
+
+
+def test_parse_credentials_requires_a_key():
+    with pytest.raises(ConfigurationError):
+        parse_credentials("", "", "", 10.0, 10, 100)
+
+
+def test_weighted_least_load_selection(clock):
+    pool = _pool(_credentials("key2:secret2:2"))
+    picked = Counter()
+    for _ in range(30):
+        credential = pool.acquire()
+        picked[credential.client_id] += 1
+        pool.release(credential, 200)
+    assert picked == {"key1": 10, "key2": 20}
+
+
+def test_in_flight_requests_count_as_load(clock):
+    pool = _pool(_credentials())
+    first, second = pool.acquire(), pool.acquire()
+    assert {first.client_id, second.client_id} == {"key1", "key2"}
+
+
+def test_rate_limited_key_is_benched(clock):
+    pool = _pool(_credentials())
+    first = pool.acquire()
+    pool.release(first, 429)
+    assert first.bench_reason == "rate_limited"
+    for _ in range(5):
+        credential = pool.acquire()
+        assert credential is not first
+        pool.release(credential, 200)
+
+    clock.now += 60
+    assert not first.is_benched(clock.now)
+    assert first.failures == 1
+
+
+def test_unauthorized_key_is_benched_longer(clock):
+    pool = _pool(_credentials())
+    first = pool.acquire()
+    pool.release(first, 401)
+    assert first.bench_reason == "unauthorized"
+    clock.now += 60
+    assert first.is_benched(clock.now)
+    clock.now += 540
+    assert not first.is_benched(clock.now)
+
+
+def test_all_keys_benched_raises_rate_limit(clock):
+    pool = _pool(_credentials())
+    for _ in range(2):
+        pool.release(pool.acquire(), 429)
+    with pytest.raises(RateLimitError):
+        pool.acquire()
+
+
+def test_all_quotas_exhausted_raises_quota_exceeded(clock):
+    pool = _pool(_credentials(daily_quota=1))
+    pool.acquire()
+    pool.acquire()
+    with pytest.raises(QuotaExceededError) as raised:
+        pool.acquire()
+    assert raised.value.details["keys"] == 2
+
+
+def test_cancel_refunds_quota(clock):
+    pool = _pool(_credentials(extra="", daily_quota=1))
+    credential = pool.acquire()
+    pool.cancel(credential)
+    assert credential.in_flight == 0
+    assert credential.quota.remaining == 1
+    assert credential.requests == 0
+
+
+def test_cancelled_request_is_not_counted(clock):
+    pool = _pool(_credentials(extra="", daily_quota=2))
+    credential = pool.acquire()
+    pool.release(credential, None, cancelled=True)
+    assert credential.in_flight == 0
+    assert (credential.requests, credential.failures) == (0, 0)
+    # 이미 보낸 요청이므로 쿼터는 환불하지 않음
+    assert credential.quota.remaining == 1
+
+
+def test_fetch_retries_on_another_key(monkeypatch):
+    monkeypatch.setattr(settings, "NAVER_HEDGE_ENABLED", False)
+    client = NaverShoppingClient(credentials=_credentials())
+    pool = client._credentials
+    used = []
+
+    async def fake_request(credential, keyword, display, sort, start):
+        used.append(credential.client_id)
+        if len(used) == 1:
+            pool.release(credential, 429)
+            raise NaverAPIError("API 호출 실패 (상태 코드: 429)", details={"status_code": 429})
+        pool.release(credential, 200)
+        return [ShoppingItem(title="상품", link="https://example.com", lprice=1000)]
+
+    monkeypatch.setattr(client, "_request", fake_request)
+    items = asyncio.run(client._fetch("상품", 10, "sim", 1))
+    assert len(items) == 1
+    assert len(used) == 2 and used[0] != used[1]
+    benched = next(c for c in pool.credentials if c.client_id == used[0])
+    assert benched.bench_reason == "rate_limited"
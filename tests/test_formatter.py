@@ -0,0 +1,50 @@
+"""
+출력 포맷터 테스트
+json 출력은 글자 수 예산을 넘겨도 항상 파싱 가능한 JSON이어야 함
+"""
+import json
+import time
+
+import pytest
+
+from services.formatter import format_shopping_results
+from services.models import SearchResults, ShoppingItem
+
+
+def _items(count: int) -> list:
+    return [
+        ShoppingItem(
+            title=f"무선 이어폰 노이즈 캔슬링 블루투스 5.3 모델 {index}",
+            link=f"https://shopping.naver.com/product/{index}?from=search&query=%EB%AC%B4%EC%84%A0",
+            lprice=10000 + index * 1000,
+            mall_name="테스트몰",
+            brand="테스트",
+            product_id=str(index)
+        )
+        for index in range(10)
+    ][:count]
+
+
+@pytest.mark.parametrize("max_chars", [0, 2000, 600, 300, 120, 60, 10, 1])
+def test_json_output_is_valid_at_any_budget(max_chars):
+    result = format_shopping_results(_items(10), "무선 이어폰", mode="json", max_chars=max_chars)
+    payload = json.loads(result)
+    assert payload["keyword"] == "무선 이어폰"
+    assert payload["total"] == 10
+    if max_chars and len(payload["items"]) < 10:
+        assert payload["truncated"] is True
+
+
+def test_json_output_fits_budget_by_dropping_items():
+    result = format_shopping_results(_items(10), "무선 이어폰", mode="json", max_chars=600)
+    payload = json.loads(result)
+    assert len(result) <= 600
+    assert 0 < len(payload["items"]) < 10
+
+
+@pytest.mark.parametrize("max_chars", [0, 300, 60])
+def test_json_stale_notice_is_a_field(max_chars):
+    items = SearchResults(_items(10), stale_since=time.time() - 3600)
+    payload = json.loads(format_shopping_results(items, "무선 이어폰", mode="json", max_chars=max_chars))
+    assert payload["stale"] is True
+    assert payload["as_of"]
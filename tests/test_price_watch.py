@@ -0,0 +1,125 @@
+"""
+가격 알림 테스트
+조회 간격 조정 계산, 저장소 감시 묶기 / 재시작 후 유지, 쿼터 비율에 맞춘 조회 분산
+"""
+import asyncio
+
+import pytest
+
+from config import settings
+from services.models import ShoppingItem
+from services.price_watch import STABLE_BACKOFF, PriceWatcher, PriceWatchStore, next_interval
+from utils.exceptions import ValidationError
+
+
+MIN_INTERVAL = 300.0
+MAX_INTERVAL = 21600.0
+VOLATILITY = 0.01
+
+
+def _next(previous, last_price, price, target_price=None):
+    return next_interval(previous, last_price, price, target_price, MIN_INTERVAL, MAX_INTERVAL, VOLATILITY)
+
+
+def test_next_interval_halves_on_price_change():
+    assert _next(1200, 10000, 9800) == 600
+
+
+def test_next_interval_backs_off_when_stable():
+    assert _next(1200, 10000, 10000) == 1200 * STABLE_BACKOFF
+    # 변동률이 volatility 미만이면 변화 없음으로 취급
+    assert _next(1200, 10000, 10050) == 1200 * STABLE_BACKOFF
+
+
+def test_next_interval_is_clamped():
+    assert _next(400, 10000, 5000) == MIN_INTERVAL
+    assert _next(20000, 10000, 10000) == MAX_INTERVAL
+
+
+def test_next_interval_first_poll_keeps_previous():
+    assert _next(1200, None, 10000) == 1200
+
+
+def test_next_interval_near_target_polls_often():
+    # 목표가와 5% 이내면 하한의 2배 이하
+    assert _next(6000, 10000, 10000, target_price=9600) == MIN_INTERVAL * 2
+    # 멀면 평소대로
+    assert _next(6000, 10000, 10000, target_price=5000) == 6000 * STABLE_BACKOFF
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PriceWatchStore(str(tmp_path / "watch" / "price_watch.db"))
+
+
+def test_watches_on_same_keyword_share_one_topic(store):
+    first = store.add_watch("에어팟  프로", 250000, max_watches=10, min_interval=MIN_INTERVAL)
+    second = store.add_watch("에어팟 프로", 230000, max_watches=10, min_interval=MIN_INTERVAL)
+
+    assert first["shared_with"] == 0
+    assert second["shared_with"] == 1
+    assert store.counts() == {"watches": 2, "topics": 1, "unseen_alerts": 0}
+    # topic의 목표가는 가장 높은 목표가
+    (topic,) = store.due_topics(now=float("inf"), limit=10)
+    assert topic["target_price"] == 250000
+
+
+def test_max_watches_is_enforced(store):
+    store.add_watch("아이폰 15", 1000000, max_watches=1, min_interval=MIN_INTERVAL)
+    with pytest.raises(ValidationError):
+        store.add_watch("갤럭시 S24", 900000, max_watches=1, min_interval=MIN_INTERVAL)
+
+
+def test_store_survives_restart(store):
+    watch = store.add_watch("에어팟 프로", 250000, max_watches=10, min_interval=MIN_INTERVAL)
+    item = ShoppingItem(title="에어팟 프로 2세대", link="https://example.com/1", lprice=260000, mall_name="테스트몰")
+    assert store.record_poll(store.due_topics(float("inf"), 10)[0]["keyword"], 260000, item, 600.0, 1000.0) == 0
+
+    reopened = PriceWatchStore(store.path)
+    (saved,) = reopened.watches()
+    assert saved["id"] == watch["id"]
+    assert saved["last_price"] == 260000
+    assert saved["next_poll_at"] == 1600.0
+    assert reopened.due_topics(now=1599.0, limit=10) == []
+    assert len(reopened.due_topics(now=1600.0, limit=10)) == 1
+
+
+def test_record_poll_triggers_matching_watches_once(store):
+    store.add_watch("에어팟 프로", 250000, max_watches=10, min_interval=MIN_INTERVAL)
+    store.add_watch("에어팟 프로", 200000, max_watches=10, min_interval=MIN_INTERVAL)
+    keyword = store.due_topics(float("inf"), 10)[0]["keyword"]
+    item = ShoppingItem(title="에어팟 프로 2세대", link="https://example.com/1", lprice=240000, mall_name="테스트몰")
+
+    assert store.record_poll(keyword, 240000, item, 600.0, 1000.0) == 1
+    assert store.record_poll(keyword, 240000, item, 600.0, 2000.0) == 0
+    (alert,) = store.alerts(only_new=True, limit=10)
+    assert (alert["target_price"], alert["price"]) == (250000, 240000)
+    assert store.alerts(only_new=True, limit=10) == []
+    assert store.counts() == {"watches": 1, "topics": 1, "unseen_alerts": 0}
+
+
+def test_remove_last_watch_drops_topic(store):
+    watch = store.add_watch("에어팟 프로", 250000, max_watches=10, min_interval=MIN_INTERVAL)
+    assert store.remove_watch(watch["id"]) is True
+    assert store.remove_watch(watch["id"]) is False
+    assert store.counts()["topics"] == 0
+
+
+def test_tick_polls_within_quota_budget(store, monkeypatch):
+    monkeypatch.setattr(settings, "PRICE_WATCH_CONCURRENCY", 2)
+    for index in range(5):
+        store.add_watch(f"상품 {index}", 10000, max_watches=10, min_interval=MIN_INTERVAL)
+    # 하루 864회 = 100초에 1회 → 시작 직후에는 버킷 용량(동시 조회 수)만큼만 조회
+    watcher = PriceWatcher(store, polls_per_day=864)
+    assert watcher.budget.rate == pytest.approx(0.01)
+
+    polled = []
+
+    async def poll(topic):
+        polled.append(topic["keyword"])
+
+    monkeypatch.setattr(watcher, "_poll", poll)
+    assert asyncio.run(watcher.tick()) == 2
+    assert watcher.deferred == 3
+    # 가장 오래 밀린 topic부터
+    assert polled == ["상품 0", "상품 1"]
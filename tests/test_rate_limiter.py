@@ -0,0 +1,127 @@
+"""
+호출 제한 테스트
+토큰 버킷 충전 / 대기 한도, 일일 쿼터 환불 / KST 자정 초기화
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from services import rate_limiter
+from services.rate_limiter import KST, DailyQuota, TokenBucket
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.monotonic / time.time 고정 (KST 2026-10-17 23:59:00)"""
+    clock = FakeClock(datetime(2026, 10, 17, 23, 59, tzinfo=KST).timestamp())
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock)
+    monkeypatch.setattr(rate_limiter.time, "time", clock)
+    return clock
+
+
+def test_bucket_starts_full_and_refills(clock):
+    bucket = TokenBucket(rate=2.0, capacity=3)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+    clock.now += 0.5
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is False
+
+
+def test_bucket_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(rate=10.0, capacity=2)
+    clock.now += 60
+    assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+
+
+def test_acquire_waits_for_reserved_token(clock, monkeypatch):
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake_sleep)
+    bucket = TokenBucket(rate=4.0, capacity=1)
+
+    async def scenario():
+        return [await bucket.acquire(max_wait=1.0) for _ in range(3)]
+
+    assert asyncio.run(scenario()) == [True, True, True]
+    assert slept == [pytest.approx(0.25), pytest.approx(0.25)]
+
+
+def test_acquire_rejects_beyond_max_wait(clock):
+    bucket = TokenBucket(rate=1.0, capacity=1)
+
+    async def scenario():
+        assert await bucket.acquire(max_wait=0.5)
+        return await bucket.acquire(max_wait=0.5)
+
+    assert asyncio.run(scenario()) is False
+    assert bucket.rejected == 1
+    # 거절된 요청은 토큰을 예약하지 않음
+    clock.now += 1.0
+    assert bucket.try_acquire() is True
+
+
+def test_cancelled_waiter_returns_token(clock):
+    bucket = TokenBucket(rate=1.0, capacity=1)
+
+    async def scenario():
+        bucket.try_acquire()
+        waiter = asyncio.create_task(bucket.acquire(max_wait=5.0))
+        await asyncio.sleep(0)
+        assert bucket.waiting == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(scenario())
+    assert bucket.waiting == 0
+    clock.now += 1.0
+    assert bucket.try_acquire() is True
+
+
+def test_quota_consume_and_refund(clock):
+    quota = DailyQuota(limit=2)
+    assert quota.try_consume() and quota.try_consume()
+    assert quota.try_consume() is False
+    assert quota.remaining == 0
+    quota.refund()
+    assert quota.remaining == 1
+    assert quota.try_consume() is True
+
+
+def test_refund_never_goes_negative(clock):
+    quota = DailyQuota(limit=2)
+    quota.refund()
+    assert quota.used == 0
+
+
+def test_unlimited_quota(clock):
+    quota = DailyQuota(limit=0)
+    assert all(quota.try_consume() for _ in range(100))
+    assert quota.remaining is None
+
+
+def test_quota_resets_at_kst_midnight(clock):
+    quota = DailyQuota(limit=1)
+    assert quota.reset_time_kst() == "2026-10-18 00:00"
+    assert quota.try_consume() is True
+    assert quota.try_consume() is False
+
+    clock.now += 59  # 23:59:59 KST
+    assert quota.try_consume() is False
+    clock.now += 1  # 00:00:00 KST
+    assert quota.try_consume() is True
+    assert quota.used == 1
+    assert quota.reset_time_kst() == "2026-10-19 00:00"
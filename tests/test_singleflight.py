@@ -0,0 +1,118 @@
+"""
+single-flight 요청 병합 테스트
+대기자들이 업스트림 요청 1회를 공유하고, 한 대기자의 취소 / 마감이 공유 요청에 전파되지 않으며,
+예외는 모든 대기자에게 전달되어야 함
+"""
+import asyncio
+
+import pytest
+
+from services.naver_api import SingleFlight
+from utils.deadline import deadline_scope
+from utils.exceptions import DeadlineExceededError, NetworkError
+
+
+class FakeFetch:
+    """호출 횟수를 세고 release될 때까지 대기하는 가짜 업스트림 요청"""
+
+    def __init__(self, result=None, error: Exception = None):
+        self.calls = 0
+        self.result = result
+        self.error = error
+        self.release = asyncio.Event()
+        self.cancelled = False
+
+    async def __call__(self):
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def test_followers_share_one_upstream_call():
+    async def scenario():
+        flight = SingleFlight()
+        fetch = FakeFetch(result=["item"])
+        waiters = [asyncio.create_task(flight.do("key", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        results = await asyncio.gather(*waiters)
+        return flight, fetch, results
+
+    flight, fetch, results = asyncio.run(scenario())
+    assert fetch.calls == 1
+    assert results == [["item"]] * 5
+    assert flight.coalesced == 4
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_different_keys_do_not_share():
+    async def scenario():
+        flight = SingleFlight()
+        fetch = FakeFetch(result=1)
+        fetch.release.set()
+        return fetch, await asyncio.gather(flight.do("a", fetch), flight.do("b", fetch))
+
+    fetch, results = asyncio.run(scenario())
+    assert fetch.calls == 2
+    assert results == [1, 1]
+
+
+def test_cancelled_waiter_does_not_cancel_shared_fetch():
+    async def scenario():
+        flight = SingleFlight()
+        fetch = FakeFetch(result="ok")
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        fetch.release.set()
+        return fetch, first, await second
+
+    fetch, first, result = asyncio.run(scenario())
+    assert first.cancelled()
+    assert not fetch.cancelled
+    assert fetch.calls == 1
+    assert result == "ok"
+
+
+def test_exception_propagates_to_every_waiter():
+    async def scenario():
+        flight = SingleFlight()
+        fetch = FakeFetch(error=NetworkError("네트워크 연결 실패"))
+        waiters = [asyncio.create_task(flight.do("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        return fetch, await asyncio.gather(*waiters, return_exceptions=True)
+
+    fetch, results = asyncio.run(scenario())
+    assert fetch.calls == 1
+    assert len(results) == 3
+    assert all(isinstance(result, NetworkError) for result in results)
+
+
+def test_waiter_deadline_does_not_bound_shared_fetch():
+    async def scenario():
+        flight = SingleFlight()
+        fetch = FakeFetch(result="ok")
+
+        async def short():
+            with deadline_scope(0.01):
+                return await flight.do("key", fetch)
+
+        hurried = asyncio.create_task(short())
+        patient = asyncio.create_task(flight.do("key", fetch))
+        with pytest.raises(DeadlineExceededError):
+            await hurried
+        fetch.release.set()
+        return fetch, await patient
+
+    fetch, result = asyncio.run(scenario())
+    assert not fetch.cancelled
+    assert result == "ok"
@@ -0,0 +1,124 @@
+"""
+검색어 추천 색인 테스트
+2단계 배열(본 / 최근 추가분) 정렬과 병합, 자모 3-gram 오타 교정, 반영 스레드와 동시 조회
+"""
+import threading
+
+from services.suggest import SuggestIndex, edit_distance, fuzzy_key
+
+
+def _index(**overrides) -> SuggestIndex:
+    options = {"max_terms": 1000, "merge_batch": 1000, "merge_interval": 60.0, "queue_size": 10}
+    options.update(overrides)
+    return SuggestIndex(**options)
+
+
+def test_fuzzy_key_decomposes_hangul():
+    assert fuzzy_key("갤럭시 s24") == "ㄱㅐㄹㄹㅓㄱㅅㅣs24"
+
+
+def test_jamo_edit_distance_counts_vowel_typo_as_one():
+    assert edit_distance(fuzzy_key("겔럭시"), fuzzy_key("갤럭시"), 2) == 1
+    assert edit_distance("abcdef", "uvwxyz", 2) == 3
+
+
+def test_tiers_stay_sorted_and_merge_into_main():
+    index = _index(merge_batch=2)
+    index.add_terms({"나": 1.0, "가": 1.0})
+    main, recent = index._index.tiers
+    assert (len(main), recent.terms) == (0, ["가", "나"])
+
+    # 최근 추가분이 max(merge_batch * 8, 본 배열 / 16)을 넘으면 본 배열로 합침
+    index.add_terms({f"단어{number:02d}": 1.0 for number in range(16)})
+    main, recent = index._index.tiers
+    assert len(main) == 18 and len(recent) == 0
+    assert main.terms == sorted(main.terms)
+    assert [main.terms[position] for position in range(3)] == ["가", "나", "단어00"]
+    assert all(index._index.terms[term_id] == term for term, term_id in zip(main.terms, main.ids))
+
+
+def test_complete_ranks_across_tiers_and_pending():
+    index = _index(merge_batch=2)
+    index.add_terms({"아이폰": 3.0, "아이패드": 5.0})  # 최근 추가분 배열
+    index.add_terms({"아이맥": 4.0})  # 아직 합치지 않은 단어
+    assert index.complete("아이") == [("아이패드", 5.0), ("아이맥", 4.0), ("아이폰", 3.0)]
+    assert index.complete("아이", limit=1) == [("아이패드", 5.0)]
+    # 입력과 같은 단어는 제외
+    assert index.complete("아이폰") == []
+
+
+def test_weight_bumps_apply_on_merge_without_touching_live_array():
+    index = _index()
+    index.add_terms({"아이폰": 1.0, "아이패드": 2.0})
+    index.flush()
+    live = index._index.weights
+    index.add_terms({"아이폰": 5.0})
+    assert index.complete("아이")[0] == ("아이패드", 2.0)
+    index.flush()
+    assert list(live) == [1.0, 2.0]
+    assert index.complete("아이")[0] == ("아이폰", 6.0)
+
+
+def test_correct_finds_jamo_typo():
+    index = _index()
+    index.add_terms({"갤럭시": 5.0, "갤럭시탭": 1.0, "아이폰": 3.0})
+    index.flush()
+    assert index.correct("겔럭시") == [("갤럭시", 1)]
+    # 짧은 단어는 교정하지 않음
+    assert index.correct("폰") == []
+
+
+def test_did_you_mean_falls_back_to_per_word_correction():
+    index = _index()
+    index.add_terms({"갤럭시": 5.0, "버즈": 3.0})
+    index.flush()
+    assert index.did_you_mean("겔럭시 버즈") == ["갤럭시 버즈"]
+    assert index.did_you_mean("갤럭시") == []
+
+
+def test_contains_sees_pending_and_indexed_terms():
+    index = _index()
+    index.add_terms({"아이폰": 1.0})
+    assert index.contains("아이폰")
+    index.flush()
+    assert index.contains("아이폰")
+    assert not index._pending
+    assert not index.contains("갤럭시")
+
+
+def test_lookups_while_writer_merges():
+    index = _index(merge_batch=50)
+    index.add_terms({"기준단어": 1.0})
+    index.flush()
+    stop = threading.Event()
+    errors = []
+
+    def writer():
+        number = 0
+        while not stop.is_set():
+            index.add_terms({f"단어{number}": 1.0, "기준단어": 1.0})
+            number += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(2000):
+            if not index.contains("기준단어"):
+                errors.append("contains")
+            index.complete("단어")
+    except Exception as e:  # 조회 중 배열 교체로 인한 IndexError 등
+        errors.append(repr(e))
+    finally:
+        stop.set()
+        thread.join()
+    assert errors == []
+
+
+def test_rebuild_keeps_heaviest_terms():
+    index = _index(max_terms=10, merge_batch=1)
+    for number in range(12):
+        index.add_terms({f"단어{number:02d}": float(number)})
+    assert index.rebuilds >= 1
+    assert len(index._index.terms) <= 10
+    assert index.contains("단어11")
+    assert not index.contains("단어00")
@@ -0,0 +1,150 @@
+"""
+부팅 시간 측정
+프로세스 시작부터 단계별(설정 로드, 앱 생성, 소켓 바인딩, ready) 경과 시간과
+모듈별 import 시간을 기록해 콜드 스타트 시간을 추적
+
+- mark(phase): 단계 완료 시각 기록 (프로세스 시작 기준 ms, 단계별 소요 시간은 이전 단계와의 차이)
+- 환경변수 BOOT_PROFILE=true면 import 훅으로 모듈별 import 시간(자기 시간 / 누적 시간) 측정
+- report(): 부팅 보고서 (ready 시 로그, /metrics, BOOT_PROFILE_PATH JSON)
+
+설정(config)보다 먼저 import되므로 표준 라이브러리만 사용합니다.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+_STARTED = time.perf_counter()
+
+
+def _process_age() -> float:
+    """프로세스 시작 후 경과 시간 (초, Linux /proc 기준, 측정 불가 시 0)"""
+    try:
+        with open("/proc/self/stat") as stat:
+            # 2번째 필드(실행 파일 이름)에 공백이 있을 수 있어 ')' 뒤부터 분리, 22번째 필드 = 시작 시각
+            fields = stat.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as uptime:
+            uptime_sec = float(uptime.read().split()[0])
+        return max(uptime_sec - int(fields[19]) / os.sysconf("SC_CLK_TCK"), 0.0)
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+# 프로세스 시작 시각 (perf_counter 기준, /proc 해상도 10ms)
+_ORIGIN = _STARTED - _process_age()
+
+
+class _ImportTimer:
+    """
+    sys.meta_path 맨 앞에 두는 finder
+
+    실제 탐색은 다른 finder에 맡기고, 찾은 모듈 로더의 exec_module만 감싸서 시간을 잽니다.
+    (백그라운드 스레드에서 앱을 만드는 경우를 위해 스레드별로 중첩 import 추적)
+    """
+
+    def __init__(self, profile: "BootProfile"):
+        self.profile = profile
+        self._local = threading.local()
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        loader = spec.loader
+        # 내장 / frozen 모듈 로더는 클래스 자체라 감쌀 수 없음
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return spec
+        loader.exec_module = self._timed(name, loader.exec_module)
+        return spec
+
+    def _timed(self, name: str, exec_module):
+        def exec_timed(module):
+            stack = self._local.__dict__.setdefault("stack", [])
+            stack.append(0.0)
+            started = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                total = time.perf_counter() - started
+                children = stack.pop()
+                if stack:
+                    stack[-1] += total
+                self.profile.modules[name] = (total * 1000, (total - children) * 1000)
+        return exec_timed
+
+
+class BootProfile:
+    """부팅 단계 / 모듈 import 시간 기록"""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        # 모듈 이름 → (누적 ms, 자기 시간 ms)
+        self.modules: Dict[str, tuple] = {}
+        self._timer: Optional[_ImportTimer] = None
+
+    @staticmethod
+    def elapsed_ms() -> float:
+        """프로세스 시작 후 경과 시간 (ms)"""
+        return (time.perf_counter() - _ORIGIN) * 1000
+
+    def mark(self, phase: str) -> None:
+        """단계 완료 시각 기록 (같은 단계는 처음 한 번만)"""
+        self.phases.setdefault(phase, round(self.elapsed_ms(), 1))
+
+    def enable_import_profiling(self) -> None:
+        if self._timer is None:
+            self._timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._timer)
+
+    def disable_import_profiling(self) -> None:
+        if self._timer is not None:
+            sys.meta_path.remove(self._timer)
+            self._timer = None
+
+    def report(self, top: int = 15) -> Dict[str, Any]:
+        """
+        부팅 보고서
+
+        Returns:
+            phases_ms: 단계 완료 시각 (프로세스 시작 기준)
+            durations_ms: 단계별 소요 시간 (이전 단계 완료부터)
+            slowest_imports: 누적 시간 기준 상위 모듈 (BOOT_PROFILE 사용 시)
+        """
+        durations = {}
+        previous = 0.0
+        for phase, at in sorted(self.phases.items(), key=lambda entry: entry[1]):
+            durations[phase] = round(at - previous, 1)
+            previous = at
+        slowest: List[Dict[str, Any]] = [
+            {"module": name, "cumulative_ms": round(cumulative, 2), "self_ms": round(own, 2)}
+            for name, (cumulative, own) in sorted(self.modules.items(), key=lambda entry: -entry[1][0])[:top]
+        ]
+        return {
+            "phases_ms": dict(self.phases),
+            "durations_ms": durations,
+            "modules_imported": len(sys.modules),
+            "slowest_imports": slowest
+        }
+
+    def write(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(self.report(), output, ensure_ascii=False, indent=2)
+
+
+# 전역 인스턴스 (프로세스 시작 직후부터 기록)
+boot_profile = BootProfile()
+
+if os.environ.get("BOOT_PROFILE", "").lower() in ("1", "true", "yes"):
+    boot_profile.enable_import_profiling()
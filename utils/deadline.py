@@ -0,0 +1,50 @@
+"""
+요청 마감 시각 전파
+툴 호출 단위로 설정한 마감 시각을 contextvar로 하위 호출(및 생성된 태스크)에 전달
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+# 절대 마감 시각 (time.monotonic 기준, None이면 제한 없음)
+_deadline: ContextVar[Optional[float]] = ContextVar("shopcatch_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """
+    현재 작업의 마감 시각 설정
+
+    바깥 범위의 마감이 더 이르면 그대로 유지합니다. seconds가 None 또는 0 이하이면 변경하지 않습니다.
+    """
+    if not seconds or seconds <= 0:
+        yield
+        return
+
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def detached() -> Iterator[None]:
+    """마감 시각 해제 (호출자와 무관하게 실행되는 백그라운드 작업용)"""
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining(limit: float) -> float:
+    """마감까지 남은 시간과 limit 중 작은 값 (마감이 없으면 limit)"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return limit
+    return min(limit, deadline - time.monotonic())
@@ -30,6 +30,40 @@ class NaverAPIError(ShopCatchError):
         return f"❌ 검색 중 오류가 발생했습니다: {self.message}"
 
 
+class RateLimitError(NaverAPIError):
+    """클라이언트 측 초당 요청 한도 초과 (대기 시간 한도 초과)"""
+    
+    def to_user_message(self) -> str:
+        return "⏳ 요청이 몰려 처리하지 못했습니다. 잠시 후 다시 시도해주세요."
+
+
+class QuotaExceededError(NaverAPIError):
+    """네이버 API 일일 쿼터 소진"""
+    
+    def to_user_message(self) -> str:
+        reset_at = self.details.get("reset_at_kst")
+        if reset_at:
+            return f"⚠️ 오늘의 네이버 API 사용량을 모두 소진했습니다. {reset_at} (KST) 이후 다시 시도해주세요."
+        return "⚠️ 오늘의 네이버 API 사용량을 모두 소진했습니다. 내일 다시 시도해주세요."
+
+
+class DeadlineExceededError(NaverAPIError):
+    """툴 호출 마감 시간 초과"""
+    
+    def to_user_message(self) -> str:
+        return "⏱️ 응답이 늦어 요청을 중단했습니다. 잠시 후 다시 시도해주세요."
+
+
+class CircuitOpenError(NaverAPIError):
+    """업스트림 장애 감지로 요청 차단 중 (서킷 브레이커 open)"""
+    
+    def to_user_message(self) -> str:
+        retry_after = self.details.get("retry_after")
+        if retry_after:
+            return f"⚙️ 네이버 쇼핑 응답이 불안정해 잠시 요청을 중단했습니다. 약 {int(retry_after) + 1}초 후 다시 시도해주세요."
+        return "⚙️ 네이버 쇼핑 응답이 불안정해 잠시 요청을 중단했습니다. 잠시 후 다시 시도해주세요."
+
+
 class NetworkError(ShopCatchError):
     """네트워크 관련 에러"""
     
@@ -49,3 +83,24 @@ class ConfigurationError(ShopCatchError):
     
     def to_user_message(self) -> str:
         return "⚙️ 서버 설정에 문제가 있습니다. 관리자에게 문의해주세요."
+
+
+class ServiceUnavailableError(ShopCatchError):
+    """서버 종료(드레이닝) 중 새 요청 거부"""
+    
+    def to_user_message(self) -> str:
+        return "🔄 서버가 재시작 중입니다. 잠시 후 다시 시도해주세요."
+
+
+class ServerBusyError(ShopCatchError):
+    """동시 실행 / 대기열 한도 초과로 툴 호출 거절 (부하 차단)"""
+    
+    def to_user_message(self) -> str:
+        return "🚦 서버가 혼잡해 요청을 처리하지 못했습니다. 잠시 후 다시 시도해주세요."
+
+
+class ProfilerBusyError(ShopCatchError):
+    """다른 프로파일링이 진행 중 (프로세스당 1개만 실행)"""
+    
+    def to_user_message(self) -> str:
+        return "⏳ 이미 프로파일링이 진행 중입니다. 끝난 뒤 다시 요청해주세요."
@@ -1,13 +1,35 @@
 """
 구조화된 로깅 시스템
 Render 대시보드에서 보기 좋은 로그 출력
+
+LOG_ASYNC 모드에서는 로그 레코드를 큐에 넣기만 하고 포맷팅/출력은
+백그라운드 스레드가 처리합니다. (stdout 지연이 이벤트 루프를 막지 않도록)
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import json
-from datetime import datetime
-from typing import Any, Dict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
 from config import settings
+from utils.metrics import registry
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+# LogRecord 기본 속성 (extra= 로 전달된 필드와 구분하기 위함)
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def _utc_timestamp(record: logging.LogRecord, fmt: Optional[str] = None) -> str:
+    """레코드 생성 시각 (출력이 늦어져도 실제 발생 시각 기준)"""
+    created = datetime.fromtimestamp(record.created, timezone.utc).replace(tzinfo=None)
+    return created.strftime(fmt) if fmt else created.isoformat()
 
 
 class StructuredFormatter(logging.Formatter):
@@ -15,21 +37,27 @@ class StructuredFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         
-        # 추가 컨텍스트 정보
-        if hasattr(record, "extra"):
-            log_data.update(record.extra)
+        # 추가 컨텍스트 정보 (logging은 extra= 필드를 레코드 속성으로 병합함)
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                log_data[key] = value
         
         # 예외 정보
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data, ensure_ascii=False)
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:  # 64비트 범위를 넘는 정수 등
+                pass
+        return json.dumps(log_data, ensure_ascii=False, default=str)
 
 
 class TextFormatter(logging.Formatter):
@@ -48,10 +76,91 @@ class TextFormatter(logging.Formatter):
         color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
         reset = self.COLORS['RESET']
         
-        timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = _utc_timestamp(record, '%Y-%m-%d %H:%M:%S')
         return f"{color}[{timestamp}] {record.levelname:8}{reset} | {record.name:20} | {record.getMessage()}"
 
 
+class _QueueListener(logging.handlers.QueueListener):
+    """중복 stop() 호출을 허용하는 QueueListener (atexit + 명시적 종료)"""
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    유한 큐 기반 비동기 핸들러
+
+    - 호출 스레드에서는 큐에 넣기만 함 (메시지 포맷팅은 리스너 스레드에서 수행)
+    - 큐가 80% 이상 차면 INFO 이하 로그는 sample_rate 개 중 1개만 기록
+    - 큐가 가득 차면 레코드를 버리고 개수를 집계
+    """
+
+    def __init__(self, log_queue: queue.Queue, sample_rate: int):
+        super().__init__(log_queue)
+        self.high_water = max(int(log_queue.maxsize * 0.8), 1)
+        self.sample_rate = max(sample_rate, 1)
+        self.dropped = 0
+        self.sampled_out = 0
+        self._overload_seen = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스 내 스레드로 넘기므로 기본 구현의 선 포맷팅/복사를 생략
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if record.levelno < logging.WARNING and self.queue.qsize() >= self.high_water:
+            self._overload_seen += 1
+            if self._overload_seen % self.sample_rate:
+                self.sampled_out += 1
+                return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queue.qsize(),
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out
+        }
+
+
+def create_handler(
+    stream=None,
+    log_format: Optional[str] = None,
+    async_mode: Optional[bool] = None,
+    queue_size: Optional[int] = None,
+    sample_rate: Optional[int] = None
+) -> logging.Handler:
+    """
+    출력 핸들러 생성 (기본값은 설정값)
+
+    async_mode인 경우 DroppingQueueHandler를 반환하며,
+    실제 출력은 handler.listener (QueueListener) 스레드가 담당합니다.
+    """
+    output = logging.StreamHandler(stream or sys.stdout)
+    
+    # 포맷 선택
+    if (log_format or settings.LOG_FORMAT) == "json":
+        output.setFormatter(StructuredFormatter())
+    else:
+        output.setFormatter(TextFormatter())
+    
+    if not (settings.LOG_ASYNC if async_mode is None else async_mode):
+        return output
+    
+    log_queue = queue.Queue(maxsize=queue_size or settings.LOG_QUEUE_SIZE)
+    handler = DroppingQueueHandler(log_queue, sample_rate or settings.LOG_OVERLOAD_SAMPLE_RATE)
+    handler.listener = _QueueListener(log_queue, output)
+    handler.listener.start()
+    # 종료 시 남은 로그 출력
+    atexit.register(handler.listener.stop)
+    return handler
+
+
 def setup_logger(name: str = "shopcatch") -> logging.Logger:
     """로거 설정 및 반환"""
     logger = logging.getLogger(name)
@@ -61,14 +170,9 @@ def setup_logger(name: str = "shopcatch") -> logging.Logger:
     if logger.handlers:
         return logger
     
-    # 콘솔 핸들러
-    handler = logging.StreamHandler(sys.stdout)
-    
-    # 포맷 선택
-    if settings.LOG_FORMAT == "json":
-        handler.setFormatter(StructuredFormatter())
-    else:
-        handler.setFormatter(TextFormatter())
+    handler = create_handler()
+    if isinstance(handler, DroppingQueueHandler):
+        registry.add_collector(lambda: {"log": handler.stats()})
     
     logger.addHandler(handler)
     logger.propagate = False
@@ -80,14 +184,20 @@ def setup_logger(name: str = "shopcatch") -> logging.Logger:
 logger = setup_logger()
 
 
-def log_tool_execution(tool_name: str, params: Dict[str, Any], success: bool, duration: float):
-    """툴 실행 로그 (성능 모니터링용)"""
-    logger.info(
-        f"Tool executed: {tool_name}",
-        extra={
-            "tool": tool_name,
-            "params": params,
-            "success": success,
-            "duration_ms": round(duration * 1000, 2)
-        }
-    )
+def log_tool_execution(
+    tool_name: str,
+    params: Dict[str, Any],
+    success: bool,
+    duration: float,
+    phases: Optional[Dict[str, float]] = None
+):
+    """툴 실행 로그 (성능 모니터링용, phases: 단계별 소요 시간 ms)"""
+    extra = {
+        "tool": tool_name,
+        "params": params,
+        "success": success,
+        "duration_ms": round(duration * 1000, 2)
+    }
+    if phases:
+        extra["phases_ms"] = phases
+    logger.info("Tool executed: %s", tool_name, extra=extra)
@@ -0,0 +1,265 @@
+"""
+Prometheus 형식 메트릭
+카운터/게이지/히스토그램 + /metrics 텍스트 출력
+
+핫 패스 비용 최소화:
+- 단일 이벤트 루프에서 갱신하므로 락 없이 정수/실수 덧셈만 수행
+- 라벨 조합별 자식 객체는 최초 1회만 생성하고 이후 재사용
+- 히스토그램은 버킷별 개수만 저장하고 누적값은 출력 시점에 계산
+"""
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# 지연 시간 기본 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 응답 크기 버킷 (바이트)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        if not self.labelnames:
+            self._default = self._children[()] = self._new_child()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """라벨 값 조합에 해당하는 자식 반환 (최초 호출 시에만 생성)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 라벨 {self.labelnames} 값이 필요합니다")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in self._children.items():
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _render_child(self, values: Tuple[str, ...], child) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default.dec(amount)
+
+    def set(self, value: float) -> None:
+        self._default.set(value)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+    def _render_child(self, values: Tuple[str, ...], child: _HistogramChild) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), child.counts):
+            cumulative += count
+            labels = _format_labels(self.labelnames, values, f'le="{_format_value(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class Registry:
+    """메트릭 모음 + 수집 시점에 값을 계산하는 콜렉터"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Dict[str, Any]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Dict[str, Any]]) -> None:
+        """
+        스크레이프 시점 상태 수집기 등록
+
+        콜렉터가 반환한 중첩 딕셔너리의 숫자 값은 shopcatch_<경로> 게이지로 출력됩니다.
+        ("key" 필드를 가진 딕셔너리 목록은 key 라벨을 붙여 출력)
+        """
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            try:
+                _flatten_stats("shopcatch", collector(), lines)
+            except Exception as e:  # 모니터링 실패가 서비스에 영향을 주지 않도록
+                lines.append(f"# collector error: {type(e).__name__}")
+        return "\n".join(lines) + "\n"
+
+
+def _flatten_stats(prefix: str, value: Any, lines: List[str], label: Optional[str] = None) -> None:
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, (int, float)):
+        labels = f'{{key="{label}"}}' if label else ""
+        lines.append(f"{prefix}{labels} {_format_value(value)}")
+    elif isinstance(value, dict):
+        for key, child in value.items():
+            _flatten_stats(f"{prefix}_{key}", child, lines, label)
+    elif isinstance(value, list):
+        for child in value:
+            if isinstance(child, dict) and "key" in child:
+                _flatten_stats(prefix, {k: v for k, v in child.items() if k != "key"}, lines, child["key"])
+
+
+# 전역 레지스트리
+registry = Registry()
+
+TOOL_DURATION = registry.histogram(
+    "shopcatch_tool_duration_seconds", "MCP 툴 실행 시간", ("tool", "status")
+)
+TOOL_ERRORS = registry.counter(
+    "shopcatch_tool_errors_total", "MCP 툴 실패 수 (예외 클래스별)", ("tool", "exception")
+)
+TOOLS_IN_FLIGHT = registry.gauge(
+    "shopcatch_tools_in_flight", "실행 중인 MCP 툴 수", ("tool",)
+)
+TOOL_PHASE_DURATION = registry.histogram(
+    "shopcatch_tool_phase_seconds", "MCP 툴 실행 단계별 소요 시간 (호출당 단계별 합계)", ("tool", "phase")
+)
+ADMISSION_WAIT = registry.histogram(
+    "shopcatch_admission_wait_seconds", "툴 호출 대기열 대기 시간"
+)
+UPSTREAM_LATENCY = registry.histogram(
+    "shopcatch_upstream_latency_seconds", "네이버 API 응답 시간", ("status_code",)
+)
+UPSTREAM_RESPONSE_BYTES = registry.histogram(
+    "shopcatch_upstream_response_bytes", "네이버 API 응답 크기", buckets=SIZE_BUCKETS
+)
+UPSTREAM_ERRORS = registry.counter(
+    "shopcatch_upstream_errors_total", "네이버 API 호출 실패 수 (예외 클래스별)", ("exception",)
+)
+UPSTREAM_HEDGES = registry.counter(
+    "shopcatch_upstream_hedges_total", "hedge 요청 수 (sent / won / skipped)", ("result",)
+)
+UPSTREAM_IN_FLIGHT = registry.gauge(
+    "shopcatch_upstream_in_flight", "진행 중인 네이버 API 요청 수"
+)
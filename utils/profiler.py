@@ -0,0 +1,110 @@
+"""
+통계적 샘플링 프로파일러 (요청 시 N초 동안만 실행)
+일정 간격으로 모든 스레드의 호출 스택(sys._current_frames)을 샘플링해
+flamegraph.pl / speedscope / inferno에서 바로 열 수 있는 collapsed stack 형식으로 반환
+
+- 계측 코드를 넣지 않으므로 꺼져 있을 때 비용 없음, 켜져 있는 동안에도 샘플링 스레드만 동작
+- 이벤트 루프가 유휴 상태면 selector 대기(select / epoll.poll) 스택으로 표시됨
+- 프로세스당 동시에 1개만 실행 (ProfilerBusyError)
+"""
+import os
+import sys
+import threading
+import time
+from typing import Dict, List
+
+from utils.exceptions import ProfilerBusyError
+
+
+# 스택 최대 깊이 (재귀 등으로 깊어지면 바깥쪽 프레임 생략)
+MAX_DEPTH = 128
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_STDLIB_ROOT = os.path.dirname(os.__file__)
+
+
+def _frame_label(code) -> str:
+    """함수 이름 (경로:정의 줄) (프로젝트 / 표준 라이브러리 파일은 상대 경로, 패키지는 site-packages 이후 경로)"""
+    filename = code.co_filename
+    if "site-packages" in filename:
+        filename = filename.split("site-packages" + os.sep, 1)[-1]
+    elif filename.startswith(_PROJECT_ROOT):
+        filename = filename[len(_PROJECT_ROOT) + 1:]
+    elif filename.startswith(_STDLIB_ROOT):
+        filename = filename[len(_STDLIB_ROOT) + 1:]
+    # collapsed 형식 구분자(;)가 이름에 들어가지 않도록 치환 (샘플 수는 마지막 공백 뒤라 공백은 허용)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+class SamplingProfiler:
+    """
+    주기적 스택 샘플링
+
+    Args:
+        interval: 샘플링 간격 (초)
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples = 0
+        self.stacks: Dict[str, int] = {}
+        self._labels: Dict[object, str] = {}
+
+    def run(self, seconds: float) -> Dict[str, int]:
+        """seconds 동안 샘플링 (호출한 스레드에서 실행, 자신은 제외) → {collapsed stack: 샘플 수}"""
+        own = threading.get_ident()
+        deadline = time.perf_counter() + seconds
+        next_at = time.perf_counter()
+        while next_at < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self._record(names.get(ident, f"thread-{ident}"), frame)
+            self.samples += 1
+            # 샘플링 비용만큼 늦어져도 간격 유지 (밀린 샘플은 건너뜀)
+            next_at += self.interval
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_at = time.perf_counter()
+        return self.stacks
+
+    def _record(self, thread_name: str, frame) -> None:
+        labels = self._labels
+        path: List[str] = []
+        while frame is not None and len(path) < MAX_DEPTH:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = _frame_label(code)
+            path.append(label)
+            frame = frame.f_back
+        path.append(thread_name.replace(";", ":"))
+        key = ";".join(reversed(path))
+        self.stacks[key] = self.stacks.get(key, 0) + 1
+
+    def collapsed(self) -> str:
+        """collapsed stack 텍스트 (한 줄에 "frame;frame;... 샘플 수", 샘플 많은 순)"""
+        lines = [f"{stack} {count}" for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1])]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+
+_lock = threading.Lock()
+
+
+def profile(seconds: float, interval: float) -> SamplingProfiler:
+    """
+    프로세스 프로파일링 (블로킹, asyncio.to_thread로 호출)
+
+    Raises:
+        ProfilerBusyError: 다른 프로파일링이 진행 중
+    """
+    if not _lock.acquire(blocking=False):
+        raise ProfilerBusyError("이미 프로파일링이 진행 중입니다.", details={"error": "profiler_busy"})
+    try:
+        profiler = SamplingProfiler(interval)
+        profiler.run(seconds)
+        return profiler
+    finally:
+        _lock.release()
@@ -0,0 +1,259 @@
+"""
+툴 호출 구간 추적 (tracing)
+툴 호출 1회를 trace로, 그 안의 단계(대기열, 검증, 키 대기, 연결 획득, 업스트림 응답, 디코딩, 포맷팅 등)를
+span으로 기록해 느린 호출의 시간이 어디에 쓰였는지 확인
+
+- 현재 trace는 contextvar로 전달 (create_task / to_thread로 만든 작업에도 이어짐)
+- single-flight 공유 요청의 span은 요청을 처음 보낸 호출의 trace에 기록되고,
+  합류한 호출에는 대기 구간(fetch)만 남음
+- 호출이 끝나면 단계별 합계를 메트릭(shopcatch_tool_phase_seconds)과 실행 로그에 남기고,
+  가장 느린 N개 / 최근 M개 호출의 상세 구간을 메모리에 보관 (/admin/traces)
+
+핫 패스 비용 최소화:
+- trace가 없으면 span()은 공용 빈 객체를 반환 (contextvar 조회 1회)
+- span은 perf_counter 2회 + 리스트 추가만 수행, 호출당 span 수는 MAX_SPANS로 제한
+"""
+import heapq
+import itertools
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config import settings
+from utils.metrics import TOOL_PHASE_DURATION
+
+
+# 호출 1회에 보관할 최대 span 수 (대량 탐색 툴의 페이지별 span 등, 초과분은 단계별 합계에만 반영)
+MAX_SPANS = 64
+
+# 현재 툴 호출의 trace (None이면 기록하지 않음)
+_current: ContextVar[Optional["Trace"]] = ContextVar("shopcatch_trace", default=None)
+
+
+class Trace:
+    """툴 호출 1회의 구간 기록"""
+
+    __slots__ = (
+        "tool", "params", "started", "timestamp", "duration", "success", "error", "phases", "spans", "dropped"
+    )
+
+    def __init__(self, tool: str, params: Dict[str, Any]):
+        self.tool = tool
+        self.params = params
+        self.started = time.perf_counter()
+        self.timestamp = time.time()
+        self.duration: Optional[float] = None
+        self.success = False
+        self.error: Optional[str] = None
+        self.phases: Dict[str, List[float]] = {}  # 단계 이름 → [누적 시간(초), 횟수]
+        self.spans: List[Tuple[str, float, float]] = []  # (단계 이름, 시작 오프셋(초), 소요 시간(초))
+        self.dropped = 0
+
+    def add(self, name: str, started: float, ended: float) -> None:
+        """구간 기록 (호출이 끝난 뒤 도착한 공유 요청의 구간은 무시)"""
+        if self.duration is not None:
+            return
+        elapsed = ended - started
+        phase = self.phases.get(name)
+        if phase is None:
+            self.phases[name] = [elapsed, 1]
+        else:
+            phase[0] += elapsed
+            phase[1] += 1
+        if len(self.spans) < MAX_SPANS:
+            self.spans.append((name, started - self.started, elapsed))
+        else:
+            self.dropped += 1
+
+    def phase_ms(self) -> Dict[str, float]:
+        """단계별 누적 시간 (ms)"""
+        return {name: round(total * 1000, 3) for name, (total, _) in self.phases.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tool": self.tool,
+            "params": self.params,
+            "timestamp": round(self.timestamp, 3),
+            "duration_ms": round((self.duration or 0.0) * 1000, 3),
+            "success": self.success,
+            "error": self.error,
+            "phases": {
+                name: {"ms": round(total * 1000, 3), "count": count}
+                for name, (total, count) in self.phases.items()
+            },
+            "spans": [
+                {"name": name, "offset_ms": round(offset * 1000, 3), "ms": round(elapsed * 1000, 3)}
+                for name, offset, elapsed in self.spans
+            ],
+            "dropped_spans": self.dropped,
+        }
+
+
+class _Span:
+    __slots__ = ("trace", "name", "started")
+
+    def __init__(self, trace: Trace, name: str):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self) -> "_Span":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self.trace.add(self.name, self.started, time.perf_counter())
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str):
+    """
+    현재 trace에 구간 기록
+
+    Usage:
+        with span("format"):
+            result = format_shopping_results(items, keyword)
+    """
+    trace = _current.get()
+    if trace is None:
+        return _NOOP_SPAN
+    return _Span(trace, name)
+
+
+@contextmanager
+def untraced() -> Iterator[None]:
+    """trace 해제 (호출자와 무관하게 실행되는 백그라운드 작업용)"""
+    token = _current.set(None)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+class _HttpPhases:
+    """
+    httpx 요청 단계 기록 (extensions={"trace": ...} 콜백)
+
+    - connect: 요청 시작 → 요청 헤더 전송 시작 (연결 풀 대기 + 새 연결이면 TCP/TLS 연결)
+    - upstream: 요청 전송 → 응답 헤더 수신 (업스트림 처리 시간)
+    - download: 응답 본문 수신
+    """
+
+    __slots__ = ("trace", "mark")
+
+    def __init__(self, trace: Trace):
+        self.trace = trace
+        self.mark = time.perf_counter()
+
+    async def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        if event.endswith("send_request_headers.started"):
+            phase = "connect"
+        elif event.endswith("receive_response_headers.complete"):
+            phase = "upstream"
+        elif event.endswith("receive_response_body.started"):
+            self.mark = time.perf_counter()
+            return
+        elif event.endswith("receive_response_body.complete"):
+            phase = "download"
+        else:
+            return
+        now = time.perf_counter()
+        self.trace.add(phase, self.mark, now)
+        self.mark = now
+
+
+def http_extensions() -> Optional[Dict[str, Any]]:
+    """현재 trace가 있으면 httpx 요청 단계 기록용 extensions (없으면 None)"""
+    trace = _current.get()
+    if trace is None:
+        return None
+    return {"trace": _HttpPhases(trace)}
+
+
+class Tracer:
+    """
+    끝난 trace 보관 (가장 느린 N개 + 최근 M개 링 버퍼)
+
+    Args:
+        slowest: 보관할 가장 느린 호출 수
+        recent: 보관할 최근 호출 수
+    """
+
+    def __init__(self, slowest: int, recent: int):
+        self.slowest_size = max(slowest, 1)
+        self._slowest: List[Tuple[float, int, Trace]] = []  # 소요 시간 기준 min-heap
+        self._recent: deque = deque(maxlen=max(recent, 1))
+        self._sequence = itertools.count()
+        self.finished = 0
+
+    def begin(self, tool: str, params: Dict[str, Any]) -> Tuple[Trace, Token]:
+        """trace 시작 (반환된 token은 같은 컨텍스트에서 end()에 전달)"""
+        trace = Trace(tool, params)
+        return trace, _current.set(trace)
+
+    def end(
+        self,
+        trace: Trace,
+        token: Token,
+        success: bool,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """trace 종료 → 단계별 메트릭 기록 + 보관"""
+        _current.reset(token)
+        trace.duration = time.perf_counter() - trace.started
+        trace.success = success
+        trace.error = type(error).__name__ if error is not None else None
+        for name, (total, _) in trace.phases.items():
+            TOOL_PHASE_DURATION.labels(trace.tool, name).observe(total)
+
+        self.finished += 1
+        self._recent.append(trace)
+        entry = (trace.duration, next(self._sequence), trace)
+        if len(self._slowest) < self.slowest_size:
+            heapq.heappush(self._slowest, entry)
+        elif entry[0] > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self, tool: Optional[str] = None) -> List[Dict[str, Any]]:
+        """가장 느린 호출 (느린 순)"""
+        entries = sorted(self._slowest, reverse=True)
+        return [trace.to_dict() for _, _, trace in entries if tool is None or trace.tool == tool]
+
+    def recent(self, tool: Optional[str] = None) -> List[Dict[str, Any]]:
+        """최근 호출 (최신 순)"""
+        return [trace.to_dict() for trace in reversed(self._recent) if tool is None or trace.tool == tool]
+
+    def reset(self) -> None:
+        self._slowest.clear()
+        self._recent.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "finished": self.finished,
+            "slowest_ms": round(max(self._slowest)[0] * 1000, 3) if self._slowest else 0.0,
+        }
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """추적 보관소 싱글톤 (비활성화 시 None)"""
+    global _tracer
+    if _tracer is None and settings.TRACING_ENABLED:
+        _tracer = Tracer(settings.TRACE_SLOWEST, settings.TRACE_RECENT)
+    return _tracer